@@ -6,7 +6,7 @@ This is a demonstration of how app.py would look with the new modular architectu
 import os
 import logging
 from datetime import datetime, timezone
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from flask import Flask, jsonify, send_file, render_template, request
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
@@ -42,6 +42,7 @@ from pixelprobe.services import ScanService, StatsService, ExportService, Mainte
 
 # Import repositories
 from pixelprobe.repositories import ScanRepository, ConfigurationRepository
+from pixelprobe.utils.helpers import ORJSONProvider
 
 # Load environment variables
 load_dotenv()
@@ -56,14 +57,16 @@ logger = logging.getLogger(__name__)
 # Get timezone
 APP_TIMEZONE = os.environ.get('TZ', 'UTC')
 try:
-    tz = pytz.timezone(APP_TIMEZONE)
+    tz = ZoneInfo(APP_TIMEZONE)
     logger.info(f"Using timezone: {APP_TIMEZONE}")
-except pytz.exceptions.UnknownTimeZoneError:
-    tz = pytz.UTC
+except (ZoneInfoNotFoundError, ValueError):
+    tz = ZoneInfo('UTC')
     logger.warning(f"Unknown timezone '{APP_TIMEZONE}', falling back to UTC")
 
 # Create Flask app
 app = Flask(__name__)
+# Serialize jsonify() responses and parse request bodies with orjson
+app.json = ORJSONProvider(app)
 
 # Configure app
 # Require SECRET_KEY in production - no insecure fallback
@@ -113,6 +116,9 @@ limiter = Limiter(
     app=app,
     key_func=get_rate_limit_key,
     default_limits=[],  # Remove default limits to prevent spam when key_func returns None
+    # Counters live in-process: no network round-trip per limited request. Limits are
+    # per worker, which is fine for the low-volume admin/scan endpoints they guard
+    # (attached to those views by register_rate_limits when the blueprints are registered).
     storage_uri="memory://",
     headers_enabled=True,
     swallow_errors=True  # Don't fail requests if rate limiting has issues
@@ -287,7 +293,6 @@ def create_tables():
                     logger.info("Tables already exist (created by another worker)")
                     
             migrate_database()
-            cleanup_stuck_operations()
             
         except Exception as e:
             logger.error(f"Error in database initialization: {str(e)}")
@@ -296,13 +301,19 @@ def create_tables():
 
 def migrate_database():
     """Run database migrations"""
-    from sqlalchemy import text
+    from sqlalchemy import inspect, text
     from app_startup_migration import run_startup_migrations
     
     try:
         # Run startup migrations for v2.0.89
         run_startup_migrations(db)
         
+        # Before the indexes: the one-active-job unique indexes cannot be created while rows left active remain
+        cleanup_stuck_operations()
+        
+        # Let readers keep working while scans, cleanup or VACUUM write
+        enable_sqlite_wal()
+        
         # Create performance indexes
         create_performance_indexes()
         
@@ -342,7 +353,29 @@ def migrate_database():
                     logger.info(f"Adding {column_name} column to scan_configurations table")
                     conn.execute(text(sql))
                     conn.commit()
-            
+
+            # Adding path with ALTER TABLE leaves it without the UNIQUE constraint that
+            # add_configuration's ON CONFLICT (path) upsert needs
+            inspector = inspect(conn)
+            unique_columns = [c['column_names'] for c in inspector.get_unique_constraints('scan_configurations')]
+            unique_columns += [i['column_names'] for i in inspector.get_indexes('scan_configurations') if i['unique']]
+            if ['path'] not in unique_columns:
+                logger.info("Adding unique index on scan_configurations.path")
+                # Keep the oldest row per path, active if any duplicate was
+                conn.execute(text(
+                    "UPDATE scan_configurations SET is_active = 1 WHERE id IN ("
+                    "SELECT MIN(id) FROM scan_configurations WHERE path IS NOT NULL "
+                    "GROUP BY path HAVING MAX(is_active) = 1)"
+                ))
+                conn.execute(text(
+                    "DELETE FROM scan_configurations WHERE path IS NOT NULL AND id NOT IN ("
+                    "SELECT MIN(id) FROM scan_configurations WHERE path IS NOT NULL GROUP BY path)"
+                ))
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_scan_configurations_path ON scan_configurations(path)"
+                ))
+                conn.commit()
+
             # Migrate ignored_error_patterns table
             result = conn.execute(text("PRAGMA table_info(ignored_error_patterns)"))
             columns = [row[1] for row in result]
@@ -387,6 +420,20 @@ def migrate_database():
     except Exception as e:
         logger.error(f"Error during database migration: {e}")
 
+def enable_sqlite_wal():
+    """Switch SQLite to write-ahead logging; the mode is stored in the database file"""
+    from sqlalchemy import text
+    
+    if db.engine.dialect.name != 'sqlite':
+        return
+    
+    try:
+        with db.engine.connect() as conn:
+            journal_mode = conn.execute(text("PRAGMA journal_mode=WAL")).scalar()
+        logger.info(f"SQLite journal mode: {journal_mode}")
+    except Exception as e:
+        logger.warning(f"Could not enable WAL journal mode: {e}")
+
 def create_performance_indexes():
     """Create performance indexes"""
     from sqlalchemy import text
@@ -401,17 +448,44 @@ def create_performance_indexes():
         "CREATE INDEX IF NOT EXISTS idx_last_modified ON scan_results(last_modified)",
         "CREATE INDEX IF NOT EXISTS idx_file_path ON scan_results(file_path)",
         "CREATE INDEX IF NOT EXISTS idx_status_date ON scan_results(scan_status, scan_date)",
-        "CREATE INDEX IF NOT EXISTS idx_corrupted_good ON scan_results(is_corrupted, marked_as_good)"
+        "CREATE INDEX IF NOT EXISTS idx_corrupted_good ON scan_results(is_corrupted, marked_as_good)",
+        "CREATE INDEX IF NOT EXISTS idx_export_filter ON scan_results(is_corrupted, has_warnings, marked_as_good)",
+        "CREATE INDEX IF NOT EXISTS idx_schedule_name_active ON scan_schedules(name, is_active)",
+        "CREATE INDEX IF NOT EXISTS idx_exclusion_active_type ON exclusions(is_active, exclusion_type)",
+        "CREATE INDEX IF NOT EXISTS idx_cleanup_state_active ON cleanup_state(is_active, id)",
+        "CREATE INDEX IF NOT EXISTS idx_file_changes_state_active ON file_changes_state(is_active, id)",
+        "CREATE INDEX IF NOT EXISTS idx_scan_reports_start_time ON scan_reports(start_time, id)",
+        "CREATE INDEX IF NOT EXISTS idx_scan_reports_filter ON scan_reports(scan_type, status, start_time, id)"
+    ]
+    
+    # Trigram index so file_path substring searches (LIKE '%...%') can use an index on PostgreSQL;
+    # CREATE EXTENSION needs privileges many roles lack, so the index is skipped when it fails
+    if db.engine.dialect.name == 'postgresql':
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            indexes.append(
+                "CREATE INDEX IF NOT EXISTS idx_file_path_trgm ON scan_results USING gin (file_path gin_trgm_ops)"
+            )
+        except Exception as e:
+            logger.warning(f"pg_trgm extension unavailable, skipping file path trigram index: {e}")
+    
+    # One active job per kind, enforced by the database so concurrent claims from different workers
+    # cannot both insert (see _claim_job); migrate_database clears rows left active by a crash first
+    indexes += [
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_cleanup_state_one_active ON cleanup_state(is_active) WHERE is_active",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_file_changes_state_one_active ON file_changes_state(is_active) WHERE is_active"
     ]
     
     logger.info("Creating performance indexes...")
-    with db.engine.connect() as conn:
-        for index in indexes:
-            try:
+    for index in indexes:
+        # Own transaction per statement: on PostgreSQL a failed statement aborts its transaction,
+        # which would otherwise roll back every index created alongside it
+        try:
+            with db.engine.begin() as conn:
                 conn.execute(text(index))
-            except Exception as e:
-                logger.warning(f"Could not create index: {e}")
-        conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not create index: {e}")
     
     logger.info("Performance indexes created successfully")
 
@@ -4,6 +4,7 @@ import magic
 import logging
 import hashlib
 import json
+import orjson
 import time
 from datetime import datetime
 from pathlib import Path
@@ -17,15 +18,37 @@ from pixelprobe.utils.security import safe_subprocess_run, validate_file_path
 
 logger = logging.getLogger(__name__)
 
+EXCLUSIONS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'exclusions.json')
+
+# Parsed exclusions.json keyed on the file's mtime so repeated scans skip the re-parse
+_excl_cache = {'mtime': None, 'data': None}
+_excl_cache_lock = threading.Lock()
+
 def load_exclusions():
     """Load exclusion patterns from exclusions.json file"""
     try:
-        exclusions_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'exclusions.json')
-        if os.path.exists(exclusions_file):
-            with open(exclusions_file, 'r') as f:
-                data = json.load(f)
-                return data.get('paths', []), data.get('extensions', [])
-        return [], []
+        try:
+            mtime = os.stat(EXCLUSIONS_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return [], []
+
+        with _excl_cache_lock:
+            if _excl_cache['mtime'] != mtime:
+                try:
+                    with open(EXCLUSIONS_FILE, 'rb') as f:
+                        data = orjson.loads(f.read())
+                except (OSError, orjson.JSONDecodeError) as e:
+                    if _excl_cache['data'] is None:
+                        raise
+                    # File is mid-write or corrupt - keep the last good copy and retry on the next call
+                    logger.warning(f"Could not parse exclusions.json, using previous exclusions: {e}")
+                else:
+                    _excl_cache['data'] = (data.get('paths', []), data.get('extensions', []))
+                    _excl_cache['mtime'] = mtime
+            paths, extensions = _excl_cache['data']
+
+        # Hand out copies so callers can't mutate the cached lists
+        return list(paths), list(extensions)
     except Exception as e:
         logger.error(f"Error loading exclusions.json: {e}")
         return [], []
@@ -125,8 +148,9 @@ class PixelProbe:
         self.scan_lock = threading.Lock()
         self.current_scan_file = None
         self.scan_start_time = None
-        self.excluded_paths = excluded_paths or []
-        self.excluded_extensions = excluded_extensions or []
+        # Tuple lets str.startswith test every prefix in one call; set gives O(1) extension lookups
+        self.excluded_paths = tuple(excluded_paths or ())
+        self.excluded_extensions = set(excluded_extensions or ())
         self.database_path = database_path
     
     def discover_media_files(self, directories, max_files=None, existing_files=None, progress_callback=None):
@@ -295,7 +319,7 @@ class PixelProbe:
                         
                         if entry.is_dir(follow_symlinks=False):
                             # Skip excluded directories
-                            if not any(full_path.startswith(exc) for exc in self.excluded_paths):
+                            if not full_path.startswith(self.excluded_paths):
                                 # Recursively scan subdirectory
                                 scan_directory(full_path)
                         elif entry.is_file(follow_symlinks=False):
@@ -329,9 +353,8 @@ class PixelProbe:
             return False
             
         # Check if path is excluded
-        for excluded_path in self.excluded_paths:
-            if file_path.startswith(excluded_path):
-                return False
+        if file_path.startswith(self.excluded_paths):
+            return False
                 
         return extension in self.supported_formats
     
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from flask_sqlalchemy import SQLAlchemy
 import json
+import orjson
 import uuid
 import logging
 
@@ -134,7 +135,7 @@ class ScanSchedule(db.Model):
             'id': self.id,
             'name': self.name,
             'cron_expression': self.cron_expression,
-            'scan_paths': json.loads(self.scan_paths) if self.scan_paths else [],
+            'scan_paths': orjson.loads(self.scan_paths) if self.scan_paths else [],
             'scan_type': self.scan_type,
             'force_rescan': self.force_rescan,
             'is_active': self.is_active,
@@ -335,6 +336,12 @@ class CleanupState(db.Model):
     error_message = db.Column(db.String(500), nullable=True)
     cancel_requested = db.Column(db.Boolean, nullable=True, default=False)
     
+    # At most one active row: concurrent job claims from different workers cannot both succeed
+    __table_args__ = (
+        db.Index('idx_cleanup_state_one_active', 'is_active', unique=True,
+                 sqlite_where=db.text('is_active'), postgresql_where=db.text('is_active')),
+    )
+    
     def to_dict(self):
         # Import here to avoid circular imports
         from utils import create_state_dict
@@ -362,12 +369,18 @@ class FileChangesState(db.Model):
     changed_files = db.Column(db.Text, nullable=True)  # JSON list of changed files
     cancel_requested = db.Column(db.Boolean, nullable=True, default=False)
     
+    # At most one active row: concurrent job claims from different workers cannot both succeed
+    __table_args__ = (
+        db.Index('idx_file_changes_state_one_active', 'is_active', unique=True,
+                 sqlite_where=db.text('is_active'), postgresql_where=db.text('is_active')),
+    )
+    
     def to_dict(self):
         # Import here to avoid circular imports
         from utils import create_state_dict
         result = create_state_dict(self, extra_fields=['changes_found', 'corrupted_found'])
         # Handle special case for changed_files JSON field
-        result['changed_files'] = json.loads(self.changed_files) if self.changed_files else []
+        result['changed_files'] = orjson.loads(self.changed_files) if self.changed_files else []
         return result
 
 class ScanReport(db.Model):
@@ -418,7 +431,7 @@ class ScanReport(db.Model):
             'start_time': self.start_time.isoformat() if self.start_time else None,
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'duration_seconds': self.duration_seconds,
-            'directories_scanned': json.loads(self.directories_scanned) if self.directories_scanned else [],
+            'directories_scanned': orjson.loads(self.directories_scanned) if self.directories_scanned else [],
             'force_rescan': self.force_rescan,
             'num_workers': self.num_workers,
             'total_files_discovered': self.total_files_discovered,
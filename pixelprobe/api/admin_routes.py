@@ -1,56 +1,124 @@
-from flask import Blueprint, request, jsonify
-import os
+from flask import Blueprint, request, jsonify, current_app
+import re
 import json
 import logging
+import threading
+import time
+import uuid
 from datetime import datetime, timezone
-import pytz
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 
 from models import db, ScanResult, IgnoredErrorPattern, ScanConfiguration, ScanSchedule
 from scheduler import MediaScheduler
 from pixelprobe.utils.security import validate_json_input, AuditLogger, validate_directory_path
+from pixelprobe.utils.helpers import ojsonify
+from pixelprobe.utils.rate_limiting import rate_limit, register_rate_limits
 
 logger = logging.getLogger(__name__)
 
-# Get timezone from environment variable, default to UTC
-APP_TIMEZONE = os.environ.get('TZ', 'UTC')
-try:
-    tz = pytz.timezone(APP_TIMEZONE)
-except pytz.exceptions.UnknownTimeZoneError:
-    tz = pytz.UTC
-    logger.warning(f"Unknown timezone '{APP_TIMEZONE}', falling back to UTC")
-
 admin_bp = Blueprint('admin', __name__, url_prefix='/api')
 
-# Import limiter from main app
-from flask import current_app
-from functools import wraps
-
-# Create rate limit decorators that work with Flask-Limiter
-def rate_limit(limit_string):
-    """Decorator to apply rate limits using the app's limiter"""
-    def decorator(f):
-        @wraps(f)
-        def wrapped(*args, **kwargs):
-            # Get the limiter from the current app
-            limiter = current_app.extensions.get('flask-limiter')
-            if limiter:
-                # Apply the rate limit dynamically
-                limited_func = limiter.limit(limit_string, exempt_when=lambda: False)(f)
-                return limited_func(*args, **kwargs)
-            else:
-                # If no limiter, just call the function
-                return f(*args, **kwargs)
-        return wrapped
-    return decorator
+# Inline flags, named groups and comments are rejected in ignored error patterns
+_DANGEROUS_RE = re.compile(r'\(\?[imsxXU]|\(\?P<|\(\?#')
 
 # Get scheduler instance (will be initialized in app context)
 scheduler = None
 
+# Listing payloads are cached per worker; writes in this module invalidate them.
+# Writes made through other gunicorn workers or directly in the database are not
+# seen until the TTL expires, so keep it short
+_CONFIG_CACHE_TTL = 5
+
+# Pending scheduler reload; rapid schedule edits share one rebuild
+_SCHEDULER_DEBOUNCE_SECONDS = 0.2
+# A steady stream of edits cannot postpone the reload past this
+_SCHEDULER_MAX_DELAY_SECONDS = 0.5
+_scheduler_update_timer = None
+_scheduler_update_deadline = None
+# Timer threads whose reload is in progress
+_scheduler_update_running = set()
+_scheduler_update_lock = threading.Lock()
+
 def set_scheduler(sched):
     """Set the scheduler instance"""
     global scheduler
     scheduler = sched
 
+def _dialect_insert(model):
+    """INSERT construct with ON CONFLICT support for the active database"""
+    if db.engine.dialect.name == 'postgresql':
+        return postgresql_insert(model)
+    return sqlite_insert(model)
+
+def _config_cache():
+    """Per-app cache of admin listing payloads: key -> (expires_at, data)"""
+    return current_app.extensions.setdefault('pixelprobe_config_cache', {})
+
+def _cached_listing(key, loader):
+    """Return the cached payload for key, calling loader once the entry has expired"""
+    cache = _config_cache()
+    now = time.monotonic()
+    entry = cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    data = loader()
+    cache[key] = (now + _CONFIG_CACHE_TTL, data)
+    return data
+
+def _invalidate_config_cache(key):
+    """Drop a cached listing after its table was written"""
+    _config_cache().pop(key, None)
+
+def _run_scheduler_update():
+    """Reload scheduler jobs once the debounce window has passed"""
+    global _scheduler_update_timer, _scheduler_update_deadline
+    current = threading.current_thread()
+    with _scheduler_update_lock:
+        # A later request may already have scheduled a newer reload; keep its timer and deadline
+        if _scheduler_update_timer is current:
+            _scheduler_update_timer = None
+            _scheduler_update_deadline = None
+        _scheduler_update_running.add(current)
+    try:
+        if scheduler:
+            scheduler.update_schedules()
+    except Exception as e:
+        logger.error(f"Error reloading schedules: {e}")
+    finally:
+        with _scheduler_update_lock:
+            _scheduler_update_running.discard(current)
+
+def cancel_scheduler_update():
+    """Drop a pending scheduler reload and wait for any reload already in progress"""
+    global _scheduler_update_timer, _scheduler_update_deadline
+    with _scheduler_update_lock:
+        pending = _scheduler_update_timer
+        _scheduler_update_timer = None
+        _scheduler_update_deadline = None
+        running = list(_scheduler_update_running)
+    if pending is not None:
+        pending.cancel()
+        running.append(pending)
+    for timer in running:
+        timer.join()
+
+def _debounced_scheduler_update():
+    """Schedule a scheduler reload, replacing any reload that is still pending"""
+    global _scheduler_update_timer, _scheduler_update_deadline
+    if not scheduler:
+        return
+    with _scheduler_update_lock:
+        now = time.monotonic()
+        if _scheduler_update_timer is not None:
+            _scheduler_update_timer.cancel()
+        else:
+            _scheduler_update_deadline = now + _SCHEDULER_MAX_DELAY_SECONDS
+        delay = max(0.0, min(_SCHEDULER_DEBOUNCE_SECONDS, _scheduler_update_deadline - now))
+        _scheduler_update_timer = threading.Timer(delay, _run_scheduler_update)
+        _scheduler_update_timer.daemon = True
+        _scheduler_update_timer.start()
+
 @admin_bp.route('/mark-as-good', methods=['POST'])
 @rate_limit("10 per minute")
 @validate_json_input({
@@ -58,28 +126,42 @@ def set_scheduler(sched):
 })
 def mark_as_good():
     """Mark files as good/healthy"""
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True) or {}
     file_ids = data.get('file_ids', [])
     
-    # Validate file IDs are integers
+    # Validate file IDs are integers and drop duplicates
     try:
-        file_ids = [int(fid) for fid in file_ids]
+        file_ids = sorted({int(fid) for fid in file_ids})
     except (ValueError, TypeError):
         return jsonify({'error': 'Invalid file ID format'}), 400
-    
+
+    if not file_ids:
+        return jsonify({'message': 'No files to mark as good', 'marked_files': 0})
+
     if len(file_ids) > 1000:  # Prevent excessive updates
         return jsonify({'error': 'Too many file IDs (max 1000)'}), 400
     
     try:
-        for file_id in file_ids:
-            result = ScanResult.query.get(file_id)
-            if result:
-                result.marked_as_good = True
-                result.is_corrupted = False
-                logger.info(f"Marked file as good (healthy): {result.file_path}")
-                AuditLogger.log_action('mark_as_good', {'file_id': file_id, 'file_path': result.file_path})
-            
+        # One SELECT for the audit trail, one UPDATE for all rows
+        rows = db.session.query(ScanResult.id, ScanResult.file_path).filter(
+            ScanResult.id.in_(file_ids)
+        ).all()
+        if rows:
+            db.session.query(ScanResult).filter(
+                ScanResult.id.in_([row.id for row in rows])
+            ).update({
+                ScanResult.marked_as_good: True,
+                ScanResult.is_corrupted: False
+            }, synchronize_session=False)
         db.session.commit()
+        
+        # One log record and one audit entry for the whole batch
+        if rows and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Marked files as good (healthy): " + ", ".join(row.file_path for row in rows))
+        AuditLogger.log_action('mark_as_good_bulk', {
+            'entries': [{'file_id': row.id, 'file_path': row.file_path} for row in rows],
+            'count': len(rows)
+        })
         logger.info(f"Successfully marked {len(file_ids)} files as good")
         
         return jsonify({
@@ -95,13 +177,15 @@ def mark_as_good():
 @admin_bp.route('/ignored-patterns')
 def get_ignored_patterns():
     """Get all ignored error patterns"""
-    patterns = IgnoredErrorPattern.query.filter_by(is_active=True).all()
-    return jsonify([{
-        'id': p.id,
-        'pattern': p.pattern,
-        'description': p.description,
-        'created_at': p.created_at.isoformat() if p.created_at else None
-    } for p in patterns])
+    def load():
+        rows = db.session.query(
+            IgnoredErrorPattern.id,
+            IgnoredErrorPattern.pattern,
+            IgnoredErrorPattern.description,
+            IgnoredErrorPattern.created_at
+        ).filter_by(is_active=True).all()
+        return [row._asdict() for row in rows]
+    return ojsonify(_cached_listing('ignored_patterns', load))
 
 @admin_bp.route('/ignored-patterns', methods=['POST'])
 @validate_json_input({
@@ -110,37 +194,47 @@ def get_ignored_patterns():
 })
 def add_ignored_pattern():
     """Add a new ignored error pattern"""
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True) or {}
     pattern = data.get('pattern')
     description = data.get('description', '')
     
     # Validate pattern doesn't contain dangerous regex
-    dangerous_patterns = [r'\(\?[imsxXU]', r'\(\?P<', r'\(\?#']
-    for dp in dangerous_patterns:
-        if dp in pattern:
-            return jsonify({'error': 'Pattern contains potentially dangerous regex syntax'}), 400
+    if _DANGEROUS_RE.search(pattern):
+        return jsonify({'error': 'Pattern contains potentially dangerous regex syntax'}), 400
     
+    # Reject patterns that will not compile, so matchers never see an invalid regex
     try:
-        # Check for duplicate pattern
-        existing = IgnoredErrorPattern.query.filter_by(pattern=pattern, is_active=True).first()
-        if existing:
-            return jsonify({'error': f'Pattern "{pattern}" already exists'}), 400
-        
-        new_pattern = IgnoredErrorPattern(
+        re.compile(pattern)
+    except re.error as e:
+        return jsonify({'error': f'Invalid regular expression: {e}'}), 400
+    
+    try:
+        # pattern is unique: insert, or revive a soft-deleted row; an active duplicate returns no id
+        now = datetime.now(timezone.utc)
+        stmt = _dialect_insert(IgnoredErrorPattern).values(
             pattern=pattern,
             description=description,
             is_active=True,
-            created_at=datetime.now(timezone.utc)
-        )
-        db.session.add(new_pattern)
+            created_at=now
+        ).on_conflict_do_update(
+            index_elements=[IgnoredErrorPattern.pattern],
+            set_={'is_active': True, 'description': description, 'created_at': now},
+            where=IgnoredErrorPattern.is_active == False
+        ).returning(IgnoredErrorPattern.id)
+        pattern_id = db.session.execute(stmt).scalar()
+        if pattern_id is None:
+            db.session.rollback()
+            return jsonify({'error': f'Pattern "{pattern}" already exists'}), 400
+        
         db.session.commit()
+        _invalidate_config_cache('ignored_patterns')
         
         AuditLogger.log_action('add_ignored_pattern', {'pattern': pattern})
         
         return jsonify({
-            'id': new_pattern.id,
-            'pattern': new_pattern.pattern,
-            'description': new_pattern.description,
+            'id': pattern_id,
+            'pattern': pattern,
+            'description': description,
             'message': 'Pattern added successfully'
         }), 201
     except Exception as e:
@@ -159,6 +253,7 @@ def delete_ignored_pattern(pattern_id):
         pattern_text = pattern.pattern
         pattern.is_active = False  # Soft delete
         db.session.commit()
+        _invalidate_config_cache('ignored_patterns')
         
         AuditLogger.log_action('delete_ignored_pattern', {'pattern_id': pattern_id, 'pattern': pattern_text})
         
@@ -171,13 +266,15 @@ def delete_ignored_pattern(pattern_id):
 @admin_bp.route('/configurations')
 def get_configurations():
     """Get all scan configurations"""
-    configs = ScanConfiguration.query.all()
-    return jsonify([{
-        'id': c.id,
-        'path': c.path,
-        'is_active': c.is_active,
-        'created_at': c.created_at.isoformat() if c.created_at else None
-    } for c in configs])
+    def load():
+        rows = db.session.query(
+            ScanConfiguration.id,
+            ScanConfiguration.path,
+            ScanConfiguration.is_active,
+            ScanConfiguration.created_at
+        ).all()
+        return [row._asdict() for row in rows]
+    return ojsonify(_cached_listing('configurations', load))
 
 @admin_bp.route('/configurations', methods=['POST'])
 @validate_json_input({
@@ -185,7 +282,7 @@ def get_configurations():
 })
 def add_configuration():
     """Add or update a scan configuration"""
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True) or {}
     path = data.get('path')
     
     # Validate and normalize path
@@ -197,28 +294,28 @@ def add_configuration():
         return jsonify({'error': 'Invalid directory path'}), 400
     
     try:
-        # Check if configuration already exists
-        existing_config = ScanConfiguration.query.filter_by(path=path).first()
-        
-        if existing_config:
-            # Reactivate if it was deactivated
-            existing_config.is_active = True
-            message = 'Configuration reactivated'
-        else:
-            # Create new configuration with backward compatibility
-            new_config = ScanConfiguration(
-                path=path,
-                is_active=True,
-                created_at=datetime.now(timezone.utc),
-                # Add legacy fields to satisfy old schema
-                key=f'scan_dir_{len(ScanConfiguration.query.all()) + 1}',
-                value=path,
-                description=f'Scan directory: {path}'
-            )
-            db.session.add(new_config)
-            message = 'Configuration added successfully'
+        # Single-statement upsert: insert, or reactivate the existing row for this path
+        # Random legacy key, so the insert never has to count existing rows
+        key = f'scan_dir_{uuid.uuid4().hex[:12]}'
+        stmt = _dialect_insert(ScanConfiguration).values(
+            path=path,
+            is_active=True,
+            created_at=datetime.now(timezone.utc),
+            # Add legacy fields to satisfy old schema
+            key=key,
+            value=path,
+            description=f'Scan directory: {path}'
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScanConfiguration.path],
+            set_={'is_active': True}
+        ).returning(ScanConfiguration.key)
+        stored_key = db.session.execute(stmt).scalar()
+        # The conflict branch keeps the row's original key
+        message = 'Configuration added successfully' if stored_key == key else 'Configuration reactivated'
         
         db.session.commit()
+        _invalidate_config_cache('configurations')
         
         return jsonify({
             'path': path,
@@ -232,18 +329,40 @@ def add_configuration():
 @admin_bp.route('/schedules', methods=['GET'])
 def get_schedules():
     """Get all scan schedules"""
-    schedules = ScanSchedule.query.filter_by(is_active=True).all()
-    return jsonify({'schedules': [schedule.to_dict() for schedule in schedules]})
+    # Column rows instead of ORM instances; same shape as ScanSchedule.to_dict()
+    rows = db.session.query(
+        ScanSchedule.id,
+        ScanSchedule.name,
+        ScanSchedule.cron_expression,
+        ScanSchedule.scan_paths,
+        ScanSchedule.scan_type,
+        ScanSchedule.force_rescan,
+        ScanSchedule.is_active,
+        ScanSchedule.last_run,
+        ScanSchedule.next_run,
+        ScanSchedule.created_at,
+        ScanSchedule.created_date
+    ).filter_by(is_active=True).all()
+    schedules = []
+    for row in rows:
+        schedule = row._asdict()
+        schedule['scan_paths'] = json.loads(row.scan_paths) if row.scan_paths else []
+        schedules.append(schedule)
+    return ojsonify({'schedules': schedules})
 
 @admin_bp.route('/schedules', methods=['POST'])
 def create_schedule():
     """Create a new scan schedule"""
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True)
+    if data is None:
+        return jsonify({'error': 'No JSON data provided'}), 400
     
     try:
         # Check for duplicate name
         name = data.get('name', 'Unnamed Schedule')
-        existing = ScanSchedule.query.filter_by(name=name, is_active=True).first()
+        existing = db.session.query(
+            ScanSchedule.query.filter_by(name=name, is_active=True).exists()
+        ).scalar()
         if existing:
             return jsonify({'error': f'Schedule with name "{name}" already exists'}), 400
         
@@ -260,8 +379,7 @@ def create_schedule():
         db.session.commit()
         
         # Update scheduler
-        if scheduler:
-            scheduler.update_schedules()
+        _debounced_scheduler_update()
         
         return jsonify(schedule.to_dict()), 201
     except Exception as e:
@@ -269,26 +387,35 @@ def create_schedule():
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+# Schedule columns that can be edited through update_schedule
+_SCHEDULE_FIELDS = ('name', 'cron_expression', 'scan_type', 'force_rescan', 'is_active')
+# Changes to these require the scheduler to rebuild its jobs
+_SCHEDULER_FIELDS = frozenset(('cron_expression', 'is_active'))
+
 @admin_bp.route('/schedules/<int:schedule_id>', methods=['PUT'])
 def update_schedule(schedule_id):
     """Update a scan schedule"""
     schedule = ScanSchedule.query.get_or_404(schedule_id)
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True)
+    if data is None:
+        return jsonify({'error': 'No JSON data provided'}), 400
     
     try:
-        schedule.name = data.get('name', schedule.name)
-        schedule.cron_expression = data.get('cron_expression', schedule.cron_expression)
+        # Only touch fields whose value actually changes
+        updates = {k: data[k] for k in _SCHEDULE_FIELDS if k in data}
         if 'scan_paths' in data:
-            schedule.scan_paths = json.dumps(data['scan_paths'])
-        schedule.scan_type = data.get('scan_type', schedule.scan_type)
-        schedule.force_rescan = data.get('force_rescan', schedule.force_rescan)
-        schedule.is_active = data.get('is_active', schedule.is_active)
+            updates['scan_paths'] = json.dumps(data['scan_paths'])
+        changes = {k: v for k, v in updates.items() if getattr(schedule, k) != v}
+        if not changes:
+            return jsonify(schedule.to_dict())
         
+        for field, value in changes.items():
+            setattr(schedule, field, value)
         db.session.commit()
         
-        # Update scheduler
-        if scheduler:
-            scheduler.update_schedules()
+        # Jobs are keyed on the cron expression and active flag; other fields are read at run time
+        if _SCHEDULER_FIELDS.intersection(changes):
+            _debounced_scheduler_update()
         
         return jsonify(schedule.to_dict())
     except Exception as e:
@@ -306,8 +433,7 @@ def delete_schedule(schedule_id):
         db.session.commit()
         
         # Update scheduler
-        if scheduler:
-            scheduler.update_schedules()
+        _debounced_scheduler_update()
         
         return '', 204
     except Exception as e:
@@ -321,21 +447,19 @@ def get_exclusions():
     try:
         from models import Exclusion
         
-        # Get all active exclusions
-        path_exclusions = Exclusion.query.filter_by(
-            exclusion_type='path', 
-            is_active=True
-        ).all()
-        
-        extension_exclusions = Exclusion.query.filter_by(
-            exclusion_type='extension', 
-            is_active=True
-        ).all()
+        def load():
+            # Get all active exclusions in one query and bucket by type
+            rows = db.session.query(Exclusion.exclusion_type, Exclusion.value).filter(
+                Exclusion.is_active == True,
+                Exclusion.exclusion_type.in_(('path', 'extension'))
+            ).all()
+            
+            return {
+                'paths': [value for kind, value in rows if kind == 'path'],
+                'extensions': [value for kind, value in rows if kind == 'extension']
+            }
         
-        return jsonify({
-            'paths': [e.value for e in path_exclusions],
-            'extensions': [e.value for e in extension_exclusions]
-        })
+        return ojsonify(_cached_listing('exclusions', load))
     except Exception as e:
         logger.error(f"Error reading exclusions: {e}")
         return jsonify({'paths': [], 'extensions': []})
@@ -343,7 +467,9 @@ def get_exclusions():
 @admin_bp.route('/exclusions', methods=['PUT'])
 def update_exclusions():
     """Update all exclusion settings in database"""
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True)
+    if data is None:
+        return jsonify({'error': 'No JSON data provided'}), 400
     
     try:
         from models import Exclusion
@@ -353,18 +479,25 @@ def update_exclusions():
             return jsonify({'error': 'Invalid data format'}), 400
         
         # Clear existing exclusions
-        Exclusion.query.update({'is_active': False})
-        
-        # Add new exclusions
-        for path in data.get('paths', []):
-            exclusion = Exclusion(exclusion_type='path', value=path, is_active=True)
-            db.session.add(exclusion)
+        Exclusion.query.filter(Exclusion.is_active == True).update(
+            {'is_active': False}, synchronize_session=False
+        )
         
-        for extension in data.get('extensions', []):
-            exclusion = Exclusion(exclusion_type='extension', value=extension, is_active=True)
-            db.session.add(exclusion)
+        # Add new exclusions in one executemany; previously stored values are reactivated.
+        # Repeated values are dropped: one batched upsert cannot touch the same row twice
+        rows = [{'exclusion_type': 'path', 'value': path, 'is_active': True}
+                for path in dict.fromkeys(data.get('paths', []))]
+        rows += [{'exclusion_type': 'extension', 'value': extension, 'is_active': True}
+                 for extension in dict.fromkeys(data.get('extensions', []))]
+        if rows:
+            stmt = _dialect_insert(Exclusion).on_conflict_do_update(
+                index_elements=[Exclusion.exclusion_type, Exclusion.value],
+                set_={'is_active': True}
+            )
+            db.session.execute(stmt, rows)
         
         db.session.commit()
+        _invalidate_config_cache('exclusions')
         return jsonify({'message': 'Exclusions updated successfully'})
     except Exception as e:
         logger.error(f"Error updating exclusions: {e}")
@@ -378,7 +511,9 @@ def add_exclusion(exclusion_type):
     if exclusion_type not in ['path', 'extension']:
         return jsonify({'error': 'Invalid exclusion type'}), 400
     
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True)
+    if data is None:
+        return jsonify({'error': 'No JSON data provided'}), 400
     value = data.get('item') or data.get('value')  # Support both 'item' and 'value'
     
     if not value:
@@ -387,24 +522,23 @@ def add_exclusion(exclusion_type):
     try:
         from models import Exclusion
         
-        # Check if already exists
-        existing = Exclusion.query.filter_by(
+        # (exclusion_type, value) is unique: insert, or reactivate a removed entry;
+        # an active duplicate returns no id
+        stmt = _dialect_insert(Exclusion).values(
             exclusion_type=exclusion_type,
             value=value,
             is_active=True
-        ).first()
-        
-        if existing:
+        ).on_conflict_do_update(
+            index_elements=[Exclusion.exclusion_type, Exclusion.value],
+            set_={'is_active': True},
+            where=Exclusion.is_active == False
+        ).returning(Exclusion.id)
+        if db.session.execute(stmt).scalar() is None:
+            db.session.rollback()
             return jsonify({'error': f'{exclusion_type.capitalize()} already exists'}), 400
         
-        # Add new exclusion
-        exclusion = Exclusion(
-            exclusion_type=exclusion_type,
-            value=value,
-            is_active=True
-        )
-        db.session.add(exclusion)
         db.session.commit()
+        _invalidate_config_cache('exclusions')
         
         AuditLogger.log_action('add_exclusion', {'type': exclusion_type, 'value': value})
         
@@ -422,7 +556,9 @@ def remove_exclusion(exclusion_type):
     if exclusion_type not in ['path', 'extension']:
         return jsonify({'error': 'Invalid exclusion type'}), 400
     
-    data = request.get_json()
+    data = request.get_json(cache=True, silent=True)
+    if data is None:
+        return jsonify({'error': 'No JSON data provided'}), 400
     value = data.get('item') or data.get('value')  # Support both 'item' and 'value'
     
     if not value:
@@ -444,6 +580,7 @@ def remove_exclusion(exclusion_type):
         # Soft delete
         exclusion.is_active = False
         db.session.commit()
+        _invalidate_config_cache('exclusions')
         
         AuditLogger.log_action('remove_exclusion', {'type': exclusion_type, 'value': value})
         
@@ -452,4 +589,6 @@ def remove_exclusion(exclusion_type):
     except Exception as e:
         logger.error(f"Error removing exclusion: {e}")
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+register_rate_limits(admin_bp)
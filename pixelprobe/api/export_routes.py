@@ -1,17 +1,121 @@
-from flask import Blueprint, request, jsonify, send_file, Response, make_response
+from flask import Blueprint, request, jsonify, send_file, Response, make_response, stream_with_context
 import os
 import csv
 import io
-import json
 import logging
+import orjson
+from urllib.parse import quote
+from werkzeug.http import parse_range_header
+from werkzeug.wsgi import FileWrapper
 from datetime import datetime, timezone
+from sqlalchemy import case, func, or_, select
 
 from models import db, ScanResult
+from pixelprobe.utils.helpers import ids_filter
 
 logger = logging.getLogger(__name__)
 
 export_bp = Blueprint('export', __name__, url_prefix='/api')
 
+# Hand media streaming to a reverse proxy (nginx X-Accel-Redirect) when enabled
+USE_XACCEL = os.environ.get('USE_XACCEL', 'false').lower() in ('1', 'true', 'yes')
+XACCEL_PREFIX = os.environ.get('XACCEL_PREFIX', '/_protected').rstrip('/')
+XACCEL_MEDIA_ROOT = os.environ.get('XACCEL_MEDIA_ROOT', '/media')
+
+# Largest byte range served to a single video Range request; larger chunks mean fewer
+# round-trips per playback, smaller ones suit constrained mobile clients
+MAX_RANGE_CHUNK = int(os.environ.get('MAX_RANGE_CHUNK', str(8 * 1024 * 1024)))
+
+# Largest single read while streaming a byte range
+RANGE_READ_SIZE = 1024 * 1024
+
+# Seconds browsers may reuse a served media file before revalidating it (ETag/Last-Modified)
+MEDIA_CACHE_MAX_AGE = int(os.environ.get('MEDIA_CACHE_MAX_AGE', '3600'))
+
+# Columns read by the CSV, JSON and PDF exporters; selected as plain rows, no ORM instances.
+# Ordered as _csv_row() unpacks them, so CSV rows need no attribute lookups
+_EXPORT_COLUMNS = (
+    ScanResult.id, ScanResult.file_path, ScanResult.file_size, ScanResult.file_type,
+    ScanResult.creation_date, ScanResult.is_corrupted, ScanResult.has_warnings,
+    ScanResult.corruption_details, ScanResult.warning_details, ScanResult.error_message,
+    ScanResult.scan_date, ScanResult.scan_status, ScanResult.discovered_date,
+    ScanResult.marked_as_good
+)
+
+# Rows fetched and written per streamed CSV chunk
+CSV_BATCH_SIZE = 1000
+
+# Rows rendered into a PDF export; larger selections are summarized with a note
+PDF_MAX_ROWS = 500
+
+# Status label shown in PDF exports; warnings take precedence over corruption
+_PDF_STATUS = case(
+    ((ScanResult.has_warnings == True) & (ScanResult.marked_as_good == False), 'Warning'),
+    ((ScanResult.is_corrupted == True) & (ScanResult.marked_as_good == False), 'Corrupted'),
+    else_='Healthy'
+).label('status')
+
+def _csv_row(result):
+    """Build one CSV export row from an _EXPORT_COLUMNS row"""
+    (result_id, file_path, file_size, file_type, creation_date, is_corrupted,
+     has_warnings, corruption, warning, error, scan_date, scan_status,
+     discovered_date, marked_as_good) = result
+    
+    # Combine all details into one column
+    details = []
+    if corruption:
+        details.append(f"Corruption: {corruption}")
+    if warning:
+        details.append(f"Warning: {warning}")
+    if error:
+        details.append(f"Error: {error}")
+    
+    return (
+        result_id,
+        file_path,
+        file_size or 0,
+        file_type or 'Unknown',
+        creation_date.isoformat() if creation_date else '',
+        'Yes' if is_corrupted else 'No',
+        'Yes' if has_warnings else 'No',
+        "; ".join(details),
+        scan_date.isoformat() if scan_date else '',
+        scan_status,
+        discovered_date.isoformat() if discovered_date else '',
+        'Yes' if marked_as_good else 'No'
+    )
+
+def _json_record(result):
+    """Build one JSON export record from a scan result"""
+    return {
+        'id': result.id,
+        'file_path': result.file_path,
+        'file_size': result.file_size or 0,
+        'file_type': result.file_type or 'Unknown',
+        'creation_date': result.creation_date.isoformat() if result.creation_date else None,
+        'is_corrupted': result.is_corrupted,
+        'corruption_details': result.corruption_details,
+        'scan_date': result.scan_date.isoformat() if result.scan_date else None,
+        'scan_status': result.scan_status,
+        'discovered_date': result.discovered_date.isoformat() if result.discovered_date else None,
+        'marked_as_good': result.marked_as_good,
+        'has_warnings': result.has_warnings,
+        'warning_details': result.warning_details,
+        'error_message': result.error_message,
+        'details': {
+            'corruption': result.corruption_details,
+            'warning': result.warning_details,
+            'error': result.error_message
+        }
+    }
+
+def _streamed_export_headers(filename):
+    """Headers for a streamed export; nginx passes chunks through instead of buffering the whole file"""
+    return {
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'X-Accel-Buffering': 'no'
+    }
+
 @export_bp.route('/view/<int:result_id>', methods=['GET', 'OPTIONS'])
 def view_file(result_id):
     """View/stream a media file"""
@@ -28,76 +132,81 @@ def view_file(result_id):
     
     logger.info(f"View requested for file: {result.file_path} (ID: {result_id})")
     
-    if not os.path.exists(result.file_path):
-        logger.error(f"View failed - file not found: {result.file_path}")
-        return jsonify({'error': 'File not found'}), 404
-    
-    # Get file stats
-    file_size = os.path.getsize(result.file_path)
     file_type = result.file_type or 'application/octet-stream'
     
-    # Handle range requests for video streaming (required for mobile)
-    range_header = request.headers.get('range')
-    if range_header and file_type.startswith('video/'):
-        logger.info(f"Range request for video: {range_header}")
-        
-        # Parse range header
-        try:
-            byte_start = int(range_header.split('=')[1].split('-')[0])
-            byte_end = file_size - 1
-            if '-' in range_header.split('=')[1] and range_header.split('=')[1].split('-')[1]:
-                byte_end = int(range_header.split('=')[1].split('-')[1])
-            
-            # Limit chunk size for mobile
-            max_chunk = 1024 * 1024  # 1MB chunks
-            if byte_end - byte_start > max_chunk:
-                byte_end = byte_start + max_chunk
-            
-            logger.info(f"Serving bytes {byte_start}-{byte_end}/{file_size}")
-            
-            def generate():
-                with open(result.file_path, 'rb') as f:
-                    f.seek(byte_start)
-                    remaining = byte_end - byte_start + 1
-                    while remaining:
-                        chunk_size = min(8192, remaining)
-                        chunk = f.read(chunk_size)
-                        if not chunk:
-                            break
-                        remaining -= len(chunk)
-                        yield chunk
-            
-            response = Response(
-                generate(),
-                206,  # Partial Content
-                mimetype=file_type,
-                headers={
-                    'Content-Range': f'bytes {byte_start}-{byte_end}/{file_size}',
-                    'Accept-Ranges': 'bytes',
-                    'Content-Length': str(byte_end - byte_start + 1),
-                    'Cache-Control': 'no-cache',
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Methods': 'GET, OPTIONS',
-                    'Access-Control-Allow-Headers': 'Range'
-                }
-            )
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error handling range request: {e}")
-            # Fall through to regular response
+    # Let the proxy serve the bytes (and Range) with sendfile(2) when configured
+    accel_uri = _xaccel_uri(result.file_path)
+    if accel_uri:
+        if not os.path.exists(result.file_path):
+            logger.error(f"View failed - file not found: {result.file_path}")
+            return jsonify({'error': 'File not found'}), 404
+        logger.info(f"Delegating view to proxy: {result.file_path}")
+        return Response(status=200, headers={
+            'X-Accel-Redirect': accel_uri,
+            'Content-Type': file_type,
+            'Accept-Ranges': 'bytes',
+            'Cache-Control': f'public, max-age={MEDIA_CACHE_MAX_AGE}',
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': 'GET, OPTIONS',
+            'Access-Control-Allow-Headers': 'Range'
+        })
     
-    # Regular response for non-range requests
+    # Limit ranged video reads for mobile clients; send_file handles Range/If-Range itself
+    _cap_range_header(request.environ, MAX_RANGE_CHUNK if file_type.startswith('video/') else None)
+    if 'HTTP_RANGE' in request.environ:
+        # Servers' file wrappers (gunicorn's) can't seek, so a range would be reached by reading
+        # every byte before it; Werkzeug's seeks, then reads in RANGE_READ_SIZE blocks
+        request.environ['wsgi.file_wrapper'] = _range_file_wrapper
+    
+    # send_file stats the file itself, so a missing file is caught here rather than checked up front
+    try:
+        response = send_file(result.file_path, as_attachment=False, mimetype=file_type,
+                             conditional=True, etag=True, max_age=MEDIA_CACHE_MAX_AGE)
+    except FileNotFoundError:
+        logger.error(f"View failed - file not found: {result.file_path}")
+        return jsonify({'error': 'File not found'}), 404
     logger.info(f"Serving file for viewing: {result.file_path}")
-    response = send_file(result.file_path, as_attachment=False, mimetype=file_type)
     response.headers['Accept-Ranges'] = 'bytes'
-    response.headers['Cache-Control'] = 'no-cache'
     # Add CORS headers for mobile compatibility
     response.headers['Access-Control-Allow-Origin'] = '*'
     response.headers['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
     response.headers['Access-Control-Allow-Headers'] = 'Range'
     return response
 
+def _xaccel_uri(file_path):
+    """Return the internal proxy URI for file_path, or None when the app must serve it"""
+    if not USE_XACCEL:
+        return None
+    rel_path = os.path.relpath(os.path.abspath(file_path), XACCEL_MEDIA_ROOT)
+    if rel_path.startswith('..'):
+        return None
+    return f'{XACCEL_PREFIX}/{quote(rel_path)}'
+
+def _range_file_wrapper(file, buffer_size=None):
+    """Seekable file wrapper with large read blocks for range responses"""
+    return FileWrapper(file, min(MAX_RANGE_CHUNK + 1, RANGE_READ_SIZE))
+
+def _cap_range_header(environ, max_chunk):
+    """Shorten a single byte range longer than max_chunk before it reaches send_file
+
+    Malformed and multi-range headers are dropped so the full file is served
+    (RFC 7233 allows ignoring them) instead of Werkzeug answering 416.
+    """
+    range_header = environ.get('HTTP_RANGE')
+    if not range_header:
+        return
+    parsed = parse_range_header(range_header)
+    if parsed is None or parsed.units != 'bytes' or len(parsed.ranges) != 1:
+        del environ['HTTP_RANGE']
+        return
+    start, stop = parsed.ranges[0]
+    # Suffix ranges (bytes=-N) have a negative start and are left alone
+    if max_chunk is None or start < 0:
+        return
+    # stop is exclusive; the rewritten header keeps the inclusive end at start + max_chunk
+    if stop is None or stop - start > max_chunk + 1:
+        environ['HTTP_RANGE'] = f'bytes={start}-{start + max_chunk}'
+
 @export_bp.route('/download/<int:result_id>')
 def download_file(result_id):
     """Download a media file"""
@@ -105,12 +214,28 @@ def download_file(result_id):
     
     logger.info(f"Download requested for file: {result.file_path} (ID: {result_id})")
     
-    if not os.path.exists(result.file_path):
+    accel_uri = _xaccel_uri(result.file_path)
+    if accel_uri:
+        if not os.path.exists(result.file_path):
+            logger.error(f"Download failed - file not found: {result.file_path}")
+            return jsonify({'error': 'File not found'}), 404
+        logger.info(f"Delegating download to proxy: {result.file_path}")
+        return Response(status=200, headers={
+            'X-Accel-Redirect': accel_uri,
+            'Content-Type': result.file_type or 'application/octet-stream',
+            'Content-Disposition': f"attachment; filename*=UTF-8''{quote(os.path.basename(result.file_path))}",
+            'Cache-Control': f'public, max-age={MEDIA_CACHE_MAX_AGE}'
+        })
+    
+    # Conditional responses let clients holding a fresh copy get a 304 instead of the file
+    try:
+        response = send_file(result.file_path, as_attachment=True, conditional=True, etag=True,
+                             max_age=MEDIA_CACHE_MAX_AGE)
+    except FileNotFoundError:
         logger.error(f"Download failed - file not found: {result.file_path}")
         return jsonify({'error': 'File not found'}), 404
-    
     logger.info(f"Starting download of file: {result.file_path}")
-    return send_file(result.file_path, as_attachment=True)
+    return response
 
 @export_bp.route('/export-csv', methods=['GET', 'POST'])
 def export_csv():
@@ -123,94 +248,100 @@ def export_csv():
             format_type = data.get('format', 'csv').lower()
             file_ids = data.get('file_ids', [])
             
+            # Validate file IDs are integers; large selections are bound as an integer array
+            try:
+                if not isinstance(file_ids, list):
+                    raise TypeError('file_ids must be a list')
+                file_ids = [int(fid) for fid in file_ids]
+            except (ValueError, TypeError):
+                return jsonify({'error': 'Invalid file ID format'}), 400
+            
             if file_ids:
                 # Export selected files
-                results = ScanResult.query.filter(ScanResult.id.in_(file_ids)).all()
+                stmt = select(*_EXPORT_COLUMNS).where(ids_filter(ScanResult.id, file_ids))
                 export_type = "selected"
-                logger.info(f"Exporting {len(results)} selected scan results to CSV")
+                logger.info(f"Exporting {len(file_ids)} selected scan results to {format_type.upper()}")
             else:
                 # Export based on current filter and search
                 filter_type = data.get('filter', 'all')
                 search = data.get('search', '')
                 
-                query = ScanResult.query
+                stmt = select(*_EXPORT_COLUMNS)
                 
                 # Apply search filter
                 if search:
-                    query = query.filter(ScanResult.file_path.contains(search))
+                    stmt = stmt.where(ScanResult.file_path.contains(search))
                 
                 # Apply corruption filter
                 if filter_type == 'corrupted':
                     # Show only corrupted files that don't have warnings and aren't marked as good
-                    query = query.filter(
-                        (ScanResult.is_corrupted == True) & 
-                        ((ScanResult.has_warnings == False) | (ScanResult.has_warnings == None)) &
-                        (ScanResult.marked_as_good == False)
+                    stmt = stmt.where(
+                        ScanResult.is_corrupted == True,
+                        or_(ScanResult.has_warnings == False, ScanResult.has_warnings.is_(None)),
+                        ScanResult.marked_as_good == False
                     )
                 elif filter_type == 'healthy':
                     # Show only healthy files (no corruption, no warnings, or marked as good)
-                    query = query.filter(
-                        ((ScanResult.is_corrupted == False) & 
-                         ((ScanResult.has_warnings == False) | (ScanResult.has_warnings == None))) |
-                        (ScanResult.marked_as_good == True)
+                    stmt = stmt.where(
+                        or_(
+                            (ScanResult.is_corrupted == False) &
+                            or_(ScanResult.has_warnings == False, ScanResult.has_warnings.is_(None)),
+                            ScanResult.marked_as_good == True
+                        )
                     )
                 elif filter_type == 'warning':
                     # Show files with warnings that aren't marked as good
-                    query = query.filter(
-                        (ScanResult.has_warnings == True) &
-                        (ScanResult.marked_as_good == False)
+                    stmt = stmt.where(
+                        ScanResult.has_warnings == True,
+                        ScanResult.marked_as_good == False
                     )
                 # 'all' filter - no additional filtering needed
                 
-                results = query.all()
                 export_type = filter_type if filter_type != 'all' else 'all'
-                logger.info(f"Exporting {len(results)} scan results to {format_type.upper()} (filter: {filter_type}, search: '{search}')")
+                logger.info(f"Exporting scan results to {format_type.upper()} (filter: {filter_type}, search: '{search}')")
         else:
             # GET request - export all files (CSV by default)
-            results = ScanResult.query.all()
+            stmt = select(*_EXPORT_COLUMNS)
             export_type = "all"
-            logger.info(f"Exporting {len(results)} scan results to {format_type.upper()} (all results via GET)")
+            logger.info(f"Exporting scan results to {format_type.upper()} (all results via GET)")
+        
+        # Rows come out in id order so an interrupted download can resume after the last
+        # exported ID (keyset, no OFFSET) by passing it back as cursor
+        cursor = data.get('cursor') if request.method == 'POST' else request.args.get('cursor')
+        if cursor is not None:
+            try:
+                stmt = stmt.where(ScanResult.id > int(cursor))
+            except (TypeError, ValueError):
+                return jsonify({'error': 'cursor must be an integer scan result ID'}), 400
+        stmt = stmt.order_by(ScanResult.id)
         
         # Create filename with timestamp and export type
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Handle different export formats
         if format_type == 'json':
-            # Export as JSON
-            json_data = []
-            for result in results:
-                json_data.append({
-                    'id': result.id,
-                    'file_path': result.file_path,
-                    'file_size': result.file_size or 0,
-                    'file_type': result.file_type or 'Unknown',
-                    'creation_date': result.creation_date.isoformat() if result.creation_date else None,
-                    'is_corrupted': result.is_corrupted,
-                    'corruption_details': result.corruption_details,
-                    'scan_date': result.scan_date.isoformat() if result.scan_date else None,
-                    'scan_status': getattr(result, 'scan_status', 'completed'),
-                    'discovered_date': getattr(result, 'discovered_date', result.scan_date).isoformat() if getattr(result, 'discovered_date', result.scan_date) else None,
-                    'marked_as_good': result.marked_as_good,
-                    'has_warnings': getattr(result, 'has_warnings', False),
-                    'warning_details': getattr(result, 'warning_details', None),
-                    'error_message': getattr(result, 'error_message', None),
-                    'details': {
-                        'corruption': result.corruption_details,
-                        'warning': getattr(result, 'warning_details', None),
-                        'error': getattr(result, 'error_message', None)
-                    }
-                })
-            
-            json_content = json.dumps(json_data, indent=2)
+            # Export as JSON, streamed one batch of records at a time
             filename = f"pixelprobe_{export_type}_{timestamp}.json"
             
-            logger.info(f"JSON export completed - {len(results)} records exported to {filename}")
+            def generate_json():
+                yield b'['
+                count = 0
+                rows = db.session.execute(stmt.execution_options(yield_per=CSV_BATCH_SIZE))
+                for batch in rows.partitions():
+                    chunk = b',\n'.join(
+                        orjson.dumps(_json_record(result), default=str, option=orjson.OPT_INDENT_2)
+                        for result in batch
+                    )
+                    yield (b',\n' if count else b'\n') + chunk
+                    count += len(batch)
+                yield b'\n]'
+                
+                logger.info(f"JSON export completed - {count} records exported to {filename}")
             
-            return send_file(
-                io.BytesIO(json_content.encode('utf-8')),
+            return Response(
+                stream_with_context(generate_json()),
                 mimetype='application/json',
-                as_attachment=True,
-                download_name=filename
+                headers=_streamed_export_headers(filename)
             )
             
         elif format_type == 'pdf':
@@ -218,11 +349,18 @@ def export_csv():
             try:
                 from reportlab.lib import colors
                 from reportlab.lib.pagesizes import letter, landscape
-                from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+                from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer, PageBreak
                 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
                 from reportlab.lib.units import inch
                 from reportlab.lib.enums import TA_CENTER
                 
+                # Count in SQL and fetch only the rows that are rendered
+                total = db.session.scalar(select(func.count()).select_from(stmt.subquery()))
+                rows = db.session.execute(
+                    stmt.add_columns(_PDF_STATUS, (ScanResult.file_size / 1048576.0).label('size_mb'))
+                    .limit(PDF_MAX_ROWS).execution_options(yield_per=PDF_MAX_ROWS)
+                )
+                
                 # Create PDF buffer
                 buffer = io.BytesIO()
                 doc = SimpleDocTemplate(buffer, pagesize=landscape(letter), 
@@ -261,7 +399,7 @@ def export_csv():
                 
                 # Add export info
                 info_text = f"Export Date: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}<br/>"
-                info_text += f"Total Records: {len(results)}<br/>"
+                info_text += f"Total Records: {total}<br/>"
                 info_text += f"Filter: {export_type}"
                 elements.append(Paragraph(info_text, styles['Normal']))
                 elements.append(Spacer(1, 0.2*inch))
@@ -269,12 +407,9 @@ def export_csv():
                 # Create table data
                 table_data = [['File Path', 'Status', 'Size', 'Type', 'Details', 'Scan Date']]
                 
-                for result in results[:500]:  # Limit to 500 for PDF size
-                    status = 'Corrupted' if result.is_corrupted and not result.marked_as_good else 'Healthy'
-                    if getattr(result, 'has_warnings', False) and not result.marked_as_good:
-                        status = 'Warning'
-                    
-                    size = f"{result.file_size / (1024*1024):.2f} MB" if result.file_size else 'N/A'
+                for result in rows:
+                    status = result.status
+                    size = f"{result.size_mb:.2f} MB" if result.size_mb else 'N/A'
                     file_type = result.file_type or 'Unknown'
                     scan_date = result.scan_date.strftime('%Y-%m-%d %H:%M') if result.scan_date else 'N/A'
                     
@@ -285,17 +420,18 @@ def export_csv():
                     details = []
                     if result.corruption_details:
                         details.append(result.corruption_details[:40] + "..." if len(result.corruption_details) > 40 else result.corruption_details)
-                    if getattr(result, 'warning_details', None):
-                        warning = getattr(result, 'warning_details', '')
+                    if result.warning_details:
+                        warning = result.warning_details
                         details.append(warning[:40] + "..." if len(warning) > 40 else warning)
-                    if getattr(result, 'error_message', None):
-                        error = getattr(result, 'error_message', '')
+                    if result.error_message:
+                        error = result.error_message
                         details.append(error[:40] + "..." if len(error) > 40 else error)
                     details_text = "; ".join(details) if details else ''
                     
-                    # Wrap file path and details in Paragraph for proper text wrapping
+                    # Wrap file path and details in Paragraph for proper text wrapping; most rows
+                    # have no details, and an empty string avoids laying out an empty Paragraph
                     file_path_para = Paragraph(file_path, cell_style)
-                    details_para = Paragraph(details_text, cell_style)
+                    details_para = Paragraph(details_text, cell_style) if details_text else ''
                     
                     table_data.append([
                         file_path_para,
@@ -306,8 +442,9 @@ def export_csv():
                         scan_date
                     ])
                 
-                # Create table - adjusted column widths to fit details
-                table = Table(table_data, colWidths=[3.5*inch, 0.7*inch, 0.7*inch, 1*inch, 2.5*inch, 1.1*inch])
+                # Create table - adjusted column widths to fit details; LongTable splits across
+                # pages without re-measuring every row
+                table = LongTable(table_data, colWidths=[3.5*inch, 0.7*inch, 0.7*inch, 1*inch, 2.5*inch, 1.1*inch])
                 table.setStyle(TableStyle([
                     ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                     ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
@@ -322,22 +459,20 @@ def export_csv():
                 
                 elements.append(table)
                 
-                if len(results) > 500:
+                if total > PDF_MAX_ROWS:
                     elements.append(Spacer(1, 0.1*inch))
-                    elements.append(Paragraph(f"Note: Showing first 500 of {len(results)} total records", styles['Normal']))
+                    elements.append(Paragraph(f"Note: Showing first {PDF_MAX_ROWS} of {total} total records", styles['Normal']))
                 
                 # Build PDF
                 doc.build(elements)
                 
-                # Get PDF data
-                pdf_data = buffer.getvalue()
-                buffer.close()
-                
                 filename = f"pixelprobe_{export_type}_{timestamp}.pdf"
-                logger.info(f"PDF export completed - {len(results)} records exported to {filename}")
+                logger.info(f"PDF export completed - {total} records exported to {filename}")
                 
+                # Send the buffer itself rather than a copy of its bytes
+                buffer.seek(0)
                 return send_file(
-                    io.BytesIO(pdf_data),
+                    buffer,
                     mimetype='application/pdf',
                     as_attachment=True,
                     download_name=filename
@@ -348,69 +483,54 @@ def export_csv():
                 return jsonify({'error': 'PDF export requires reportlab package'}), 500
                 
         else:
-            # Default to CSV export
-            # Create CSV in memory
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Write CSV header
-            writer.writerow([
-                'ID',
-                'File Path',
-                'File Size (bytes)',
-                'File Type',
-                'Creation Date',
-                'Is Corrupted',
-                'Has Warnings',
-                'Details',
-                'Scan Date',
-                'Scan Status',
-                'Discovered Date',
-                'Marked as Good'
-            ])
+            # Default to CSV export, streamed row by row so the file is never held in memory
+            filename = f"pixelprobe_{export_type}_{timestamp}.csv"
             
-            # Write data rows
-            for result in results:
-                # Combine all details into one column
-                details = []
-                if result.corruption_details:
-                    details.append(f"Corruption: {result.corruption_details}")
-                if getattr(result, 'warning_details', None):
-                    details.append(f"Warning: {result.warning_details}")
-                if getattr(result, 'error_message', None):
-                    details.append(f"Error: {result.error_message}")
-                details_text = "; ".join(details) if details else ''
+            def generate():
+                # The writer encodes into a byte buffer, so chunks are yielded as bytes without a separate encode pass
+                output = io.BytesIO()
+                text = io.TextIOWrapper(output, encoding='utf-8', newline='')
+                writer = csv.writer(text)
                 
+                def flush():
+                    text.flush()
+                    chunk = output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+                    return chunk
+                
+                # Write CSV header
                 writer.writerow([
-                    result.id,
-                    result.file_path,
-                    result.file_size or 0,
-                    result.file_type or 'Unknown',
-                    result.creation_date.isoformat() if result.creation_date else '',
-                    'Yes' if result.is_corrupted else 'No',
-                    'Yes' if getattr(result, 'has_warnings', False) else 'No',
-                    details_text,
-                    result.scan_date.isoformat() if result.scan_date else '',
-                    getattr(result, 'scan_status', 'completed'),  # Default to completed for old records
-                    getattr(result, 'discovered_date', result.scan_date).isoformat() if getattr(result, 'discovered_date', result.scan_date) else '',
-                    'Yes' if result.marked_as_good else 'No'
+                    'ID',
+                    'File Path',
+                    'File Size (bytes)',
+                    'File Type',
+                    'Creation Date',
+                    'Is Corrupted',
+                    'Has Warnings',
+                    'Details',
+                    'Scan Date',
+                    'Scan Status',
+                    'Discovered Date',
+                    'Marked as Good'
                 ])
-            
-            # Prepare response
-            output.seek(0)
-            csv_content = output.getvalue()
-            output.close()
-            
-            filename = f"pixelprobe_{export_type}_{timestamp}.csv"
-            
-            logger.info(f"CSV export completed - {len(results)} records exported to {filename}")
+                yield flush()
+                
+                # Write data rows, one writerows() call and one chunk per batch
+                count = 0
+                rows = db.session.execute(stmt.execution_options(yield_per=CSV_BATCH_SIZE))
+                for batch in rows.partitions():
+                    writer.writerows(map(_csv_row, batch))
+                    count += len(batch)
+                    yield flush()
+                
+                logger.info(f"CSV export completed - {count} records exported to {filename}")
             
             # Return CSV file
-            return send_file(
-                io.BytesIO(csv_content.encode('utf-8')),
+            return Response(
+                stream_with_context(generate()),
                 mimetype='text/csv',
-                as_attachment=True,
-                download_name=filename
+                headers=_streamed_export_headers(filename)
             )
         
     except Exception as e:
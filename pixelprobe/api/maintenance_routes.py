@@ -1,94 +1,145 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 import os
+import orjson
+import hashlib
 import logging
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import pytz
+from sqlalchemy import event, func, insert, literal, null, select, union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
 
 from models import db, ScanResult, CleanupState, FileChangesState
 from media_checker import PixelProbe
 from utils import ProgressTracker
 from pixelprobe.services.maintenance_service import MaintenanceService
+from pixelprobe.utils.helpers import ojsonify
+from pixelprobe.utils.rate_limiting import exempt_from_rate_limit, register_rate_limits
 
 logger = logging.getLogger(__name__)
 
-# Get timezone from environment variable, default to UTC
-APP_TIMEZONE = os.environ.get('TZ', 'UTC')
-try:
-    tz = pytz.timezone(APP_TIMEZONE)
-except pytz.exceptions.UnknownTimeZoneError:
-    tz = pytz.UTC
-    logger.warning(f"Unknown timezone '{APP_TIMEZONE}', falling back to UTC")
-
 maintenance_bp = Blueprint('maintenance', __name__, url_prefix='/api')
 
-# Import limiter from main app
 from flask import current_app
-from functools import wraps
-
-# Create rate limit decorators that work with Flask-Limiter
-def rate_limit(limit_string):
-    """Decorator to apply rate limits using the app's limiter"""
-    def decorator(f):
-        @wraps(f)
-        def wrapped(*args, **kwargs):
-            # Get the limiter from the current app
-            limiter = current_app.extensions.get('flask-limiter')
-            if limiter:
-                # Apply the rate limit dynamically
-                limited_func = limiter.limit(limit_string, exempt_when=lambda: False)(f)
-                return limited_func(*args, **kwargs)
-            else:
-                # If no limiter, just call the function
-                return f(*args, **kwargs)
-        return wrapped
-    return decorator
-
-def exempt_from_rate_limit(f):
-    """Decorator to exempt a function from rate limiting"""
-    @wraps(f)
-    def wrapped(*args, **kwargs):
-        # Get the limiter from the current app
-        limiter = current_app.extensions.get('flask-limiter')
-        if limiter:
-            # Apply exemption dynamically
-            exempt_func = limiter.exempt(f)
-            return exempt_func(*args, **kwargs)
-        else:
-            # If no limiter, just call the function
-            return f(*args, **kwargs)
-    return wrapped
+from functools import lru_cache
 
-# Global state tracking - will be moved to service layer
-cleanup_state = {
-    'is_running': False,
-    'phase': 'idle',
-    'files_processed': 0,
-    'total_files': 0,
-    'orphaned_found': 0,
-    'progress_percentage': 0,
-    'start_time': None,
-    'cancel_requested': False
-}
-cleanup_state_lock = threading.Lock()
+# Maintenance jobs run on a persistent pool. At most one cleanup and one file changes check run
+# at a time across all worker processes: starting a job claims its active state row (_claim_job),
+# and a partial unique index on is_active rejects a second concurrent claim.
+_maintenance_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='maintenance')
 
-file_changes_state = {
-    'is_running': False,
-    'phase': 'idle',
-    'files_processed': 0,
-    'total_files': 0,
-    'changes_found': 0,
-    'corrupted_found': 0,
-    'progress_percentage': 0,
-    'start_time': None,
-    'cancel_requested': False
+# Status streams: how often progress is re-read, the idle keepalive interval and how long
+# one stream stays open before the browser's EventSource reconnects
+STATUS_STREAM_INTERVAL = 1.0
+STATUS_STREAM_KEEPALIVE = 15.0
+STATUS_STREAM_MAX_SECONDS = 300
+
+# Status polls only need the phase-weighted percentage, so one tracker per operation is shared
+_CLEANUP_PROGRESS = ProgressTracker('cleanup')
+_FILE_CHANGES_PROGRESS = ProgressTracker('file_changes')
+
+# Snapshot of the newest cleanup / file changes record so status polls are a dict lookup.
+# Committed writes to either table bump its version; the TTL bounds staleness for writes
+# made by other worker processes. Only snapshots of running jobs are cached: a finished or
+# missing record is re-read on every poll, so a job claimed by another worker is never
+# hidden behind the previous job's cached 'complete' state.
+STATUS_CACHE_TTL = 2.0
+_status_versions = {CleanupState: 0, FileChangesState: 0}
+# Columns status polls read; also the inputs to the status ETag
+_STATUS_FIELDS = {
+    CleanupState: ('id', 'is_active', 'phase', 'phase_number', 'phase_current', 'phase_total',
+                   'files_processed', 'total_files', 'orphaned_found', 'current_file',
+                   'progress_message', 'start_time'),
+    FileChangesState: ('id', 'is_active', 'phase', 'phase_number', 'phase_current', 'phase_total',
+                       'files_processed', 'total_files', 'changes_found', 'corrupted_found',
+                       'current_file', 'progress_message', 'start_time'),
 }
-file_changes_state_lock = threading.Lock()
+_status_cache = {}
+_status_cache_lock = threading.Lock()
+
+def _mark_status_changed(mapper, connection, target):
+    """Remember that this session wrote a status record"""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('status_models_changed', set()).add(type(target))
+
+for _model in _status_versions:
+    for _event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _event_name, _mark_status_changed)
 
-current_cleanup_thread = None
-current_file_changes_thread = None
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_bulk_status_changed(orm_execute_state):
+    """Bulk INSERT/UPDATE/DELETE statements skip mapper events, so flag them here"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ in _status_versions:
+            orm_execute_state.session.info.setdefault('status_models_changed', set()).add(mapper.class_)
+
+@event.listens_for(Session, 'after_commit')
+def _bump_status_versions(session):
+    """Invalidate cached snapshots once status writes are committed"""
+    changed = session.info.pop('status_models_changed', None)
+    if changed:
+        with _status_cache_lock:
+            for model in changed:
+                _status_versions[model] += 1
+
+# Every status column across both tables; each arm of the UNION ALL pads the columns its table lacks
+_STATUS_UNION_FIELDS = tuple(dict.fromkeys(field for fields in _STATUS_FIELDS.values() for field in fields))
+
+def _latest_states_query(models):
+    """One UNION ALL statement returning the newest record of each model, tagged with its position"""
+    arms = []
+    for kind, model in enumerate(models):
+        columns = [literal(kind).label('kind')]
+        for field in _STATUS_UNION_FIELDS:
+            if field in _STATUS_FIELDS[model]:
+                columns.append(getattr(model, field).label(field))
+            else:
+                columns.append(null().label(field))
+        newest = select(func.max(model.id)).scalar_subquery()
+        arms.append(select(*columns).where(model.id == newest))
+    return union_all(*arms)
+
+def _latest_states():
+    """Return {model: plain-dict snapshot of its newest record, or None} for both status models.
+    
+    Stale snapshots are refreshed together in one query, so a dashboard polling both
+    status endpoints back to back costs a single round trip.
+    """
+    now = time.monotonic()
+    states = {}
+    with _status_cache_lock:
+        versions = dict(_status_versions)
+        for model, version in versions.items():
+            cached = _status_cache.get(model)
+            if cached and cached[0] == version and now < cached[1]:
+                states[model] = cached[2]
+    if len(states) == len(versions):
+        return states
+    
+    # Project just the status columns of the stale models: no ORM instance, no changed_files text
+    models = tuple(model for model in versions if model not in states)
+    fresh = dict.fromkeys(models)
+    for row in db.session.execute(_latest_states_query(models)):
+        model = models[row.kind]
+        record = row._asdict()
+        fresh[model] = {field: record[field] for field in _STATUS_FIELDS[model]}
+    
+    with _status_cache_lock:
+        for model, snapshot in fresh.items():
+            states[model] = snapshot
+            # Skip storing if a commit landed while we were reading
+            if snapshot and snapshot['is_active'] and _status_versions[model] == versions[model]:
+                _status_cache[model] = (versions[model], now + STATUS_CACHE_TTL, snapshot)
+    return states
+
+def _latest_state(model):
+    """Return a plain-dict snapshot of the status fields of model's newest record, or None"""
+    return _latest_states()[model]
 
 @maintenance_bp.route('/test-cleanup')
 def test_cleanup():
@@ -106,70 +157,123 @@ def test_cleanup():
             'message': 'No cleanup operations found'
         })
 
+# Payloads for when no operation has ever run; shared, so callers must not modify them
+_CLEANUP_IDLE_STATUS = {
+    'is_running': False,
+    'phase': 'idle',
+    'phase_number': 1,
+    'total_phases': 3,
+    'phase_current': 0,
+    'phase_total': 0,
+    'files_processed': 0,
+    'total_files': 0,
+    'orphaned_found': 0,
+    'current_file': None,
+    'progress_message': '',
+    'progress_percentage': 0
+}
+
+_FILE_CHANGES_IDLE_STATUS = {
+    'is_running': False,
+    'phase': 'idle',
+    'phase_number': 1,
+    'total_phases': 3,
+    'phase_current': 0,
+    'phase_total': 0,
+    'files_processed': 0,
+    'total_files': 0,
+    'changes_found': 0,
+    'corrupted_found': 0,
+    'current_file': None,
+    'progress_message': '',
+    'progress_percentage': 0
+}
+
+_IDLE_STATUS_BODIES = {
+    CleanupState: orjson.dumps(_CLEANUP_IDLE_STATUS),
+    FileChangesState: orjson.dumps(_FILE_CHANGES_IDLE_STATUS),
+}
+
+# Jobs started by this process: model -> (record id, monotonic start, start timestamp)
+_job_clock = {}
+
+def _job_timing(model, record):
+    """(start timestamp, elapsed seconds) of an active record"""
+    started = _job_clock.get(model)
+    if started is not None and started[0] == record['id']:
+        return started[2], time.monotonic() - started[1]
+    
+    # Started before a restart or by another worker: fall back to the stored start time
+    start_time_utc = record['start_time']
+    if start_time_utc.tzinfo is None:
+        # If naive, assume UTC
+        start_time_utc = start_time_utc.replace(tzinfo=timezone.utc)
+    return start_time_utc.timestamp(), (datetime.now(timezone.utc) - start_time_utc).total_seconds()
+
+def _cleanup_status(cleanup_record):
+    """Build the cleanup status payload from the most recent cleanup record"""
+    if not cleanup_record:
+        # No cleanup has ever been run
+        response = _CLEANUP_IDLE_STATUS
+    else:
+        response = {
+            'is_running': cleanup_record['is_active'],
+            'phase': cleanup_record['phase'],
+            'phase_number': cleanup_record['phase_number'],
+            'total_phases': 3,
+            'phase_current': cleanup_record['phase_current'],
+            'phase_total': cleanup_record['phase_total'],
+            'files_processed': cleanup_record['files_processed'],
+            'total_files': cleanup_record['total_files'],
+            'orphaned_found': cleanup_record['orphaned_found'],
+            'current_file': cleanup_record['current_file'],
+            'progress_message': cleanup_record['progress_message'] or ''
+        }
+        
+        if cleanup_record['start_time'] and cleanup_record['is_active']:
+            response['start_time'], response['duration'] = _job_timing(CleanupState, cleanup_record)
+        
+        # Calculate progress percentage using unified ProgressTracker
+        if cleanup_record['phase'] == 'complete':
+            response['progress_percentage'] = 100
+        else:
+            response['progress_percentage'] = _CLEANUP_PROGRESS.calculate_progress_percentage(
+                cleanup_record['phase_number'],
+                cleanup_record['phase_current'],
+                cleanup_record['phase_total'],
+                total_phases=3
+            )
+    
+    return response
+
+def _status_etag(*records):
+    """ETag over the status fields of the given snapshots"""
+    etag_source = repr(tuple(tuple(record.values()) if record else None for record in records))
+    return hashlib.blake2b(etag_source.encode(), digest_size=8).hexdigest()
+
+def _conditional_status(model, build_status):
+    """Status response for model's newest record, answering 304 when If-None-Match still matches"""
+    record = _latest_state(model)
+    etag = _status_etag(record)
+    
+    if etag in request.if_none_match:
+        # Skip building and serializing the payload
+        response = Response(status=304)
+    elif record is None:
+        # Nothing has run yet: the idle payload was serialized once at import
+        response = Response(_IDLE_STATUS_BODIES[model], mimetype='application/json')
+    else:
+        response = ojsonify(build_status(record))
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
 @maintenance_bp.route('/cleanup-status')
 @exempt_from_rate_limit
 def get_cleanup_status():
     """Get current cleanup orphans operation status"""
     try:
-        # Get the most recent cleanup state from database
-        cleanup_record = CleanupState.query.order_by(CleanupState.id.desc()).first()
-        
-        if not cleanup_record:
-            # No cleanup has ever been run
-            response = {
-                'is_running': False,
-                'phase': 'idle',
-                'phase_number': 1,
-                'total_phases': 3,
-                'phase_current': 0,
-                'phase_total': 0,
-                'files_processed': 0,
-                'total_files': 0,
-                'orphaned_found': 0,
-                'current_file': None,
-                'progress_message': '',
-                'progress_percentage': 0
-            }
-        else:
-            response = {
-                'is_running': cleanup_record.is_active,
-                'phase': cleanup_record.phase,
-                'phase_number': cleanup_record.phase_number,
-                'total_phases': 3,
-                'phase_current': cleanup_record.phase_current,
-                'phase_total': cleanup_record.phase_total,
-                'files_processed': cleanup_record.files_processed,
-                'total_files': cleanup_record.total_files,
-                'orphaned_found': cleanup_record.orphaned_found,
-                'current_file': cleanup_record.current_file,
-                'progress_message': cleanup_record.progress_message or ''
-            }
-            
-            if cleanup_record.start_time and cleanup_record.is_active:
-                # Handle both timezone-aware and timezone-naive datetimes
-                if cleanup_record.start_time.tzinfo is None:
-                    # If naive, assume UTC
-                    start_time_utc = cleanup_record.start_time.replace(tzinfo=timezone.utc)
-                else:
-                    start_time_utc = cleanup_record.start_time
-                response['duration'] = (datetime.now(timezone.utc) - start_time_utc).total_seconds()
-                response['start_time'] = start_time_utc.timestamp()
-            
-            # Calculate progress percentage using unified ProgressTracker
-            progress_tracker = ProgressTracker('cleanup')
-            
-            if cleanup_record.phase == 'complete':
-                response['progress_percentage'] = 100
-            else:
-                response['progress_percentage'] = progress_tracker.calculate_progress_percentage(
-                    cleanup_record.phase_number,
-                    cleanup_record.phase_current,
-                    cleanup_record.phase_total,
-                    total_phases=3
-                )
-        
-        return jsonify(response)
-        
+        return _conditional_status(CleanupState, _cleanup_status)
     except Exception as e:
         logger.error(f"Error getting cleanup status: {str(e)}")
         return jsonify({
@@ -178,72 +282,49 @@ def get_cleanup_status():
             'error': str(e)
         })
 
+def _file_changes_status(file_changes_record):
+    """Build the file changes status payload from the most recent check record"""
+    if not file_changes_record:
+        # No file changes check has ever been run
+        response = _FILE_CHANGES_IDLE_STATUS
+    else:
+        response = {
+            'is_running': file_changes_record['is_active'],
+            'phase': file_changes_record['phase'],
+            'phase_number': file_changes_record['phase_number'],
+            'total_phases': 3,
+            'phase_current': file_changes_record['phase_current'],
+            'phase_total': file_changes_record['phase_total'],
+            'files_processed': file_changes_record['files_processed'],
+            'total_files': file_changes_record['total_files'],
+            'changes_found': file_changes_record['changes_found'],
+            'corrupted_found': file_changes_record['corrupted_found'],
+            'current_file': file_changes_record['current_file'],
+            'progress_message': file_changes_record['progress_message'] or ''
+        }
+        
+        if file_changes_record['start_time'] and file_changes_record['is_active']:
+            response['start_time'], response['duration'] = _job_timing(FileChangesState, file_changes_record)
+        
+        # Calculate progress percentage using unified ProgressTracker
+        if file_changes_record['phase'] == 'complete':
+            response['progress_percentage'] = 100
+        else:
+            response['progress_percentage'] = _FILE_CHANGES_PROGRESS.calculate_progress_percentage(
+                file_changes_record['phase_number'],
+                file_changes_record['phase_current'],
+                file_changes_record['phase_total'],
+                total_phases=3
+            )
+    
+    return response
+
 @maintenance_bp.route('/file-changes-status')
 @exempt_from_rate_limit
 def get_file_changes_status():
     """Get current file changes check operation status"""
     try:
-        # Get the most recent file changes state from database
-        file_changes_record = FileChangesState.query.order_by(FileChangesState.id.desc()).first()
-        
-        if not file_changes_record:
-            # No file changes check has ever been run
-            response = {
-                'is_running': False,
-                'phase': 'idle',
-                'phase_number': 1,
-                'total_phases': 3,
-                'phase_current': 0,
-                'phase_total': 0,
-                'files_processed': 0,
-                'total_files': 0,
-                'changes_found': 0,
-                'corrupted_found': 0,
-                'current_file': None,
-                'progress_message': '',
-                'progress_percentage': 0
-            }
-        else:
-            response = {
-                'is_running': file_changes_record.is_active,
-                'phase': file_changes_record.phase,
-                'phase_number': file_changes_record.phase_number,
-                'total_phases': 3,
-                'phase_current': file_changes_record.phase_current,
-                'phase_total': file_changes_record.phase_total,
-                'files_processed': file_changes_record.files_processed,
-                'total_files': file_changes_record.total_files,
-                'changes_found': file_changes_record.changes_found,
-                'corrupted_found': file_changes_record.corrupted_found,
-                'current_file': file_changes_record.current_file,
-                'progress_message': file_changes_record.progress_message or ''
-            }
-            
-            if file_changes_record.start_time and file_changes_record.is_active:
-                # Handle both timezone-aware and timezone-naive datetimes
-                if file_changes_record.start_time.tzinfo is None:
-                    # If naive, assume UTC
-                    start_time_utc = file_changes_record.start_time.replace(tzinfo=timezone.utc)
-                else:
-                    start_time_utc = file_changes_record.start_time
-                response['duration'] = (datetime.now(timezone.utc) - start_time_utc).total_seconds()
-                response['start_time'] = start_time_utc.timestamp()
-            
-            # Calculate progress percentage using unified ProgressTracker
-            progress_tracker = ProgressTracker('file_changes')
-            
-            if file_changes_record.phase == 'complete':
-                response['progress_percentage'] = 100
-            else:
-                response['progress_percentage'] = progress_tracker.calculate_progress_percentage(
-                    file_changes_record.phase_number,
-                    file_changes_record.phase_current,
-                    file_changes_record.phase_total,
-                    total_phases=3
-                )
-        
-        return jsonify(response)
-        
+        return _conditional_status(FileChangesState, _file_changes_status)
     except Exception as e:
         logger.error(f"Error getting file changes status: {str(e)}")
         return jsonify({
@@ -252,22 +333,91 @@ def get_file_changes_status():
             'error': str(e)
         })
 
+@maintenance_bp.route('/maintenance-status')
+@exempt_from_rate_limit
+def get_maintenance_status():
+    """Get cleanup and file changes status in one response, for dashboards that poll both"""
+    try:
+        states = _latest_states()
+        cleanup_record = states[CleanupState]
+        file_changes_record = states[FileChangesState]
+        etag = _status_etag(cleanup_record, file_changes_record)
+        
+        if etag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = ojsonify({
+                'cleanup': _cleanup_status(cleanup_record),
+                'file_changes': _file_changes_status(file_changes_record)
+            })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    except Exception as e:
+        logger.error(f"Error getting maintenance status: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def _status_event_stream(model, build_status, label):
+    """Server-Sent Events response that pushes the status of model's newest record whenever it changes"""
+    def generate():
+        yield f"retry: {int(STATUS_STREAM_INTERVAL * 1000)}\n\n"
+        last_payload = None
+        last_sent = started = time.monotonic()
+        while time.monotonic() - started < STATUS_STREAM_MAX_SECONDS:
+            try:
+                payload = orjson.dumps(build_status(_latest_state(model)), option=orjson.OPT_SORT_KEYS).decode()
+            except Exception as e:
+                logger.error(f"Error getting {label} status: {str(e)}")
+                payload = orjson.dumps({'is_running': False, 'phase': 'error', 'error': str(e)}).decode()
+            finally:
+                # End the read transaction so the next pass sees new progress
+                db.session.rollback()
+            
+            now = time.monotonic()
+            if payload != last_payload:
+                yield f"data: {payload}\n\n"
+                last_payload, last_sent = payload, now
+            elif now - last_sent >= STATUS_STREAM_KEEPALIVE:
+                yield ": keepalive\n\n"
+                last_sent = now
+            time.sleep(STATUS_STREAM_INTERVAL)
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@maintenance_bp.route('/cleanup-status/stream')
+@exempt_from_rate_limit
+def stream_cleanup_status():
+    """Stream cleanup status as Server-Sent Events, sent only when it changes"""
+    return _status_event_stream(CleanupState, _cleanup_status, 'cleanup')
+
+@maintenance_bp.route('/file-changes-status/stream')
+@exempt_from_rate_limit
+def stream_file_changes_status():
+    """Stream file changes status as Server-Sent Events, sent only when it changes"""
+    return _status_event_stream(FileChangesState, _file_changes_status, 'file changes')
+
+def _request_cancel(model):
+    """Flag model's newest record for cancellation if it is still active; returns whether it was"""
+    # One conditional UPDATE, so a record finishing in between cannot be flagged
+    latest_id = select(func.max(model.id)).scalar_subquery()
+    result = db.session.execute(
+        update(model)
+        .where(model.id == latest_id, model.is_active == True)
+        .values(cancel_requested=True, progress_message='Cancellation requested...')
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount > 0
+
 @maintenance_bp.route('/cancel-cleanup', methods=['POST'])
 def cancel_cleanup():
     """Cancel the current cleanup operation"""
     try:
-        cleanup_record = CleanupState.query.order_by(CleanupState.id.desc()).first()
-        
-        if cleanup_record and cleanup_record.is_active:
-            # Set cancel_requested in database
-            cleanup_record.cancel_requested = True
-            cleanup_record.progress_message = 'Cancellation requested...'
-            db.session.commit()
-            
-            # Also set in memory state
-            with cleanup_state_lock:
-                cleanup_state['cancel_requested'] = True
-            
+        # Set cancel_requested in database
+        if _request_cancel(CleanupState):
             logger.info("Cleanup cancellation requested")
             return jsonify({'message': 'Cleanup cancellation requested'})
         else:
@@ -281,32 +431,17 @@ def cancel_cleanup():
 def reset_cleanup_state():
     """Force reset cleanup state in case of stuck operation"""
     try:
-        # Get any active cleanup records
-        active_cleanups = CleanupState.query.filter_by(is_active=True).all()
-        
-        # Mark them all as failed
-        for cleanup in active_cleanups:
-            cleanup.is_active = False
-            cleanup.phase = 'failed'
-            cleanup.end_time = datetime.now(timezone.utc)
-            cleanup.progress_message = 'Force reset by user'
+        # Mark any active cleanup records as failed in one statement
+        reset_count = CleanupState.query.filter_by(is_active=True).update({
+            CleanupState.is_active: False,
+            CleanupState.phase: 'failed',
+            CleanupState.end_time: datetime.now(timezone.utc),
+            CleanupState.progress_message: 'Force reset by user'
+        }, synchronize_session=False)
         
         db.session.commit()
         
-        # Reset in-memory state
-        with cleanup_state_lock:
-            cleanup_state.update({
-                'is_running': False,
-                'phase': 'idle',
-                'files_processed': 0,
-                'total_files': 0,
-                'orphaned_found': 0,
-                'progress_percentage': 0,
-                'start_time': None,
-                'cancel_requested': False
-            })
-        
-        logger.info("Cleanup state force reset")
+        logger.info(f"Cleanup state force reset ({reset_count} active records)")
         return jsonify({'message': 'Cleanup state reset successfully'})
         
     except Exception as e:
@@ -317,18 +452,8 @@ def reset_cleanup_state():
 def cancel_file_changes():
     """Cancel the current file changes check operation"""
     try:
-        file_changes_record = FileChangesState.query.order_by(FileChangesState.id.desc()).first()
-        
-        if file_changes_record and file_changes_record.is_active:
-            # Set cancel_requested in database
-            file_changes_record.cancel_requested = True
-            file_changes_record.progress_message = 'Cancellation requested...'
-            db.session.commit()
-            
-            # Also set in memory state
-            with file_changes_state_lock:
-                file_changes_state['cancel_requested'] = True
-            
+        # Set cancel_requested in database
+        if _request_cancel(FileChangesState):
             logger.info("File changes check cancellation requested")
             return jsonify({'message': 'File changes check cancellation requested'})
         else:
@@ -342,129 +467,93 @@ def cancel_file_changes():
 def reset_file_changes_state():
     """Force reset file changes state in case of stuck operation"""
     try:
-        # Get any active file changes records
-        active_file_changes = FileChangesState.query.filter_by(is_active=True).all()
-        
-        # Mark them all as failed
-        for file_change in active_file_changes:
-            file_change.is_active = False
-            file_change.phase = 'failed'
-            file_change.end_time = datetime.now(timezone.utc)
-            file_change.progress_message = 'Force reset by user'
+        # Mark any active file changes records as failed in one statement
+        reset_count = FileChangesState.query.filter_by(is_active=True).update({
+            FileChangesState.is_active: False,
+            FileChangesState.phase: 'failed',
+            FileChangesState.end_time: datetime.now(timezone.utc),
+            FileChangesState.progress_message: 'Force reset by user'
+        }, synchronize_session=False)
         
         db.session.commit()
         
-        # Reset in-memory state
-        with file_changes_state_lock:
-            file_changes_state.update({
-                'is_running': False,
-                'phase': 'idle',
-                'files_processed': 0,
-                'total_files': 0,
-                'changes_found': 0,
-                'corrupted_found': 0,
-                'progress_percentage': 0,
-                'start_time': None,
-                'cancel_requested': False
-            })
-        
-        logger.info("File changes state force reset")
+        logger.info(f"File changes state force reset ({reset_count} active records)")
         return jsonify({'message': 'File changes state reset successfully'})
         
     except Exception as e:
         logger.error(f"Error resetting file changes state: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def _claim_job(model, **values):
+    """Insert model's starting record unless one is already active, as a single statement.
+    
+    Returns the new record id, or None when a job of this kind is already running,
+    possibly started by another worker process.
+    """
+    claim = select(*(literal(value, getattr(model, field).type) for field, value in values.items())).where(
+        ~select(model.id).where(model.is_active == True).exists()
+    )
+    try:
+        record_id = db.session.execute(
+            insert(model).from_select(list(values), claim).returning(model.id)
+        ).scalar()
+        db.session.commit()
+    except IntegrityError:
+        # Under READ COMMITTED two claims can both pass NOT EXISTS; the one-active-row
+        # unique index rejects the second insert
+        db.session.rollback()
+        return None
+    return record_id
+
 @maintenance_bp.route('/cleanup-orphaned', methods=['POST'])
 def cleanup_orphaned_files():
     """Start cleanup of orphaned database entries"""
-    global current_cleanup_thread
-    
-    # Check if cleanup is already running
-    if current_cleanup_thread and current_cleanup_thread.is_alive():
-        return jsonify({'error': 'Cleanup operation already in progress'}), 409
-    
-    # Reset state
-    with cleanup_state_lock:
-        cleanup_state.update({
-            'is_running': True,
-            'phase': 'starting',
-            'files_processed': 0,
-            'total_files': 0,
-            'orphaned_found': 0,
-            'progress_percentage': 0,
-            'start_time': time.time(),
-            'cancel_requested': False
-        })
-    
-    # Create cleanup state in database
-    cleanup_record = CleanupState(
-        start_time=datetime.now(timezone.utc),
+    # Create cleanup state in database, unless a cleanup is already running
+    start_time = datetime.now(timezone.utc)
+    cleanup_id = _claim_job(
+        CleanupState,
+        start_time=start_time,
         is_active=True,
         phase='starting',
         phase_number=1
     )
-    db.session.add(cleanup_record)
-    db.session.commit()
+    if cleanup_id is None:
+        return jsonify({'error': 'Cleanup operation already in progress'}), 409
+    _job_clock[CleanupState] = (cleanup_id, time.monotonic(), start_time.timestamp())
     
-    # Start cleanup in background thread - capture app instance for thread context
+    # Start cleanup on the maintenance pool - capture app instance for thread context
     app = current_app._get_current_object()
-    current_cleanup_thread = threading.Thread(
-        target=cleanup_orphaned_async,
-        args=(app, cleanup_record.id,)
-    )
-    current_cleanup_thread.start()
+    _maintenance_pool.submit(cleanup_orphaned_async, app, cleanup_id)
     
     return jsonify({
         'status': 'started',
         'message': 'Cleanup operation started',
-        'cleanup_id': cleanup_record.id
+        'cleanup_id': cleanup_id
     })
 
 @maintenance_bp.route('/file-changes', methods=['GET', 'POST'])
 def check_file_changes():
     """Check for file changes since last scan"""
-    global current_file_changes_thread
-    
-    # Check if file changes check is already running
-    if current_file_changes_thread and current_file_changes_thread.is_alive():
-        return jsonify({'error': 'File changes check already in progress'}), 409
-    
     # Create unique check ID
     check_id = str(uuid.uuid4())
     
-    # Reset state
-    with file_changes_state_lock:
-        file_changes_state.update({
-            'is_running': True,
-            'phase': 'starting',
-            'files_processed': 0,
-            'total_files': 0,
-            'changes_found': 0,
-            'corrupted_found': 0,
-            'progress_percentage': 0,
-            'start_time': time.time(),
-            'cancel_requested': False
-        })
-    
-    # Create file changes state in database
-    file_changes_record = FileChangesState(
+    # Create file changes state in database, unless a check is already running
+    start_time = datetime.now(timezone.utc)
+    file_changes_id = _claim_job(
+        FileChangesState,
         check_id=check_id,
-        start_time=datetime.now(timezone.utc),
+        start_time=start_time,
         is_active=True,
         phase='starting',
         phase_number=1
     )
-    db.session.add(file_changes_record)
-    db.session.commit()
+    if file_changes_id is None:
+        return jsonify({'error': 'File changes check already in progress'}), 409
+    _job_clock[FileChangesState] = (file_changes_id, time.monotonic(), start_time.timestamp())
     
-    # Start file changes check in background thread - capture app instance for thread context
+    # Start file changes check on the maintenance pool - capture app instance for thread context
     app = current_app._get_current_object()
-    current_file_changes_thread = threading.Thread(
-        target=check_file_changes_async,
-        args=(app, check_id,)
-    )
-    current_file_changes_thread.start()
+    _maintenance_pool.submit(check_file_changes_async, app, check_id)
     
     return jsonify({
         'status': 'started',
@@ -472,105 +561,131 @@ def check_file_changes():
         'check_id': check_id
     })
 
+@lru_cache(maxsize=1)
+def _get_maintenance_service(database_uri):
+    """MaintenanceService shared by background jobs; progress and cancellation live in the database"""
+    return MaintenanceService(database_uri)
+
 def cleanup_orphaned_async(app, cleanup_id):
     """Async function to cleanup orphaned database entries"""
+    # One app context for the whole job, error handling included
+    ctx = app.app_context()
+    ctx.push()
     try:
-        with app.app_context():
-            with db.session.get_bind().connect() as connection:
-                with db.session():
-                    # Get the cleanup record
-                    cleanup_record = CleanupState.query.get(cleanup_id)
-                    if not cleanup_record:
-                        logger.error(f"Cleanup record {cleanup_id} not found")
-                        return
-                    
-                    # Create maintenance service instance
-                    database_url = os.environ.get('DATABASE_URL', 'sqlite:///media_checker.db')
-                    maintenance_service = MaintenanceService(database_url)
-                    
-                    # Run the cleanup using the maintenance service logic
-                    maintenance_service._run_cleanup(cleanup_record.id)
-                
+        # Get the cleanup record
+        cleanup_record = db.session.get(CleanupState, cleanup_id)
+        if not cleanup_record:
+            logger.error(f"Cleanup record {cleanup_id} not found")
+            return
+        
+        # Reuse the shared maintenance service instance
+        maintenance_service = _get_maintenance_service(app.config['SQLALCHEMY_DATABASE_URI'])
+        
+        # Run the cleanup using the maintenance service logic
+        maintenance_service._run_cleanup(cleanup_record.id)
+        
     except Exception as e:
         logger.error(f"Error in cleanup_orphaned_async: {str(e)}")
         try:
-            with app.app_context():
-                cleanup_record = CleanupState.query.get(cleanup_id)
-                if cleanup_record:
-                    cleanup_record.phase = 'error'
-                    cleanup_record.progress_message = f'Error: {str(e)}'
-                    cleanup_record.is_active = False
-                    cleanup_record.end_time = datetime.now(timezone.utc)
-                    db.session.commit()
+            # Discard whatever the failed job left in the session before recording the error
+            db.session.rollback()
+            cleanup_record = db.session.get(CleanupState, cleanup_id)
+            if cleanup_record:
+                cleanup_record.phase = 'error'
+                cleanup_record.progress_message = f'Error: {str(e)}'
+                cleanup_record.is_active = False
+                cleanup_record.end_time = datetime.now(timezone.utc)
+                db.session.commit()
         except Exception as commit_error:
             logger.error(f"Failed to update cleanup record on error: {str(commit_error)}")
+    finally:
+        ctx.pop()
 
 def check_file_changes_async(app, check_id):
     """Async function to check file changes"""
+    # One app context for the whole job, error handling included
+    ctx = app.app_context()
+    ctx.push()
     try:
-        with app.app_context():
-            with db.session.get_bind().connect() as connection:
-                with db.session():
-                    # Get the file changes record
-                    check_record = FileChangesState.query.filter_by(check_id=check_id).first()
-                    if not check_record:
-                        logger.error(f"File changes record {check_id} not found")
-                        return
-                    
-                    # Create maintenance service instance
-                    database_url = os.environ.get('DATABASE_URL', 'sqlite:///media_checker.db')
-                    maintenance_service = MaintenanceService(database_url)
-                    
-                    # Run the file changes check using the maintenance service logic
-                    maintenance_service._run_file_changes_check(check_record.check_id)
-                
+        # Get the file changes record
+        check_record = FileChangesState.query.filter_by(check_id=check_id).first()
+        if not check_record:
+            logger.error(f"File changes record {check_id} not found")
+            return
+        
+        # Reuse the shared maintenance service instance
+        maintenance_service = _get_maintenance_service(app.config['SQLALCHEMY_DATABASE_URI'])
+        
+        # Run the file changes check using the maintenance service logic
+        maintenance_service._run_file_changes_check(check_record.check_id)
+        
     except Exception as e:
         logger.error(f"Error in check_file_changes_async: {str(e)}")
         try:
-            with app.app_context():
-                check_record = FileChangesState.query.filter_by(check_id=check_id).first()
-                if check_record:
-                    check_record.phase = 'error'
-                    check_record.progress_message = f'Error: {str(e)}'
-                    check_record.is_active = False
-                    check_record.end_time = datetime.now(timezone.utc)
-                    db.session.commit()
+            # Discard whatever the failed job left in the session before recording the error
+            db.session.rollback()
+            check_record = FileChangesState.query.filter_by(check_id=check_id).first()
+            if check_record:
+                check_record.phase = 'error'
+                check_record.progress_message = f'Error: {str(e)}'
+                check_record.is_active = False
+                check_record.end_time = datetime.now(timezone.utc)
+                db.session.commit()
         except Exception as commit_error:
             logger.error(f"Failed to update file changes record on error: {str(commit_error)}")
+    finally:
+        ctx.pop()
+
+def _file_size(path):
+    """Size of path in bytes, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_size
+    except (FileNotFoundError, ValueError):
+        return 0
 
 @maintenance_bp.route('/vacuum', methods=['POST'])
 def vacuum_database():
     """Vacuum the SQLite database to optimize storage"""
     try:
-        # Only works with SQLite databases
-        database_url = os.environ.get('DATABASE_URL', 'sqlite:///media_checker.db')
-        if not database_url.startswith('sqlite:'):
+        # Only works with SQLite databases; use the engine's parsed URL rather than re-reading the environment
+        database_url = db.engine.url
+        if database_url.get_backend_name() != 'sqlite':
             return jsonify({'error': 'VACUUM operation only supported for SQLite databases'}), 400
         
         # Get database size before vacuum
-        db_file_path = database_url.replace('sqlite:///', '')
-        if os.path.exists(db_file_path):
-            size_before = os.path.getsize(db_file_path)
-        else:
-            size_before = 0
+        db_file_path = database_url.database or ''
+        size_before = _file_size(db_file_path)
         
-        # Execute VACUUM command
-        from sqlalchemy import text
-        result = db.session.execute(text('VACUUM;'))
-        db.session.commit()
+        # VACUUM cannot run inside a transaction, so use a dedicated autocommit connection
+        # rather than the ORM session, which may have a BEGIN pending
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            # Fold the WAL back into the main file first so its pages are not carried along
+            conn.exec_driver_sql('PRAGMA wal_checkpoint(TRUNCATE)')
+            
+            # auto_vacuum=INCREMENTAL (2) databases can release free pages in place;
+            # anything else needs a full VACUUM rewrite
+            if conn.exec_driver_sql('PRAGMA auto_vacuum').scalar() == 2:
+                vacuum_mode = 'incremental'
+                # sqlite3's execute() steps a statement only once, which frees a single page;
+                # executescript() runs it to completion
+                conn.connection.driver_connection.executescript('PRAGMA incremental_vacuum;')
+            else:
+                vacuum_mode = 'full'
+                conn.exec_driver_sql('VACUUM')
+            
+            # In WAL mode the shrink only reaches the main file at the next checkpoint
+            conn.exec_driver_sql('PRAGMA wal_checkpoint(TRUNCATE)')
         
         # Get database size after vacuum
-        if os.path.exists(db_file_path):
-            size_after = os.path.getsize(db_file_path)
-        else:
-            size_after = 0
+        size_after = _file_size(db_file_path)
         
         bytes_freed = size_before - size_after
         
-        logger.info(f"Database vacuum completed. Size before: {size_before} bytes, after: {size_after} bytes, freed: {bytes_freed} bytes")
+        logger.info(f"Database {vacuum_mode} vacuum completed. Size before: {size_before} bytes, after: {size_after} bytes, freed: {bytes_freed} bytes")
         
         return jsonify({
             'message': 'Database vacuum completed successfully',
+            'vacuum_mode': vacuum_mode,
             'size_before_bytes': size_before,
             'size_after_bytes': size_after,
             'bytes_freed': bytes_freed,
@@ -579,4 +694,6 @@ def vacuum_database():
         
     except Exception as e:
         logger.error(f"Error vacuuming database: {str(e)}")
-        return jsonify({'error': f'Failed to vacuum database: {str(e)}'}), 500
\ No newline at end of file
+        return jsonify({'error': f'Failed to vacuum database: {str(e)}'}), 500
+
+register_rate_limits(maintenance_bp)
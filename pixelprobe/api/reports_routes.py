@@ -1,26 +1,189 @@
-from flask import Blueprint, request, jsonify, send_file, make_response
+from flask import Blueprint, request, jsonify, send_file, make_response, Response, stream_with_context
 import os
-import json
+import orjson
 import logging
 from datetime import datetime, timezone
 from io import BytesIO
+from functools import lru_cache
+from types import SimpleNamespace
 import base64
-import pytz
+import re
 
-from models import db, ScanReport
+from markupsafe import escape
+from sqlalchemy import func, tuple_
+
+from models import db, ScanReport, ScanResult
+from pixelprobe.utils.helpers import get_timezone
 from pixelprobe.utils.security import validate_json_input
 
 logger = logging.getLogger(__name__)
 
-# Get timezone from environment variable, default to UTC
-APP_TIMEZONE = os.environ.get('TZ', 'UTC')
+reports_bp = Blueprint('reports', __name__, url_prefix='/api')
+
+# ScanResult columns the report file tables read; rows are fetched as plain tuples rather than entities
+_REPORT_FILE_COLUMNS = (
+    ScanResult.file_path, ScanResult.file_size, ScanResult.file_type, ScanResult.scan_date,
+    ScanResult.is_corrupted, ScanResult.marked_as_good, ScanResult.has_warnings,
+    ScanResult.corruption_details, ScanResult.warning_details, ScanResult.error_message,
+    ScanResult.scan_tool
+)
+
+# First ffmpeg output line describing the stream, shown in the generated PDF's details column
+_STREAM_SUMMARY_RE = re.compile(r'^.*(?:Video stream:|Duration:).*$', re.MULTILINE)
+
+def _format_mb(size):
+    """File size in megabytes with two decimals, or 'N/A' when unknown"""
+    return f"{size / (1024*1024):.2f} MB" if size else 'N/A'
+
+def _result_status(result):
+    """Status label for a scan result row; marking a file as good clears both problem states"""
+    if result.marked_as_good:
+        return 'Healthy'
+    if result.has_warnings:
+        return 'Warning'
+    return 'Corrupted' if result.is_corrupted else 'Healthy'
+
+def _result_details(result):
+    """Corruption details, warnings and the stream summary from the scan output, space separated"""
+    details = [text for text in (result.corruption_details, result.warning_details) if text]
+    if result.scan_output and 'Video stream:' in result.scan_output:
+        summary = _STREAM_SUMMARY_RE.search(result.scan_output)
+        if summary:
+            details.append(summary.group(0).strip())
+    return ' '.join(details)
+
+# Logo embedded at the top of report PDFs, read once at import rather than per request
+_LOGO_PATH = os.path.join(os.path.dirname(__file__), '../../static/images/pixelprobe-logo.png')
 try:
-    tz = pytz.timezone(APP_TIMEZONE)
-except pytz.exceptions.UnknownTimeZoneError:
-    tz = pytz.UTC
-    logger.warning(f"Unknown timezone '{APP_TIMEZONE}', falling back to UTC")
+    with open(_LOGO_PATH, 'rb') as _logo_file:
+        _LOGO_BYTES = _logo_file.read()
+except OSError:
+    _LOGO_BYTES = None
 
-reports_bp = Blueprint('reports', __name__, url_prefix='/api')
+# Rows shown in a report PDF's file table
+REPORT_FILE_LIMIT = 500
+
+def _scanned_files(report):
+    """First REPORT_FILE_LIMIT files scanned during report's window, by path, and the window's total
+    
+    The total only needs a COUNT when the listing was cut off.
+    """
+    period = (
+        ScanResult.scan_date >= report.start_time,
+        ScanResult.scan_date <= (report.end_time or datetime.now(timezone.utc))
+    )
+    files = db.session.query(*_REPORT_FILE_COLUMNS).filter(*period).order_by(
+        ScanResult.file_path
+    ).limit(REPORT_FILE_LIMIT).all()
+    total = len(files)
+    if total == REPORT_FILE_LIMIT:
+        total = db.session.query(func.count(ScanResult.id)).filter(*period).scalar()
+    return files, total
+
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """Paragraph and table styles shared by every report PDF, built on first use
+    
+    reportlab is optional, so this raises ImportError when it is not installed.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.platypus import TableStyle
+    
+    # PixelProbe color scheme
+    primary_green = colors.HexColor('#1ce783')
+    primary_black = colors.HexColor('#040405')
+    gradient_end = colors.HexColor('#183949')
+    row_backgrounds = [colors.white, colors.HexColor('#f8f9fa')]
+    sheet = getSampleStyleSheet()
+    
+    return SimpleNamespace(
+        sheet=sheet,
+        # Scan results / bulk report PDFs
+        title=ParagraphStyle('CustomTitle', parent=sheet['Heading1'], fontSize=24,
+                             textColor=primary_black, spaceAfter=30, alignment=TA_CENTER),
+        cell=ParagraphStyle('CellStyle', parent=sheet['Normal'], fontSize=6, leading=7),
+        results_table=TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 0), (-1, 0), primary_green),
+            ('TEXTCOLOR', (0, 0), (-1, 0), primary_black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), row_backgrounds),
+            ('PADDING', (0, 0), (-1, -1), 4),
+        ]),
+        summary_table=TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 0), (-1, 0), primary_green),
+            ('TEXTCOLOR', (0, 0), (-1, 0), primary_black),
+        ]),
+        # Single scan report PDF
+        report_title=ParagraphStyle('CustomTitle', parent=sheet['Heading1'], fontSize=16,
+                                    textColor=primary_black, spaceAfter=8, alignment=TA_CENTER),
+        heading=ParagraphStyle('CustomHeading', parent=sheet['Heading2'], fontSize=12,
+                               textColor=gradient_end, spaceAfter=6),
+        footer=ParagraphStyle('Footer', parent=sheet['Normal'], fontSize=8,
+                              textColor=colors.HexColor('#7f8c8d'), alignment=TA_CENTER),
+        info_table=TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
+            ('PADDING', (0, 0), (-1, -1), 4),
+        ]),
+        stats_table=TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 0), (-1, 0), primary_green),
+            ('TEXTCOLOR', (0, 0), (-1, 0), primary_black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), row_backgrounds),
+            ('PADDING', (0, 0), (-1, -1), 4),
+        ]),
+        files_table=TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('LEADING', (0, 1), (-1, -1), 10),  # Line spacing for the pre-wrapped path and details cells
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left align file paths
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),  # Top align all cells
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 0), (-1, 0), gradient_end),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), row_backgrounds),
+            ('PADDING', (0, 0), (-1, -1), 4),
+        ]),
+    )
+
+def _wrap_cell(text, width, font_name='Helvetica', font_size=8):
+    """Text broken into lines no wider than width points, splitting between any two characters so long paths wrap"""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    
+    text = ' '.join(text.split())
+    lines = []
+    start = 0
+    line_width = 0
+    for i, char in enumerate(text):
+        char_width = stringWidth(char, font_name, font_size)
+        if line_width + char_width > width and i > start:
+            lines.append(text[start:i])
+            start, line_width = i, 0
+        line_width += char_width
+    lines.append(text[start:])
+    return '\n'.join(lines)
 
 def convert_to_timezone(dt):
     """Convert datetime to configured timezone"""
@@ -29,10 +192,106 @@ def convert_to_timezone(dt):
     
     # If datetime is naive, assume it's UTC
     if dt.tzinfo is None:
-        dt = pytz.UTC.localize(dt)
+        dt = dt.replace(tzinfo=timezone.utc)
     
     # Convert to configured timezone
-    return dt.astimezone(tz).isoformat()
+    return dt.astimezone(get_timezone()).isoformat()
+
+@lru_cache(maxsize=4096)
+def _format_duration(total_seconds):
+    """Human-readable duration such as '1h 2m 3s' for a whole number of seconds"""
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+def _encode_report_cursor(report):
+    """Opaque keyset cursor pointing just past report in start_time/id order"""
+    return base64.urlsafe_b64encode(orjson.dumps([report.start_time.isoformat(), report.id])).decode()
+
+def _decode_report_cursor(cursor):
+    """(start_time, id) from a cursor produced by _encode_report_cursor"""
+    start_time, report_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+    return datetime.fromisoformat(start_time), int(report_id)
+
+def _scan_summary(report):
+    """Summary block for full, deep and rescan reports"""
+    files_scanned = report.files_scanned
+    files_corrupted = report.files_corrupted
+    return {
+        'total_files': files_scanned,
+        'new_files': report.files_added,
+        'updated_files': report.files_updated,
+        'corrupted_files': files_corrupted,
+        'files_with_warnings': report.files_with_warnings,
+        'error_files': report.files_error,
+        'success_rate': round((1 - (files_corrupted / files_scanned)) * 100, 2) if files_scanned > 0 else 100
+    }
+
+def _cleanup_summary(report):
+    """Summary block for cleanup reports"""
+    found = report.orphaned_records_found
+    deleted = report.orphaned_records_deleted
+    return {
+        'orphaned_found': found,
+        'orphaned_deleted': deleted,
+        'cleanup_rate': round((deleted / found) * 100, 2) if found > 0 else 0
+    }
+
+def _file_changes_summary(report):
+    """Summary block for file changes reports"""
+    return {
+        'files_changed': report.files_changed,
+        'new_corruptions': report.files_corrupted_new,
+        'total_files_checked': report.files_scanned
+    }
+
+# Summary builder per scan_type; types without an entry get no summary block
+_SUMMARY_BUILDERS = {
+    'full_scan': _scan_summary,
+    'rescan': _scan_summary,
+    'deep_scan': _scan_summary,
+    'cleanup': _cleanup_summary,
+    'file_changes': _file_changes_summary
+}
+
+# Report statuses after which a report row no longer changes
+_FINAL_REPORT_STATUSES = frozenset({'completed', 'error', 'cancelled'})
+
+def _report_validators(report):
+    """(ETag, Last-Modified) for a finished report, or None while it can still change"""
+    if report.status not in _FINAL_REPORT_STATUSES or report.end_time is None:
+        return None
+    end_time = report.end_time if report.end_time.tzinfo else report.end_time.replace(tzinfo=timezone.utc)
+    return f"{report.report_id}:{int(end_time.timestamp())}", end_time.replace(microsecond=0)
+
+def _report_not_modified(report):
+    """304 response when the client's cached copy of a finished report is still current, else None"""
+    validators = _report_validators(report)
+    if validators is None:
+        return None
+    etag, last_modified = validators
+    
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+    if request.if_none_match:
+        fresh = etag in request.if_none_match
+    else:
+        fresh = request.if_modified_since is not None and request.if_modified_since >= last_modified
+    return _with_report_validators(Response(status=304), report) if fresh else None
+
+def _with_report_validators(response, report):
+    """Tag a report response with ETag/Last-Modified once the report is finished"""
+    validators = _report_validators(report)
+    if validators:
+        etag, last_modified = validators
+        response.set_etag(etag)
+        response.last_modified = last_modified
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @reports_bp.route('/scan-reports')
 def get_scan_reports():
@@ -42,6 +301,7 @@ def get_scan_reports():
     scan_type = request.args.get('scan_type', 'all')
     status = request.args.get('status', 'all')
     sort_order = request.args.get('sort_order', 'desc')
+    cursor = request.args.get('cursor')
     
     # Build query
     query = ScanReport.query
@@ -53,18 +313,36 @@ def get_scan_reports():
     if status != 'all':
         query = query.filter_by(status=status)
     
-    # Apply sorting (always by start_time)
-    if sort_order.lower() == 'asc':
-        query = query.order_by(ScanReport.start_time.asc())
+    # Apply sorting (always by start_time, id breaks ties so cursors are stable)
+    ascending = sort_order.lower() == 'asc'
+    if ascending:
+        query = query.order_by(ScanReport.start_time.asc(), ScanReport.id.asc())
     else:
-        query = query.order_by(ScanReport.start_time.desc())
+        query = query.order_by(ScanReport.start_time.desc(), ScanReport.id.desc())
     
-    # Paginate
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Clients walking pages in order pass back next_cursor; numbered pages remain for the reports table
+    if cursor:
+        try:
+            last_key = tuple_(*_decode_report_cursor(cursor))
+        except (ValueError, TypeError):
+            return jsonify({'error': 'Invalid cursor'}), 400
+        
+        # Seek past the previous page on the (start_time, id) index instead of counting and offsetting
+        sort_key = tuple_(ScanReport.start_time, ScanReport.id)
+        query = query.filter(sort_key > last_key if ascending else sort_key < last_key)
+        items = query.limit(per_page + 1).all()
+        has_next = len(items) > per_page
+        items = items[:per_page]
+        pagination = None
+    else:
+        # Paginate
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        items = pagination.items
+        has_next = pagination.has_next
     
     # Build response
     reports = []
-    for report in pagination.items:
+    for report in items:
         report_dict = report.to_dict()
         
         # Convert timestamps to configured timezone
@@ -73,28 +351,26 @@ def get_scan_reports():
         report_dict['created_at'] = convert_to_timezone(report.created_at)
         
         # Add human-readable duration
-        if report.duration_seconds:
-            hours = int(report.duration_seconds // 3600)
-            minutes = int((report.duration_seconds % 3600) // 60)
-            seconds = int(report.duration_seconds % 60)
-            
-            if hours > 0:
-                report_dict['duration_formatted'] = f"{hours}h {minutes}m {seconds}s"
-            elif minutes > 0:
-                report_dict['duration_formatted'] = f"{minutes}m {seconds}s"
-            else:
-                report_dict['duration_formatted'] = f"{seconds}s"
-        else:
-            report_dict['duration_formatted'] = 'N/A'
+        report_dict['duration_formatted'] = _format_duration(int(report.duration_seconds)) if report.duration_seconds else 'N/A'
         
         reports.append(report_dict)
     
+    next_cursor = _encode_report_cursor(items[-1]) if has_next and items else None
+    
+    if pagination is None:
+        return jsonify({
+            'reports': reports,
+            'per_page': per_page,
+            'next_cursor': next_cursor
+        })
+    
     return jsonify({
         'reports': reports,
         'total': pagination.total,
         'page': page,
         'per_page': per_page,
-        'pages': pagination.pages
+        'pages': pagination.pages,
+        'next_cursor': next_cursor
     })
 
 @reports_bp.route('/scan-reports/<report_id>')
@@ -104,6 +380,11 @@ def get_scan_report(report_id):
     if not report:
         return jsonify({'error': 'Report not found'}), 404
     
+    # Finished reports never change, so a matching conditional request skips serialization
+    not_modified = _report_not_modified(report)
+    if not_modified:
+        return not_modified
+    
     report_dict = report.to_dict()
     
     # Convert timestamps to configured timezone
@@ -113,42 +394,14 @@ def get_scan_report(report_id):
     
     # Add additional computed fields
     if report.duration_seconds:
-        hours = int(report.duration_seconds // 3600)
-        minutes = int((report.duration_seconds % 3600) // 60)
-        seconds = int(report.duration_seconds % 60)
-        
-        if hours > 0:
-            report_dict['duration_formatted'] = f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            report_dict['duration_formatted'] = f"{minutes}m {seconds}s"
-        else:
-            report_dict['duration_formatted'] = f"{seconds}s"
+        report_dict['duration_formatted'] = _format_duration(int(report.duration_seconds))
     
     # Add summary statistics
-    if report.scan_type in ['full_scan', 'rescan', 'deep_scan']:
-        report_dict['summary'] = {
-            'total_files': report.files_scanned,
-            'new_files': report.files_added,
-            'updated_files': report.files_updated,
-            'corrupted_files': report.files_corrupted,
-            'files_with_warnings': report.files_with_warnings,
-            'error_files': report.files_error,
-            'success_rate': round((1 - (report.files_corrupted / report.files_scanned)) * 100, 2) if report.files_scanned > 0 else 100
-        }
-    elif report.scan_type == 'cleanup':
-        report_dict['summary'] = {
-            'orphaned_found': report.orphaned_records_found,
-            'orphaned_deleted': report.orphaned_records_deleted,
-            'cleanup_rate': round((report.orphaned_records_deleted / report.orphaned_records_found) * 100, 2) if report.orphaned_records_found > 0 else 0
-        }
-    elif report.scan_type == 'file_changes':
-        report_dict['summary'] = {
-            'files_changed': report.files_changed,
-            'new_corruptions': report.files_corrupted_new,
-            'total_files_checked': report.files_scanned
-        }
+    build_summary = _SUMMARY_BUILDERS.get(report.scan_type)
+    if build_summary:
+        report_dict['summary'] = build_summary(report)
     
-    return jsonify(report_dict)
+    return _with_report_validators(jsonify(report_dict), report)
 
 @reports_bp.route('/scan-reports/<report_id>/export')
 def export_scan_report(report_id):
@@ -157,6 +410,11 @@ def export_scan_report(report_id):
     if not report:
         return jsonify({'error': 'Report not found'}), 404
     
+    # Finished reports never change, so a matching conditional request skips serialization
+    not_modified = _report_not_modified(report)
+    if not_modified:
+        return not_modified
+    
     report_dict = report.to_dict()
     
     # Convert timestamps to configured timezone
@@ -172,25 +430,22 @@ def export_scan_report(report_id):
     }
     
     # Create JSON file
-    json_data = json.dumps(report_dict, indent=2)
+    json_data = orjson.dumps(report_dict, option=orjson.OPT_INDENT_2)
     
     # Create response
     response = make_response(json_data)
     response.headers['Content-Type'] = 'application/json'
     response.headers['Content-Disposition'] = f'attachment; filename=scan_report_{report_id}_{report.start_time.strftime("%Y%m%d_%H%M%S")}.json'
     
-    return response
+    return _with_report_validators(response, report)
 
 @reports_bp.route('/generate-pdf-report/<scan_type>/<scan_id>')
 def generate_pdf_report(scan_type, scan_id):
     """Generate PDF report for scan results with tool and details"""
     try:
-        from reportlab.lib import colors
         from reportlab.lib.pagesizes import letter, landscape
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer, Image, PageBreak
         from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_CENTER
         
         # Create PDF buffer
         buffer = BytesIO()
@@ -201,37 +456,19 @@ def generate_pdf_report(scan_type, scan_id):
         # Container for the 'Flowable' objects
         elements = []
         
-        # Define styles with PixelProbe color scheme
-        styles = getSampleStyleSheet()
-        primary_green = colors.HexColor('#1ce783')
-        primary_black = colors.HexColor('#040405')
-        gradient_end = colors.HexColor('#183949')
-        
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=primary_black,
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        # Create styles for wrapping text in table cells
-        cell_style = ParagraphStyle(
-            'CellStyle',
-            parent=styles['Normal'],
-            fontSize=6,
-            leading=7
-        )
+        # Shared PixelProbe styles
+        pdf_styles = _pdf_styles()
+        styles = pdf_styles.sheet
+        title_style = pdf_styles.title
+        cell_style = pdf_styles.cell
         
         # Add logo and title
         try:
-            logo_path = os.path.join(os.path.dirname(__file__), '../../static/images/pixelprobe-logo.png')
-            if os.path.exists(logo_path):
+            if _LOGO_BYTES:
                 # Logo is 670x729 pixels, maintain aspect ratio
                 logo_width = 1.5*inch
                 logo_height = logo_width * (729.0/670.0)  # Maintain aspect ratio
-                logo = Image(logo_path, width=logo_width, height=logo_height)
+                logo = Image(BytesIO(_LOGO_BYTES), width=logo_width, height=logo_height)
                 logo.hAlign = 'CENTER'
                 elements.append(logo)
                 elements.append(Spacer(1, 0.2*inch))
@@ -249,112 +486,61 @@ def generate_pdf_report(scan_type, scan_id):
         elements.append(Paragraph(info_text, styles['Normal']))
         elements.append(Spacer(1, 0.2*inch))
         
-        # Query scan results based on scan type
-        from models import ScanResult
+        # Query scan results based on scan type; scan_output is only read here, for the stream summary
+        query = db.session.query(*_REPORT_FILE_COLUMNS, ScanResult.scan_output)
         if scan_type == 'rescan' and '_' in scan_id:
             # For rescan, parse the file path from scan_id
             file_path = scan_id.replace('_', '/')
-            results = ScanResult.query.filter_by(file_path=file_path).all()
+            results = query.filter(ScanResult.file_path == file_path).all()
         else:
             # For other scan types, get recent results
-            results = ScanResult.query.filter(
+            results = query.filter(
                 ScanResult.scan_date.isnot(None)
-            ).order_by(ScanResult.scan_date.desc()).limit(500).all()
+            ).order_by(ScanResult.scan_date.desc()).limit(REPORT_FILE_LIMIT).all()
         
         if not results:
             elements.append(Paragraph("No scan results found.", styles['Normal']))
         else:
-            # Create table header with all required fields
-            table_data = [['Status', 'File Path', 'Size', 'Type', 'Tool', 'Details', 'Scan Date']]
-            
-            for result in results:
-                # Determine status
-                status = 'Corrupted' if result.is_corrupted and not result.marked_as_good else 'Healthy'
-                if getattr(result, 'has_warnings', False) and not result.marked_as_good:
-                    status = 'Warning'
-                
-                # Format file size
-                size = f"{result.file_size / (1024*1024):.2f} MB" if result.file_size else 'N/A'
-                
-                # Get file type
-                file_type = result.file_type or 'Unknown'
-                
-                # Get scan tool - use actual tool from database
-                scan_tool = getattr(result, 'scan_tool', None) or 'N/A'
-                
-                # Get details - combine corruption details, warnings, and scan output
-                details = []
-                if result.corruption_details:
-                    details.append(result.corruption_details)
-                if getattr(result, 'warning_details', None):
-                    details.append(getattr(result, 'warning_details', ''))
-                if getattr(result, 'scan_output', None):
-                    # Extract key information from scan output
-                    scan_output = getattr(result, 'scan_output', '')
-                    if 'Video stream:' in scan_output:
-                        for line in scan_output.split('\\n'):
-                            if 'Video stream:' in line or 'Duration:' in line:
-                                details.append(line.strip())
-                                break
-                
-                details_text = ' '.join(details) if details else ''
-                
-                # Format scan date
-                scan_date = result.scan_date.strftime('%m/%d/%Y, %I:%M:%S %p') if result.scan_date else 'N/A'
-                
-                # Wrap file path and details in Paragraph for proper text wrapping
-                file_path_para = Paragraph(result.file_path, cell_style)
-                details_para = Paragraph(details_text, cell_style)
-                
-                table_data.append([
-                    status,
-                    file_path_para,
-                    size,
-                    file_type,
-                    scan_tool,
-                    details_para,
-                    scan_date
-                ])
+            # One row per result: file path and details are Paragraphs so they wrap
+            table_data = [['Status', 'File Path', 'Size', 'Type', 'Tool', 'Details', 'Scan Date']] + [
+                [
+                    _result_status(result),
+                    Paragraph(result.file_path, cell_style),
+                    _format_mb(result.file_size),
+                    result.file_type or 'Unknown',
+                    result.scan_tool or 'N/A',
+                    Paragraph(_result_details(result), cell_style),
+                    result.scan_date.strftime('%m/%d/%Y, %I:%M:%S %p') if result.scan_date else 'N/A'
+                ]
+                for result in results
+            ]
             
             # Create table with proper column widths adjusted for landscape
             # Total width = 11 inches (landscape) - 1 inch margins = 10 inches available
             table = Table(table_data, colWidths=[0.6*inch, 3.2*inch, 0.6*inch, 0.7*inch, 0.6*inch, 2.3*inch, 1.0*inch])
-            table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (-1, 0), primary_green),
-                ('TEXTCOLOR', (0, 0), (-1, 0), primary_black),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-                ('PADDING', (0, 0), (-1, -1), 4),
-            ]))
+            table.setStyle(pdf_styles.results_table)
             
             elements.append(table)
             
-            if len(results) >= 500:
+            if len(results) >= REPORT_FILE_LIMIT:
                 elements.append(Spacer(1, 0.1*inch))
-                elements.append(Paragraph("Note: Showing first 500 results", styles['Normal']))
+                elements.append(Paragraph(f"Note: Showing first {REPORT_FILE_LIMIT} results", styles['Normal']))
         
         # Build PDF
         doc.build(elements)
         
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
         # Create filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"scan_report_{scan_type}_{scan_id}_{timestamp}.pdf"
         
-        # Create response
-        response = make_response(pdf_data)
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename={filename}'
-        
-        return response
+        # Send the buffer itself rather than a copy of its bytes
+        buffer.seek(0)
+        return send_file(
+            buffer,
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=filename
+        )
         
     except ImportError:
         logger.error("reportlab not installed for PDF export")
@@ -363,6 +549,115 @@ def generate_pdf_report(scan_type, scan_id):
         logger.error(f"Error generating PDF report: {e}")
         return jsonify({'error': f'Failed to generate PDF: {str(e)}'}), 500
 
+# One file row of the printable HTML report
+_HTML_FILE_ROW = """
+                <tr>
+                    <td style="max-width: 400px; overflow: hidden; text-overflow: ellipsis;">{path}</td>
+                    <td><span class="{status_class}">{status}</span></td>
+                    <td>{size}</td>
+                    <td>{file_type}</td>
+                    <td>{scan_date}</td>
+                </tr>
+            """
+
+def _html_report(report):
+    """Printable HTML version of a scan report, yielded a section or file row at a time"""
+    yield f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Scan Report {escape(report.report_id)}</title>
+        <style>
+            body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f8f9fa; }}
+            h1 {{ color: #040405; text-align: center; }}
+            h2 {{ color: #183949; margin-top: 30px; }}
+            table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
+            th, td {{ border: 1px solid #dee2e6; padding: 8px; text-align: left; }}
+            th {{ background-color: #1ce783; color: #040405; }}
+            tr:nth-child(even) {{ background-color: #f8f9fa; }}
+            .footer {{ text-align: center; margin-top: 50px; font-size: 12px; color: #6c757d; }}
+            .logo {{ text-align: center; margin-bottom: 20px; }}
+        </style>
+    </head>
+    <body>
+        <h1>PixelProbe Scan Report</h1>
+        
+        <h2>Report Information</h2>
+        <table>
+            <tr><th>Report ID</th><td>{escape(report.report_id)}</td></tr>
+            <tr><th>Scan Type</th><td>{escape(report.scan_type.replace('_', ' ').title())}</td></tr>
+            <tr><th>Status</th><td>{escape(report.status.title())}</td></tr>
+            <tr><th>Start Time</th><td>{report.start_time.strftime('%Y-%m-%d %H:%M:%S UTC') if report.start_time else 'N/A'}</td></tr>
+            <tr><th>End Time</th><td>{report.end_time.strftime('%Y-%m-%d %H:%M:%S UTC') if report.end_time else 'N/A'}</td></tr>
+            <tr><th>Duration</th><td>{f"{int(report.duration_seconds // 60)}m {int(report.duration_seconds % 60)}s" if report.duration_seconds else 'N/A'}</td></tr>
+        </table>
+        
+        <h2>Scan Statistics</h2>
+        <table>
+    """
+    
+    if report.scan_type in ['full_scan', 'rescan', 'deep_scan']:
+        yield f"""
+            <tr><th>Total Files Discovered</th><td>{report.total_files_discovered:,}</td></tr>
+            <tr><th>Files Scanned</th><td>{report.files_scanned:,}</td></tr>
+            <tr><th>New Files Added</th><td>{report.files_added:,}</td></tr>
+            <tr><th>Files Updated</th><td>{report.files_updated:,}</td></tr>
+            <tr><th>Corrupted Files</th><td>{report.files_corrupted:,}</td></tr>
+            <tr><th>Files with Warnings</th><td>{report.files_with_warnings:,}</td></tr>
+            <tr><th>Files with Errors</th><td>{report.files_error:,}</td></tr>
+        """
+    elif report.scan_type == 'cleanup':
+        yield f"""
+            <tr><th>Orphaned Records Found</th><td>{report.orphaned_records_found:,}</td></tr>
+            <tr><th>Orphaned Records Deleted</th><td>{report.orphaned_records_deleted:,}</td></tr>
+        """
+    
+    yield """
+        </table>
+        """
+    
+    # Add scanned files list for scan reports
+    if report.scan_type in ['full_scan', 'rescan', 'deep_scan']:
+        scanned_files, total_files = _scanned_files(report)
+        
+        yield f"""
+            <h2>Scanned Files ({total_files} files)</h2>
+            <table>
+                <tr>
+                    <th>File Path</th>
+                    <th>Status</th>
+                    <th>Size</th>
+                    <th>Type</th>
+                    <th>Scan Date</th>
+                </tr>
+        """
+        
+        for file in scanned_files:
+            corrupted = file.is_corrupted and not file.marked_as_good
+            # Paths and types come from the filesystem, so escape them before they reach the markup
+            yield _HTML_FILE_ROW.format(
+                path=escape(file.file_path),
+                status_class='corrupted' if corrupted else 'healthy',
+                status='Corrupted' if corrupted else 'Healthy',
+                size=escape(_format_mb(file.file_size)),
+                file_type=escape(file.file_type or 'Unknown'),
+                scan_date=escape(file.scan_date.strftime('%Y-%m-%d %H:%M') if file.scan_date else 'N/A')
+            )
+        
+        yield "</table>"
+        
+        if total_files > REPORT_FILE_LIMIT:
+            yield f"<p><em>Note: Showing first {REPORT_FILE_LIMIT} of {total_files} total files</em></p>"
+    
+    yield f"""
+        <div class="footer">
+            <p>Generated on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
+            <p>This report is for compliance and auditing purposes</p>
+        </div>
+    </body>
+    </html>
+    """
+
 @reports_bp.route('/scan-reports/<report_id>/pdf')
 def export_scan_report_pdf(report_id):
     """Export scan report as PDF for compliance"""
@@ -372,12 +667,9 @@ def export_scan_report_pdf(report_id):
     
     try:
         # Import reportlab for PDF generation
-        from reportlab.lib import colors
         from reportlab.lib.pagesizes import letter, A4, landscape
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer, PageBreak, Image
         from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_CENTER, TA_RIGHT
         
         # Create PDF buffer with wider margins for more space
         buffer = BytesIO()
@@ -388,38 +680,19 @@ def export_scan_report_pdf(report_id):
         # Container for the 'Flowable' objects
         elements = []
         
-        # Define styles with PixelProbe color scheme
-        styles = getSampleStyleSheet()
-        # Primary green color
-        primary_green = colors.HexColor('#1ce783')
-        primary_black = colors.HexColor('#040405')
-        gradient_end = colors.HexColor('#183949')
-        
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor=primary_black,
-            spaceAfter=8,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=12,
-            textColor=gradient_end,
-            spaceAfter=6
-        )
+        # Shared PixelProbe styles
+        pdf_styles = _pdf_styles()
+        styles = pdf_styles.sheet
+        title_style = pdf_styles.report_title
+        heading_style = pdf_styles.heading
         
         # Add logo and title
         try:
-            logo_path = os.path.join(os.path.dirname(__file__), '../../static/images/pixelprobe-logo.png')
-            if os.path.exists(logo_path):
+            if _LOGO_BYTES:
                 # Logo is 670x729 pixels, maintain aspect ratio - smaller logo
                 logo_width = 0.7*inch
                 logo_height = logo_width * (729.0/670.0)  # Maintain aspect ratio
-                logo = Image(logo_path, width=logo_width, height=logo_height)
+                logo = Image(BytesIO(_LOGO_BYTES), width=logo_width, height=logo_height)
                 logo.hAlign = 'CENTER'
                 elements.append(logo)
                 elements.append(Spacer(1, 0.05*inch))
@@ -448,7 +721,7 @@ def export_scan_report_pdf(report_id):
                 # Log the raw value for debugging
                 logger.debug(f"Raw directories_scanned: {report.directories_scanned}")
                 
-                dirs = json.loads(report.directories_scanned)
+                dirs = orjson.loads(report.directories_scanned)
                 logger.debug(f"Parsed dirs type: {type(dirs)}, value: {dirs}")
                 
                 # Handle case where dirs might be a string instead of list
@@ -468,7 +741,7 @@ def export_scan_report_pdf(report_id):
                     dirs_text = str(dirs)
                 
                 report_info.append(['Directories:', dirs_text])
-            except (json.JSONDecodeError, TypeError) as e:
+            except (orjson.JSONDecodeError, TypeError) as e:
                 logger.warning(f"Failed to parse directories_scanned: {e}")
                 # If JSON parsing fails, use the raw value
                 report_info.append(['Directories:', report.directories_scanned])
@@ -484,17 +757,7 @@ def export_scan_report_pdf(report_id):
             formatted_info.append([label, value])
         
         info_table = Table(formatted_info, colWidths=[2*inch, 4*inch])
-        info_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-            ('PADDING', (0, 0), (-1, -1), 4),
-        ]))
+        info_table.setStyle(pdf_styles.info_table)
         
         elements.append(info_table)
         elements.append(Spacer(1, 0.08*inch))
@@ -539,53 +802,38 @@ def export_scan_report_pdf(report_id):
             ]
         
         stats_table = Table(stats_data, colWidths=[3*inch, 2*inch])
-        stats_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('BACKGROUND', (0, 0), (-1, 0), primary_green),
-            ('TEXTCOLOR', (0, 0), (-1, 0), primary_black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-            ('PADDING', (0, 0), (-1, -1), 4),
-        ]))
+        stats_table.setStyle(pdf_styles.stats_table)
         
         elements.append(stats_table)
         elements.append(Spacer(1, 0.1*inch))
         
-        # Create styles for wrapping text in table cells
-        cell_style = ParagraphStyle(
-            'CellStyle',
-            parent=styles['Normal'],
-            fontSize=8,
-            leading=10,
-            wordWrap='CJK'
-        )
-        
         # Add scanned files list
         if report.scan_type in ['full_scan', 'rescan', 'deep_scan']:
             elements.append(PageBreak())
             elements.append(Paragraph("Scanned Files", heading_style))
             
-            # Query files scanned during this scan period
-            from models import ScanResult
-            scanned_files = ScanResult.query.filter(
-                ScanResult.scan_date >= report.start_time,
-                ScanResult.scan_date <= (report.end_time or datetime.now(timezone.utc))
-            ).order_by(ScanResult.file_path).all()
+            # Query files scanned during this scan period (limit to first 500 for PDF size)
+            scanned_files, total_files = _scanned_files(report)
             
             if scanned_files:
+                # Create files table with wider columns using full page width
+                # Total width = 11 inches (landscape) - 0.6 inches margins = 10.4 inches available
+                col_widths = [3.8*inch, 0.7*inch, 0.7*inch, 0.9*inch, 0.7*inch, 2.6*inch, 1.0*inch]
+                
+                # Text width inside the 4pt cell padding of the wrapped columns
+                path_width = col_widths[0] - 8
+                details_width = col_widths[5] - 8
+                
                 # Create files table header
                 files_data = [['File Path', 'Status', 'Size', 'Type', 'Tool', 'Details', 'Scan Date']]
                 
-                # Add file rows (limit to first 500 for PDF size)
-                for file in scanned_files[:500]:
+                # Add file rows
+                for file in scanned_files:
                     status = 'Corrupted' if file.is_corrupted and not file.marked_as_good else 'Healthy'
                     if file.has_warnings and not file.marked_as_good:
                         status = 'Warning'
                     
-                    size = f"{file.file_size / (1024*1024):.2f} MB" if file.file_size else 'N/A'
+                    size = _format_mb(file.file_size)
                     file_type = file.file_type or 'Unknown'
                     scan_tool = file.scan_tool or 'N/A'
                     scan_date = file.scan_date.strftime('%Y-%m-%d %H:%M') if file.scan_date else 'N/A'
@@ -600,61 +848,31 @@ def export_scan_report_pdf(report_id):
                         details.append(file.error_message)
                     details_text = ' '.join(details)[:100] + '...' if len(' '.join(details)) > 100 else ' '.join(details) if details else ''
                     
-                    # Wrap file path in Paragraph for text wrapping
-                    file_path_para = Paragraph(file.file_path, cell_style)
-                    details_para = Paragraph(details_text, cell_style) if details_text else ''
-                    
+                    # Pre-wrap the long cells as plain text; a Paragraph per cell costs a markup parse and a
+                    # measuring pass for every row, which dominates the build for hundreds of files
                     files_data.append([
-                        file_path_para,  # Wrapped for proper text flow
+                        _wrap_cell(file.file_path, path_width),
                         status,
                         size,
                         file_type,
                         scan_tool,
-                        details_para,
+                        _wrap_cell(details_text, details_width),
                         scan_date
                     ])
                 
-                # Create files table with wider columns using full page width
-                # Total width = 11 inches (landscape) - 0.6 inches margins = 10.4 inches available
-                files_table = Table(files_data, colWidths=[3.8*inch, 0.7*inch, 0.7*inch, 0.9*inch, 0.7*inch, 2.6*inch, 1.0*inch], repeatRows=1)
-                files_table.setStyle(TableStyle([
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left align file paths
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),  # Top align all cells
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('BACKGROUND', (0, 0), (-1, 0), gradient_end),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-                    ('PADDING', (0, 0), (-1, -1), 4),
-                ]))
+                files_table = Table(files_data, colWidths=col_widths, repeatRows=1)
+                files_table.setStyle(pdf_styles.files_table)
                 
                 elements.append(files_table)
                 
-                if len(scanned_files) > 500:
+                if total_files > REPORT_FILE_LIMIT:
                     elements.append(Spacer(1, 0.1*inch))
-                    # Define footer style here
-                    footer_style = ParagraphStyle(
-                        'Footer',
-                        parent=styles['Normal'],
-                        fontSize=8,
-                        textColor=colors.HexColor('#7f8c8d'),
-                        alignment=TA_CENTER
-                    )
-                    elements.append(Paragraph(f"Note: Showing first 500 of {len(scanned_files)} total files", footer_style))
+                    elements.append(Paragraph(f"Note: Showing first {REPORT_FILE_LIMIT} of {total_files} total files", pdf_styles.footer))
             else:
                 elements.append(Paragraph("No files were scanned during this scan.", styles['Normal']))
         
         # Add footer
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=8,
-            textColor=colors.HexColor('#7f8c8d'),
-            alignment=TA_CENTER
-        )
+        footer_style = pdf_styles.footer
         
         elements.append(Spacer(1, 0.5*inch))
         elements.append(Paragraph(f"Generated on {convert_to_timezone(datetime.now(timezone.utc)).replace('T', ' ').split('+')[0]}", footer_style))
@@ -663,130 +881,20 @@ def export_scan_report_pdf(report_id):
         # Build PDF
         doc.build(elements)
         
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
-        # Create response
-        response = make_response(pdf_data)
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename=scan_report_{report_id}_{report.start_time.strftime("%Y%m%d_%H%M%S")}.pdf'
-        
-        return response
+        # Send the buffer itself rather than a copy of its bytes
+        buffer.seek(0)
+        return send_file(
+            buffer,
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=f'scan_report_{report_id}_{report.start_time.strftime("%Y%m%d_%H%M%S")}.pdf'
+        )
         
     except ImportError as e:
         # Log the import error (use module-level logger)
         logger.error(f"Failed to import reportlab: {e}")
-        # If reportlab is not installed, return a simple HTML version that can be printed to PDF
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Scan Report {report.report_id}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f8f9fa; }}
-                h1 {{ color: #040405; text-align: center; }}
-                h2 {{ color: #183949; margin-top: 30px; }}
-                table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-                th, td {{ border: 1px solid #dee2e6; padding: 8px; text-align: left; }}
-                th {{ background-color: #1ce783; color: #040405; }}
-                tr:nth-child(even) {{ background-color: #f8f9fa; }}
-                .footer {{ text-align: center; margin-top: 50px; font-size: 12px; color: #6c757d; }}
-                .logo {{ text-align: center; margin-bottom: 20px; }}
-            </style>
-        </head>
-        <body>
-            <h1>PixelProbe Scan Report</h1>
-            
-            <h2>Report Information</h2>
-            <table>
-                <tr><th>Report ID</th><td>{report.report_id}</td></tr>
-                <tr><th>Scan Type</th><td>{report.scan_type.replace('_', ' ').title()}</td></tr>
-                <tr><th>Status</th><td>{report.status.title()}</td></tr>
-                <tr><th>Start Time</th><td>{report.start_time.strftime('%Y-%m-%d %H:%M:%S UTC') if report.start_time else 'N/A'}</td></tr>
-                <tr><th>End Time</th><td>{report.end_time.strftime('%Y-%m-%d %H:%M:%S UTC') if report.end_time else 'N/A'}</td></tr>
-                <tr><th>Duration</th><td>{f"{int(report.duration_seconds // 60)}m {int(report.duration_seconds % 60)}s" if report.duration_seconds else 'N/A'}</td></tr>
-            </table>
-            
-            <h2>Scan Statistics</h2>
-            <table>
-        """
-        
-        if report.scan_type in ['full_scan', 'rescan', 'deep_scan']:
-            html_content += f"""
-                <tr><th>Total Files Discovered</th><td>{report.total_files_discovered:,}</td></tr>
-                <tr><th>Files Scanned</th><td>{report.files_scanned:,}</td></tr>
-                <tr><th>New Files Added</th><td>{report.files_added:,}</td></tr>
-                <tr><th>Files Updated</th><td>{report.files_updated:,}</td></tr>
-                <tr><th>Corrupted Files</th><td>{report.files_corrupted:,}</td></tr>
-                <tr><th>Files with Warnings</th><td>{report.files_with_warnings:,}</td></tr>
-                <tr><th>Files with Errors</th><td>{report.files_error:,}</td></tr>
-            """
-        elif report.scan_type == 'cleanup':
-            html_content += f"""
-                <tr><th>Orphaned Records Found</th><td>{report.orphaned_records_found:,}</td></tr>
-                <tr><th>Orphaned Records Deleted</th><td>{report.orphaned_records_deleted:,}</td></tr>
-            """
-        
-        html_content += f"""
-            </table>
-            """
-        
-        # Add scanned files list for scan reports
-        if report.scan_type in ['full_scan', 'rescan', 'deep_scan']:
-            from models import ScanResult
-            scanned_files = ScanResult.query.filter(
-                ScanResult.scan_date >= report.start_time,
-                ScanResult.scan_date <= (report.end_time or datetime.now(timezone.utc))
-            ).order_by(ScanResult.file_path).limit(1000).all()
-            
-            html_content += f"""
-                <h2>Scanned Files ({len(scanned_files)} files)</h2>
-                <table>
-                    <tr>
-                        <th>File Path</th>
-                        <th>Status</th>
-                        <th>Size</th>
-                        <th>Type</th>
-                        <th>Scan Date</th>
-                    </tr>
-            """
-            
-            for file in scanned_files[:500]:  # Limit display to 500 files
-                status = 'Corrupted' if file.is_corrupted and not file.marked_as_good else 'Healthy'
-                size = f"{file.file_size / (1024*1024):.2f} MB" if file.file_size else 'N/A'
-                file_type = file.file_type or 'Unknown'
-                scan_date = file.scan_date.strftime('%Y-%m-%d %H:%M') if file.scan_date else 'N/A'
-                status_class = 'corrupted' if status == 'Corrupted' else 'healthy'
-                
-                html_content += f"""
-                    <tr>
-                        <td style="max-width: 400px; overflow: hidden; text-overflow: ellipsis;">{file.file_path}</td>
-                        <td><span class="{status_class}">{status}</span></td>
-                        <td>{size}</td>
-                        <td>{file_type}</td>
-                        <td>{scan_date}</td>
-                    </tr>
-                """
-            
-            html_content += "</table>"
-            
-            if len(scanned_files) > 500:
-                html_content += f"<p><em>Note: Showing first 500 of {len(scanned_files)} total files</em></p>"
-        
-        html_content += f"""
-            <div class="footer">
-                <p>Generated on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-                <p>This report is for compliance and auditing purposes</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        response = make_response(html_content)
-        response.headers['Content-Type'] = 'text/html'
-        
-        return response
+        # If reportlab is not installed, stream a simple HTML version that can be printed to PDF
+        return Response(stream_with_context(_html_report(report)), mimetype='text/html')
     
     except Exception as e:
         # Log any other errors (use module-level logger)
@@ -814,16 +922,7 @@ def get_latest_scan_reports():
             
             # Add formatted duration
             if report.duration_seconds:
-                hours = int(report.duration_seconds // 3600)
-                minutes = int((report.duration_seconds % 3600) // 60)
-                seconds = int(report.duration_seconds % 60)
-                
-                if hours > 0:
-                    report_dict['duration_formatted'] = f"{hours}h {minutes}m {seconds}s"
-                elif minutes > 0:
-                    report_dict['duration_formatted'] = f"{minutes}m {seconds}s"
-                else:
-                    report_dict['duration_formatted'] = f"{seconds}s"
+                report_dict['duration_formatted'] = _format_duration(int(report.duration_seconds))
             
             latest_reports[scan_type] = report_dict
     
@@ -876,44 +975,25 @@ def download_multiple_reports():
         if format_type == 'pdf':
             # Generate combined PDF
             try:
-                from reportlab.lib import colors
                 from reportlab.lib.pagesizes import letter, landscape
-                from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-                from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+                from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer, PageBreak, Image
                 from reportlab.lib.units import inch
-                from reportlab.lib.enums import TA_CENTER
                 
                 # Create PDF buffer
                 buffer = io.BytesIO()
                 doc = SimpleDocTemplate(buffer, pagesize=landscape(letter))
                 elements = []
                 
-                styles = getSampleStyleSheet()
-                primary_green = colors.HexColor('#1ce783')
-                primary_black = colors.HexColor('#040405')
-                
-                title_style = ParagraphStyle(
-                    'CustomTitle',
-                    parent=styles['Heading1'],
-                    fontSize=24,
-                    textColor=primary_black,
-                    spaceAfter=30,
-                    alignment=TA_CENTER
-                )
-                
-                # Create styles for wrapping text
-                cell_style = ParagraphStyle(
-                    'CellStyle',
-                    parent=styles['Normal'],
-                    fontSize=6,
-                    leading=7
-                )
+                # Shared PixelProbe styles
+                pdf_styles = _pdf_styles()
+                styles = pdf_styles.sheet
+                title_style = pdf_styles.title
+                cell_style = pdf_styles.cell
                 
                 # Add logo at the top of the first page
-                logo_path = os.path.join(os.path.dirname(__file__), '../../static/images/pixelprobe-logo.png')
-                if os.path.exists(logo_path):
+                if _LOGO_BYTES:
                     # Maintain aspect ratio for square logo (670x729 pixels)
-                    logo = Image(logo_path, width=1.5*inch, height=1.5*inch, kind='proportional')
+                    logo = Image(BytesIO(_LOGO_BYTES), width=1.5*inch, height=1.5*inch, kind='proportional')
                     logo.hAlign = 'CENTER'
                     elements.append(logo)
                     elements.append(Spacer(1, 0.3*inch))
@@ -961,24 +1041,17 @@ def download_multiple_reports():
                         ])
                         
                     stats_table = Table(stats_data)
-                    stats_table.setStyle(TableStyle([
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                        ('BACKGROUND', (0, 0), (-1, 0), primary_green),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), primary_black),
-                    ]))
+                    stats_table.setStyle(pdf_styles.summary_table)
                     elements.append(stats_table)
                     elements.append(Spacer(1, 0.2*inch))
                     
                     # Add scanned files if available for scan reports
                     if report.scan_type in ['full_scan', 'rescan', 'deep_scan']:
                         # Query scan results for this report's time period
-                        from models import ScanResult
-                        scanned_files = ScanResult.query.filter(
+                        scanned_files = db.session.query(*_REPORT_FILE_COLUMNS).filter(
                             ScanResult.scan_date >= report.start_time,
                             ScanResult.scan_date <= (report.end_time or datetime.now(timezone.utc))
-                        ).limit(500).all()
+                        ).limit(REPORT_FILE_LIMIT).all()
                         
                         if scanned_files:
                             elements.append(Paragraph("Scanned Files", styles['Heading2']))
@@ -1023,37 +1096,26 @@ def download_multiple_reports():
                             # Create table with proper column widths adjusted for landscape
                             # Total width = 11 inches (landscape) - 1 inch margins = 10 inches available
                             table = Table(files_data, colWidths=[0.6*inch, 3.2*inch, 0.6*inch, 0.7*inch, 0.6*inch, 2.3*inch, 1.0*inch])
-                            table.setStyle(TableStyle([
-                                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                                ('BACKGROUND', (0, 0), (-1, 0), primary_green),
-                                ('TEXTCOLOR', (0, 0), (-1, 0), primary_black),
-                                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-                                ('PADDING', (0, 0), (-1, -1), 4),
-                            ]))
+                            table.setStyle(pdf_styles.results_table)
                             
                             elements.append(table)
                             
-                            if len(scanned_files) >= 500:
+                            if len(scanned_files) >= REPORT_FILE_LIMIT:
                                 elements.append(Spacer(1, 0.1*inch))
-                                elements.append(Paragraph("Note: Showing first 500 results", styles['Normal']))
+                                elements.append(Paragraph(f"Note: Showing first {REPORT_FILE_LIMIT} results", styles['Normal']))
                 
                 # Build PDF
                 doc.build(elements)
-                pdf_data = buffer.getvalue()
-                buffer.close()
                 
-                # Create response
+                # Send the buffer itself rather than a copy of its bytes
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                response = make_response(pdf_data)
-                response.headers['Content-Type'] = 'application/pdf'
-                response.headers['Content-Disposition'] = f'attachment; filename=pixelprobe_reports_{timestamp}.pdf'
-                
-                return response
+                buffer.seek(0)
+                return send_file(
+                    buffer,
+                    mimetype='application/pdf',
+                    as_attachment=True,
+                    download_name=f'pixelprobe_reports_{timestamp}.pdf'
+                )
                 
             except ImportError:
                 logger.error("reportlab not installed for PDF export")
@@ -1072,7 +1134,7 @@ def download_multiple_reports():
                         'export_format': 'json',
                         'version': '1.0'
                     }
-                    json_data = json.dumps(report_data, indent=2)
+                    json_data = orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
                     
                     # Generate filename based on scan type
                     if report.scan_type == 'cleanup':
@@ -1086,11 +1148,12 @@ def download_multiple_reports():
             buffer.seek(0)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            response = make_response(buffer.getvalue())
-            response.headers['Content-Type'] = 'application/zip'
-            response.headers['Content-Disposition'] = f'attachment; filename=pixelprobe_reports_{timestamp}.zip'
-            
-            return response
+            return send_file(
+                buffer,
+                mimetype='application/zip',
+                as_attachment=True,
+                download_name=f'pixelprobe_reports_{timestamp}.zip'
+            )
             
     except Exception as e:
         logger.error(f"Error downloading multiple reports: {str(e)}")
@@ -1,11 +1,12 @@
 from flask import Blueprint, request, jsonify, current_app
-import pytz
 import os
 import threading
 import logging
 
 from media_checker import PixelProbe, load_exclusions
 from models import db, ScanResult, ScanState
+from pixelprobe.utils.helpers import get_timezone
+from pixelprobe.utils.rate_limiting import rate_limit, exempt_from_rate_limit, register_rate_limits
 from version import __version__
 
 from pixelprobe.utils.security import (
@@ -16,52 +17,8 @@ from pixelprobe.utils.security import (
 
 logger = logging.getLogger(__name__)
 
-# Get timezone from environment variable, default to UTC
-APP_TIMEZONE = os.environ.get('TZ', 'UTC')
-try:
-    tz = pytz.timezone(APP_TIMEZONE)
-except pytz.exceptions.UnknownTimeZoneError:
-    tz = pytz.UTC
-    logger.warning(f"Unknown timezone '{APP_TIMEZONE}', falling back to UTC")
-
 scan_bp = Blueprint('scan', __name__, url_prefix='/api')
 
-# Import limiter from main app
-from functools import wraps
-
-# Create rate limit decorators that work with Flask-Limiter
-def rate_limit(limit_string):
-    """Decorator to apply rate limits using the app's limiter"""
-    def decorator(f):
-        @wraps(f)
-        def wrapped(*args, **kwargs):
-            # Get the limiter from the current app
-            limiter = current_app.extensions.get('flask-limiter')
-            if limiter:
-                # Apply the rate limit dynamically
-                limited_func = limiter.limit(limit_string, exempt_when=lambda: False)(f)
-                return limited_func(*args, **kwargs)
-            else:
-                # If no limiter, just call the function
-                return f(*args, **kwargs)
-        return wrapped
-    return decorator
-
-def exempt_from_rate_limit(f):
-    """Decorator to exempt a function from rate limiting"""
-    @wraps(f)
-    def wrapped(*args, **kwargs):
-        # Get the limiter from the current app
-        limiter = current_app.extensions.get('flask-limiter')
-        if limiter:
-            # Apply exemption dynamically
-            exempt_func = limiter.exempt(f)
-            return exempt_func(*args, **kwargs)
-        else:
-            # If no limiter, just call the function
-            return f(*args, **kwargs)
-    return wrapped
-
 def is_scan_running():
     """Check if a scan is currently running"""
     return current_app.scan_service.is_scan_running()
@@ -136,6 +93,7 @@ def get_scan_results():
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
     
     # Build response
+    tz = get_timezone()
     results = []
     for result in pagination.items:
         result_dict = result.to_dict()
@@ -143,28 +101,28 @@ def get_scan_results():
         # Convert timestamps to configured timezone
         if result.scan_date:
             if result.scan_date.tzinfo is None:
-                scan_date = tz.localize(result.scan_date)
+                scan_date = result.scan_date.replace(tzinfo=tz)
             else:
                 scan_date = result.scan_date
             result_dict['scan_date'] = scan_date.astimezone(tz).isoformat()
         
         if result.discovered_date:
             if result.discovered_date.tzinfo is None:
-                discovered_date = tz.localize(result.discovered_date)
+                discovered_date = result.discovered_date.replace(tzinfo=tz)
             else:
                 discovered_date = result.discovered_date
             result_dict['discovered_date'] = discovered_date.astimezone(tz).isoformat()
         
         if result.creation_date:
             if result.creation_date.tzinfo is None:
-                creation_date = tz.localize(result.creation_date)
+                creation_date = result.creation_date.replace(tzinfo=tz)
             else:
                 creation_date = result.creation_date  
             result_dict['creation_date'] = creation_date.astimezone(tz).isoformat()
         
         if result.last_modified:
             if result.last_modified.tzinfo is None:
-                last_modified = tz.localize(result.last_modified)
+                last_modified = result.last_modified.replace(tzinfo=tz)
             else:
                 last_modified = result.last_modified
             result_dict['last_modified'] = last_modified.astimezone(tz).isoformat()
@@ -187,32 +145,33 @@ def get_scan_result(result_id):
     """Get a single scan result by ID"""
     result = ScanResult.query.get_or_404(result_id)
     result_dict = result.to_dict()
+    tz = get_timezone()
     
     # Convert timestamps to configured timezone
     if result.scan_date:
         if result.scan_date.tzinfo is None:
-            scan_date = tz.localize(result.scan_date)
+            scan_date = result.scan_date.replace(tzinfo=tz)
         else:
             scan_date = result.scan_date
         result_dict['scan_date'] = scan_date.astimezone(tz).isoformat()
     
     if result.discovered_date:
         if result.discovered_date.tzinfo is None:
-            discovered_date = tz.localize(result.discovered_date)
+            discovered_date = result.discovered_date.replace(tzinfo=tz)
         else:
             discovered_date = result.discovered_date
         result_dict['discovered_date'] = discovered_date.astimezone(tz).isoformat()
     
     if result.creation_date:
         if result.creation_date.tzinfo is None:
-            creation_date = tz.localize(result.creation_date)
+            creation_date = result.creation_date.replace(tzinfo=tz)
         else:
             creation_date = result.creation_date  
         result_dict['creation_date'] = creation_date.astimezone(tz).isoformat()
     
     if result.last_modified:
         if result.last_modified.tzinfo is None:
-            last_modified = tz.localize(result.last_modified)
+            last_modified = result.last_modified.replace(tzinfo=tz)
         else:
             last_modified = result.last_modified
         result_dict['last_modified'] = last_modified.astimezone(tz).isoformat()
@@ -681,4 +640,6 @@ def get_scan_output(result_id):
         'error_message': result.error_message,
         'is_corrupted': result.is_corrupted,
         'scan_status': result.scan_status
-    })
\ No newline at end of file
+    })
+
+register_rate_limits(scan_bp)
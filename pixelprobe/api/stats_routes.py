@@ -1,42 +1,22 @@
-from flask import Blueprint, jsonify, current_app
+from flask import Blueprint, jsonify
 from sqlalchemy import text
 import os
 import time
 import logging
-import pytz
 from datetime import datetime, timezone
-from functools import wraps
 
 from models import db, ScanResult
+from pixelprobe.utils.helpers import get_timezone
+from pixelprobe.utils.rate_limiting import exempt_from_rate_limit, register_rate_limits
 from version import __version__
 
 logger = logging.getLogger(__name__)
 
-# Get timezone from environment variable, default to UTC
+# Configured timezone name, reported by system-info; the ZoneInfo is resolved lazily
 APP_TIMEZONE = os.environ.get('TZ', 'UTC')
-try:
-    tz = pytz.timezone(APP_TIMEZONE)
-except pytz.exceptions.UnknownTimeZoneError:
-    tz = pytz.UTC
-    logger.warning(f"Unknown timezone '{APP_TIMEZONE}', falling back to UTC")
 
 stats_bp = Blueprint('stats', __name__, url_prefix='/api')
 
-def exempt_from_rate_limit(f):
-    """Decorator to exempt a function from rate limiting"""
-    @wraps(f)
-    def wrapped(*args, **kwargs):
-        # Get the limiter from the current app
-        limiter = current_app.extensions.get('flask-limiter')
-        if limiter:
-            # Apply exemption dynamically
-            exempt_func = limiter.exempt(f)
-            return exempt_func(*args, **kwargs)
-        else:
-            # If no limiter, just call the function
-            return f(*args, **kwargs)
-    return wrapped
-
 @stats_bp.route('/stats')
 @exempt_from_rate_limit
 def get_stats():
@@ -122,6 +102,7 @@ def get_system_info():
     """Get comprehensive system information - optimized to read from database"""
     try:
         logger.info("System info requested")
+        tz = get_timezone()
         
         # Add overall timeout for the entire endpoint
         start_time = time.time()
@@ -221,7 +202,7 @@ def get_system_info():
             try:
                 oldest_scan_dt = datetime.fromisoformat(oldest_scan.replace('Z', '+00:00'))
                 if oldest_scan_dt.tzinfo is None:
-                    oldest_scan_dt = tz.localize(oldest_scan_dt)
+                    oldest_scan_dt = oldest_scan_dt.replace(tzinfo=tz)
                 oldest_scan = oldest_scan_dt.isoformat()
             except:
                 pass
@@ -230,7 +211,7 @@ def get_system_info():
             try:
                 newest_scan_dt = datetime.fromisoformat(newest_scan.replace('Z', '+00:00'))
                 if newest_scan_dt.tzinfo is None:
-                    newest_scan_dt = tz.localize(newest_scan_dt)
+                    newest_scan_dt = newest_scan_dt.replace(tzinfo=tz)
                 newest_scan = newest_scan_dt.isoformat()
             except:
                 pass
@@ -281,4 +262,6 @@ def get_system_info():
         
     except Exception as e:
         logger.error(f"Error getting system info: {str(e)}")
-        return jsonify({'error': 'Failed to get system info'}), 500
\ No newline at end of file
+        return jsonify({'error': 'Failed to get system info'}), 500
+
+register_rate_limits(stats_bp)
@@ -244,13 +244,22 @@ class Schedules(Resource):
 class ExportCSV(Resource):
     @export_ns.doc('export_csv')
     @export_ns.expect(export_request_model)
+    @export_ns.response(400, 'Invalid file ID format', error_model)
     def post(self):
         """Export scan results to CSV"""
         export_service = current_app.export_service
         data = request.get_json() or {}
         
         file_ids = data.get('file_ids')
-        csv_data = export_service.export_to_csv(file_ids)
+        try:
+            if file_ids is not None:
+                if not isinstance(file_ids, list):
+                    raise TypeError('file_ids must be a list')
+                file_ids = [int(fid) for fid in file_ids]
+        except (ValueError, TypeError):
+            return {'error': 'Invalid file ID format'}, 400
+        
+        csv_data = export_service.export_to_csv(file_ids=file_ids)
         
         from flask import Response
         return Response(
@@ -11,6 +11,7 @@ from typing import List, Dict, Optional
 from flask import send_file, Response
 
 from models import db, ScanResult
+from pixelprobe.utils.helpers import ids_filter
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ class ExportService:
         try:
             # Get results based on criteria
             if file_ids:
-                results = ScanResult.query.filter(ScanResult.id.in_(file_ids)).all()
+                query = ScanResult.query.filter(ids_filter(ScanResult.id, file_ids))
                 export_type = "selected"
             else:
                 query = ScanResult.query
@@ -51,11 +52,8 @@ class ExportService:
                         (ScanResult.marked_as_good == False)
                     )
                 
-                results = query.all()
                 export_type = filter_type if filter_type != 'all' else 'all'
             
-            logger.info(f"Exporting {len(results)} scan results to CSV (type: {export_type})")
-            
             # Create CSV
             output = io.StringIO()
             writer = csv.writer(output)
@@ -75,8 +73,10 @@ class ExportService:
                 'Marked as Good'
             ])
             
-            # Write data rows
-            for result in results:
+            # Write data rows; yield_per loads results in batches and the count is taken as they are written
+            count = 0
+            for result in query.yield_per(1000):
+                count += 1
                 writer.writerow([
                     result.id,
                     result.file_path,
@@ -86,12 +86,13 @@ class ExportService:
                     'Yes' if result.is_corrupted else 'No',
                     result.corruption_details or '',
                     result.scan_date.isoformat() if result.scan_date else '',
-                    getattr(result, 'scan_status', 'completed'),
-                    getattr(result, 'discovered_date', result.scan_date).isoformat() 
-                        if getattr(result, 'discovered_date', result.scan_date) else '',
+                    result.scan_status,
+                    result.discovered_date.isoformat() if result.discovered_date else '',
                     'Yes' if result.marked_as_good else 'No'
                 ])
             
+            logger.info(f"Exported {count} scan results to CSV (type: {export_type})")
+            
             # Prepare response
             output.seek(0)
             csv_content = output.getvalue()
@@ -110,7 +111,7 @@ class ExportService:
         try:
             # Get results based on criteria (similar to CSV export)
             if file_ids:
-                results = ScanResult.query.filter(ScanResult.id.in_(file_ids)).all()
+                query = ScanResult.query.filter(ids_filter(ScanResult.id, file_ids))
             else:
                 query = ScanResult.query
                 
@@ -127,19 +128,17 @@ class ExportService:
                         (ScanResult.is_corrupted == False) | 
                         (ScanResult.marked_as_good == True)
                     )
-                
-                results = query.all()
             
             # Convert to JSON-serializable format
             export_data = {
                 'export_date': datetime.now().isoformat(),
                 'filter_type': filter_type,
                 'search_term': search,
-                'total_records': len(results),
+                'total_records': 0,
                 'results': []
             }
             
-            for result in results:
+            for result in query.yield_per(1000):
                 export_data['results'].append({
                     'id': result.id,
                     'file_path': result.file_path,
@@ -149,9 +148,10 @@ class ExportService:
                     'is_corrupted': result.is_corrupted,
                     'corruption_details': result.corruption_details,
                     'scan_date': result.scan_date.isoformat() if result.scan_date else None,
-                    'scan_status': getattr(result, 'scan_status', 'completed'),
+                    'scan_status': result.scan_status,
                     'marked_as_good': result.marked_as_good
                 })
+            export_data['total_records'] = len(export_data['results'])
             
             return export_data
             
@@ -11,6 +11,8 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import uuid
 
+from sqlalchemy.exc import IntegrityError
+
 from media_checker import PixelProbe, load_exclusions
 from models import db, ScanResult, CleanupState, FileChangesState, ScanReport
 from utils import ProgressTracker
@@ -57,6 +59,21 @@ class MaintenanceService:
         if self.cleanup_thread and self.cleanup_thread.is_alive():
             raise RuntimeError("Cleanup operation already in progress")
         
+        # Create cleanup state in database; the one-active-row index rejects a cleanup
+        # already running in another worker
+        cleanup_record = CleanupState(
+            start_time=datetime.now(timezone.utc),
+            is_active=True,
+            phase='starting',
+            phase_number=1
+        )
+        db.session.add(cleanup_record)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise RuntimeError("Cleanup operation already in progress")
+        
         # Reset state
         with self.cleanup_lock:
             self.cleanup_state.update({
@@ -70,16 +87,6 @@ class MaintenanceService:
                 'cancel_requested': False
             })
         
-        # Create cleanup state in database
-        cleanup_record = CleanupState(
-            start_time=datetime.now(timezone.utc),
-            is_active=True,
-            phase='starting',
-            phase_number=1
-        )
-        db.session.add(cleanup_record)
-        db.session.commit()
-        
         # Start cleanup in background
         self.cleanup_thread = threading.Thread(
             target=self._run_cleanup,
@@ -100,6 +107,22 @@ class MaintenanceService:
         # Create unique check ID
         check_id = str(uuid.uuid4())
         
+        # Create file changes state in database; the one-active-row index rejects a check
+        # already running in another worker
+        file_changes_record = FileChangesState(
+            check_id=check_id,
+            start_time=datetime.now(timezone.utc),
+            is_active=True,
+            phase='starting',
+            phase_number=1
+        )
+        db.session.add(file_changes_record)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise RuntimeError("File changes check already in progress")
+        
         # Reset state
         with self.file_changes_lock:
             self.file_changes_state.update({
@@ -114,17 +137,6 @@ class MaintenanceService:
                 'cancel_requested': False
             })
         
-        # Create file changes state in database
-        file_changes_record = FileChangesState(
-            check_id=check_id,
-            start_time=datetime.now(timezone.utc),
-            is_active=True,
-            phase='starting',
-            phase_number=1
-        )
-        db.session.add(file_changes_record)
-        db.session.commit()
-        
         # Start file changes check in background
         self.file_changes_thread = threading.Thread(
             target=self._run_file_changes_check,
@@ -184,12 +196,12 @@ class MaintenanceService:
     def reset_cleanup_state(self) -> Dict:
         """Force reset cleanup state"""
         # Mark all active cleanups as failed
-        active_cleanups = CleanupState.query.filter_by(is_active=True).all()
-        for cleanup in active_cleanups:
-            cleanup.is_active = False
-            cleanup.phase = 'failed'
-            cleanup.end_time = datetime.now(timezone.utc)
-            cleanup.progress_message = 'Force reset by user'
+        CleanupState.query.filter_by(is_active=True).update({
+            CleanupState.is_active: False,
+            CleanupState.phase: 'failed',
+            CleanupState.end_time: datetime.now(timezone.utc),
+            CleanupState.progress_message: 'Force reset by user'
+        }, synchronize_session=False)
         
         db.session.commit()
         
@@ -240,7 +240,7 @@ class StatsService:
                 try:
                     oldest_scan_dt = datetime.fromisoformat(oldest_scan.replace('Z', '+00:00'))
                     if oldest_scan_dt.tzinfo is None:
-                        oldest_scan_dt = self.tz.localize(oldest_scan_dt)
+                        oldest_scan_dt = oldest_scan_dt.replace(tzinfo=self.tz)
                     oldest_scan = oldest_scan_dt.isoformat()
                 except:
                     pass
@@ -249,7 +249,7 @@ class StatsService:
                 try:
                     newest_scan_dt = datetime.fromisoformat(newest_scan.replace('Z', '+00:00'))
                     if newest_scan_dt.tzinfo is None:
-                        newest_scan_dt = self.tz.localize(newest_scan_dt)
+                        newest_scan_dt = newest_scan_dt.replace(tzinfo=self.tz)
                     newest_scan = newest_scan_dt.isoformat()
                 except:
                     pass
@@ -4,7 +4,7 @@ Utils module for PixelProbe
 
 from .decorators import require_json, handle_errors
 from .validators import validate_file_path, validate_scan_config
-from .helpers import get_timezone, format_file_size, is_media_file
+from .helpers import get_timezone, format_file_size, is_media_file, ojsonify, ORJSONProvider, ids_filter
 
 __all__ = [
     'require_json',
@@ -13,5 +13,8 @@ __all__ = [
     'validate_scan_config',
     'get_timezone',
     'format_file_size',
-    'is_media_file'
+    'is_media_file',
+    'ojsonify',
+    'ORJSONProvider',
+    'ids_filter'
 ]
\ No newline at end of file
@@ -3,20 +3,75 @@ Helper utilities for PixelProbe
 """
 
 import os
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import logging
+from functools import lru_cache
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider, DefaultJSONProvider
+from sqlalchemy import Integer, any_, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
 def get_timezone():
-    """Get configured timezone, default to UTC"""
+    """Get configured timezone, default to UTC; resolved once on first use"""
     APP_TIMEZONE = os.environ.get('TZ', 'UTC')
     try:
-        tz = pytz.timezone(APP_TIMEZONE)
+        tz = ZoneInfo(APP_TIMEZONE)
         return tz
-    except pytz.exceptions.UnknownTimeZoneError:
+    except (ZoneInfoNotFoundError, ValueError):
         logger.warning(f"Unknown timezone '{APP_TIMEZONE}', falling back to UTC")
-        return pytz.UTC
+        return ZoneInfo('UTC')
+
+def ojsonify(data, status=200):
+    """Serialize data with orjson into a JSON response; datetimes are encoded natively"""
+    return Response(orjson.dumps(data, default=str), status=status, mimetype='application/json')
+
+# Selections larger than this are bound as one array parameter instead of one parameter per id
+LARGE_ID_LIST = 500
+
+def ids_filter(column, ids):
+    """Filter column to ids, binding large lists as a single parameter
+
+    A plain IN clause binds one parameter per id, which plans poorly for thousands
+    of ids and hits SQLite's bound parameter limit. ids are coerced to int first,
+    since the array parameter is not coerced the way IN coerces each bound value;
+    raises ValueError or TypeError for an id that is not an integer.
+    """
+    ids = [int(i) for i in ids]
+    if len(ids) <= LARGE_ID_LIST:
+        return column.in_(ids)
+    
+    from models import db
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        return column == any_(literal(ids, ARRAY(Integer)))
+    if dialect == 'sqlite':
+        id_values = func.json_each(orjson.dumps(ids).decode()).table_valued('value')
+        return column.in_(select(id_values.c.value))
+    return column.in_(ids)
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, producing the same output as the default provider"""
+    
+    # Sorted keys and HTTP-date datetimes match DefaultJSONProvider, so jsonify() output is unchanged
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.option),
+            mimetype='application/json'
+        )
 
 def format_file_size(size_bytes):
     """Format file size in human readable format"""
@@ -1,10 +1,42 @@
 """Rate limiting configuration for the application"""
-from flask import Flask
+from flask import Blueprint, Flask
 from flask_limiter import Limiter
 import logging
 
 logger = logging.getLogger(__name__)
 
+def rate_limit(limit_string):
+    """Mark a view with a rate limit such as "10 per minute"; applied by register_rate_limits"""
+    def decorator(f):
+        f._rate_limit = limit_string
+        return f
+    return decorator
+
+def exempt_from_rate_limit(f):
+    """Mark a view as exempt from rate limiting; applied by register_rate_limits"""
+    f._rate_limit_exempt = True
+    return f
+
+def register_rate_limits(blueprint: Blueprint):
+    """Apply the blueprint's rate_limit / exempt_from_rate_limit marks with the app's limiter on registration.
+    
+    Call after the blueprint's routes are defined. Requests then pay no per-call lookup, and
+    apps without a limiter serve the views unchanged.
+    """
+    @blueprint.record_once
+    def _apply(state):
+        prefix = f'{blueprint.name}.'
+        for limiter in state.app.extensions.get('limiter', ()):
+            for endpoint, view in list(state.app.view_functions.items()):
+                if not endpoint.startswith(prefix):
+                    continue
+                if getattr(view, '_rate_limit_exempt', False):
+                    limiter.exempt(view)
+                limit_string = getattr(view, '_rate_limit', None)
+                if limit_string:
+                    # The limit is checked by the returned wrapper, so it has to replace the view
+                    state.app.view_functions[endpoint] = limiter.limit(limit_string)(view)
+
 def apply_rate_limits(app: Flask, limiter: Limiter):
     """Apply rate limits to blueprint endpoints after registration"""
     try:
@@ -3,7 +3,10 @@ Security utilities for PixelProbe
 """
 import os
 import re
+import queue
+import atexit
 import logging
+import threading
 from functools import wraps
 from datetime import datetime
 from flask import request, jsonify, current_app
@@ -210,6 +213,78 @@ def safe_subprocess_run(args, **kwargs):
     return subprocess.run(validated_args, **kwargs)
 
 # Audit logging
+# Audit entries are written by a background thread so logging I/O stays off the request path
+_audit_queue = queue.Queue()
+_audit_thread = None
+_audit_thread_lock = threading.Lock()
+_AUDIT_BATCH_SIZE = 500
+# Queued after the last entry to stop the writer; how long exit waits for it to finish
+_AUDIT_STOP = object()
+_AUDIT_SHUTDOWN_TIMEOUT = 5.0
+
+def _write_audit_entries(entries):
+    """Emit a batch of audit entries to the security audit logger"""
+    security_logger = logging.getLogger('security_audit')
+    for log_entry in entries:
+        security_logger.info(f"AUDIT: {log_entry}")
+
+def _next_audit_batch(first):
+    """Return (batch, stop): first plus queued entries up to _AUDIT_BATCH_SIZE, ending at the stop marker"""
+    batch = []
+    item = first
+    while item is not _AUDIT_STOP:
+        batch.append(item)
+        if len(batch) >= _AUDIT_BATCH_SIZE:
+            break
+        try:
+            item = _audit_queue.get_nowait()
+        except queue.Empty:
+            break
+    return batch, item is _AUDIT_STOP
+
+def _audit_worker():
+    """Consume queued audit entries and write them in batches, in queue order, until stopped"""
+    while True:
+        batch, stop = _next_audit_batch(_audit_queue.get())
+        try:
+            if batch:
+                _write_audit_entries(batch)
+        except Exception as e:
+            logger.error(f"Failed to write audit entries: {e}")
+        finally:
+            for _ in range(len(batch) + stop):
+                _audit_queue.task_done()
+        if stop:
+            return
+
+def _ensure_audit_worker():
+    """Start the audit writer thread on first use"""
+    global _audit_thread
+    if _audit_thread is not None:
+        return
+    with _audit_thread_lock:
+        if _audit_thread is None:
+            _audit_thread = threading.Thread(target=_audit_worker, name='audit-writer', daemon=True)
+            _audit_thread.start()
+
+def flush_audit_log():
+    """Block until every audit entry queued so far has been written"""
+    if _audit_queue.unfinished_tasks:
+        _ensure_audit_worker()
+        _audit_queue.join()
+
+@atexit.register
+def shutdown_audit_log():
+    """Stop the audit writer once it has written everything queued before the call"""
+    global _audit_thread
+    with _audit_thread_lock:
+        if _audit_thread is None:
+            return
+        # The writer is the only consumer, so nothing is written out of order or twice
+        _audit_queue.put(_AUDIT_STOP)
+        _audit_thread.join(_AUDIT_SHUTDOWN_TIMEOUT)
+        _audit_thread = None
+
 class AuditLogger:
     """Handle security audit logging"""
     
@@ -235,9 +310,9 @@ class AuditLogger:
             'details': details or {}
         }
         
-        # Log to security logger
-        security_logger = logging.getLogger('security_audit')
-        security_logger.info(f"AUDIT: {log_entry}")
+        # Hand off to the background writer; security events below stay synchronous
+        _ensure_audit_worker()
+        _audit_queue.put(log_entry)
         
         # TODO: In production, also log to database or external audit system
         
@@ -291,7 +366,7 @@ def validate_json_input(schema):
             if not request.is_json:
                 return jsonify({'error': 'Content-Type must be application/json'}), 400
             
-            data = request.get_json()
+            data = request.get_json(cache=True, silent=True)
             if data is None:
                 return jsonify({'error': 'No JSON data provided'}), 400
             
@@ -19,7 +19,7 @@ class MediaScheduler:
         self.scan_lock = threading.Lock()
         self.cleanup_lock = threading.Lock()
         self.excluded_paths = []
-        self.excluded_extensions = []
+        self.excluded_extensions = set()
         
         # Load exclusions from environment
         self._load_exclusions()
@@ -43,7 +43,7 @@ class MediaScheduler:
             
         excluded_extensions_env = os.environ.get('EXCLUDED_EXTENSIONS', '')
         if excluded_extensions_env:
-            self.excluded_extensions = [e.strip().lower() for e in excluded_extensions_env.split(',') if e.strip()]
+            self.excluded_extensions = {e.strip().lower() for e in excluded_extensions_env.split(',') if e.strip()}
             
     def _schedule_default_tasks(self):
         """Schedule default tasks based on environment variables"""
@@ -362,7 +362,7 @@ class MediaScheduler:
             self.excluded_paths = paths
             
         if extensions is not None:
-            self.excluded_extensions = [e.lower() for e in extensions]
+            self.excluded_extensions = {e.lower() for e in extensions}
             
     def update_schedules(self):
         """Reload all schedules from database"""
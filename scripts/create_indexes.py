@@ -36,7 +36,16 @@ def create_indexes():
             "CREATE INDEX IF NOT EXISTS idx_file_path ON scan_results(file_path)",
             # Composite indexes for common queries
             "CREATE INDEX IF NOT EXISTS idx_status_date ON scan_results(scan_status, scan_date)",
-            "CREATE INDEX IF NOT EXISTS idx_corrupted_good ON scan_results(is_corrupted, marked_as_good)"
+            "CREATE INDEX IF NOT EXISTS idx_corrupted_good ON scan_results(is_corrupted, marked_as_good)",
+            "CREATE INDEX IF NOT EXISTS idx_export_filter ON scan_results(is_corrupted, has_warnings, marked_as_good)",
+            "CREATE INDEX IF NOT EXISTS idx_schedule_name_active ON scan_schedules(name, is_active)",
+            "CREATE INDEX IF NOT EXISTS idx_exclusion_active_type ON exclusions(is_active, exclusion_type)",
+            "CREATE INDEX IF NOT EXISTS idx_cleanup_state_active ON cleanup_state(is_active, id)",
+            "CREATE INDEX IF NOT EXISTS idx_file_changes_state_active ON file_changes_state(is_active, id)",
+            "CREATE INDEX IF NOT EXISTS idx_scan_reports_start_time ON scan_reports(start_time, id)",
+            "CREATE INDEX IF NOT EXISTS idx_scan_reports_filter ON scan_reports(scan_type, status, start_time, id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_cleanup_state_one_active ON cleanup_state(is_active) WHERE is_active",
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_file_changes_state_one_active ON file_changes_state(is_active) WHERE is_active"
         ]
         
         print("Creating performance indexes...")
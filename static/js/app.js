@@ -326,6 +326,7 @@ class ProgressManager {
         this.progressText = document.querySelector('.progress-text');
         this.progressContainer = document.querySelector('.progress-container');
         this.checkInterval = null;
+        this.eventSource = null;
         this.operationType = 'scan'; // 'scan', 'cleanup', or 'file-changes'
     }
 
@@ -397,42 +398,59 @@ class ProgressManager {
             this.updateFileChangesButton(true);
         }
         
+        // Cleanup and file changes push their status over Server-Sent Events when supported
+        const streamPath = {
+            'cleanup': '/cleanup-status/stream',
+            'file-changes': '/file-changes-status/stream'
+        }[operationType];
+        if (streamPath && window.EventSource) {
+            this.eventSource = new EventSource(`${this.api.baseURL}${streamPath}`);
+            this.eventSource.onmessage = (event) => {
+                try {
+                    this.handleStatus(JSON.parse(event.data), operationType);
+                } catch (error) {
+                    console.error(`Failed to handle ${operationType} status:`, error);
+                }
+            };
+            return;
+        }
+        
         this.checkInterval = setInterval(async () => {
             try {
                 let status;
-                let isRunning = false;
                 
                 // Get status based on operation type
                 if (operationType === 'scan') {
                     status = await this.api.getScanStatus();
-                    isRunning = status.is_scanning;
                 } else if (operationType === 'cleanup') {
                     status = await this.api.getCleanupStatus();
-                    isRunning = status.is_running;
-                    // Debug log for cleanup status
-                    console.log('Cleanup status:', status);
                 } else if (operationType === 'file-changes') {
                     status = await this.api.getFileChangesStatus();
-                    isRunning = status.is_running;
                 }
                 
-                if (isRunning) {
-                    const progress = this.calculateProgress(status, operationType);
-                    this.update(progress.percentage, progress.text, progress.details);
-                } else if (status.phase === 'complete' || status.phase === 'completed' || status.phase === 'cancelled' || status.phase === 'error') {
-                    // Operation is complete - show completion state
-                    this.complete(operationType, status);
-                } else {
-                    // Still initializing or in transition - keep showing progress
-                    const progress = this.calculateProgress(status, operationType);
-                    this.update(progress.percentage, progress.text, progress.details);
-                }
+                this.handleStatus(status, operationType);
             } catch (error) {
                 console.error(`Failed to check ${operationType} status:`, error);
             }
         }, 1000); // Poll every 1 second
     }
     
+    handleStatus(status, operationType) {
+        const isRunning = operationType === 'scan' ? status.is_scanning : status.is_running;
+        
+        if (isRunning) {
+            const progress = this.calculateProgress(status, operationType);
+            this.update(progress.percentage, progress.text, progress.details);
+        } else if (status.phase === 'complete' || status.phase === 'completed' || status.phase === 'cancelled' || status.phase === 'error') {
+            // Operation is complete - show completion state
+            this.complete(operationType, status);
+        } else {
+            // Still initializing or in transition - keep showing progress
+            const progress = this.calculateProgress(status, operationType);
+            this.update(progress.percentage, progress.text, progress.details);
+        }
+    }
+    
     updateCleanupButton(isRunning) {
         const cleanupButton = document.querySelector('[onclick*="cleanupOrphaned"]');
         if (cleanupButton) {
@@ -475,6 +493,10 @@ class ProgressManager {
             clearInterval(this.checkInterval);
             this.checkInterval = null;
         }
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
     }
 
     calculateProgress(status, operationType = 'scan') {
@@ -30,7 +30,10 @@ def create_test_app():
     from flask_cors import CORS
     from flask_wtf.csrf import CSRFProtect
     
+    from pixelprobe.utils.helpers import ORJSONProvider
+    
     test_app = Flask(__name__)
+    test_app.json = ORJSONProvider(test_app)
     test_app.config['TESTING'] = True
     test_app.config['SECRET_KEY'] = 'test-secret-key'
     test_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
@@ -125,8 +128,19 @@ def db(app):
         
         _db.create_all()
         yield _db
+
+        # Debounced scheduler reloads share the in-memory connection; let them finish first
+        from pixelprobe.api.admin_routes import cancel_scheduler_update
+        cancel_scheduler_update()
+
         _db.session.remove()
         _db.drop_all()
+        
+        # Status snapshots, job clocks and cached listings outlive the tables they were read from
+        from pixelprobe.api.maintenance_routes import _status_cache, _job_clock
+        _status_cache.clear()
+        _job_clock.clear()
+        app.extensions.pop('pixelprobe_config_cache', None)
 
 @pytest.fixture(scope='session')
 def test_data_dir():
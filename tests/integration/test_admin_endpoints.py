@@ -1,5 +1,7 @@
 import pytest
 import json
+import time
+from unittest.mock import Mock, patch
 from models import db, ScanSchedule, IgnoredErrorPattern
 
 class TestScheduleEndpoints:
@@ -73,6 +75,103 @@ class TestScheduleEndpoints:
         response = client.delete('/api/schedules/99999')
         assert response.status_code == 404
     
+    def test_update_schedule_reloads_only_on_job_changes(self, client, app, db):
+        """Test that only cron/active changes rebuild scheduler jobs"""
+        with app.app_context():
+            schedule = ScanSchedule(
+                name='Test Update',
+                cron_expression='0 1 * * *',
+                is_active=True
+            )
+            db.session.add(schedule)
+            db.session.commit()
+            schedule_id = schedule.id
+            
+            with patch('pixelprobe.api.admin_routes._debounced_scheduler_update') as mock_update:
+                # Unchanged values are a no-op
+                response = client.put(f'/api/schedules/{schedule_id}',
+                    json={'name': 'Test Update', 'cron_expression': '0 1 * * *'})
+                assert response.status_code == 200
+                
+                response = client.put(f'/api/schedules/{schedule_id}',
+                    json={'scan_type': 'deep'})
+                assert response.status_code == 200
+                assert response.get_json()['scan_type'] == 'deep'
+                mock_update.assert_not_called()
+                
+                response = client.put(f'/api/schedules/{schedule_id}',
+                    json={'cron_expression': '0 3 * * *'})
+                assert response.status_code == 200
+                mock_update.assert_called_once()
+    
+    def test_scheduler_updates_are_debounced(self):
+        """Test that rapid schedule edits coalesce into one scheduler reload"""
+        from pixelprobe.api import admin_routes
+        
+        mock_scheduler = Mock()
+        with patch.object(admin_routes, 'scheduler', mock_scheduler), \
+             patch.object(admin_routes, '_SCHEDULER_DEBOUNCE_SECONDS', 0.05):
+            for _ in range(5):
+                admin_routes._debounced_scheduler_update()
+            time.sleep(0.3)
+        
+        mock_scheduler.update_schedules.assert_called_once()
+    
+    def test_scheduler_updates_not_starved_by_bursts(self):
+        """Test that continuous edits still reload within the max delay"""
+        from pixelprobe.api import admin_routes
+        
+        mock_scheduler = Mock()
+        with patch.object(admin_routes, 'scheduler', mock_scheduler), \
+             patch.object(admin_routes, '_SCHEDULER_DEBOUNCE_SECONDS', 0.1), \
+             patch.object(admin_routes, '_SCHEDULER_MAX_DELAY_SECONDS', 0.2):
+            # Edits every 50ms would keep a plain debounce waiting forever
+            for _ in range(10):
+                admin_routes._debounced_scheduler_update()
+                time.sleep(0.05)
+            assert mock_scheduler.update_schedules.called
+            time.sleep(0.3)
+    
+    def test_scheduler_reload_keeps_newer_timer(self):
+        """Test a reload that fires late does not clear the timer a later edit just scheduled"""
+        import threading
+        from pixelprobe.api import admin_routes
+        
+        newer = threading.Timer(60, lambda: None)
+        with patch.object(admin_routes, 'scheduler', Mock()), \
+             patch.object(admin_routes, '_scheduler_update_timer', newer), \
+             patch.object(admin_routes, '_scheduler_update_deadline', 123.0):
+            admin_routes._run_scheduler_update()
+            assert admin_routes._scheduler_update_timer is newer
+            assert admin_routes._scheduler_update_deadline == 123.0
+    
+    def test_cancel_scheduler_update_waits_for_reload(self):
+        """Test cancelling drops a pending reload and waits for one in progress"""
+        import threading
+        from pixelprobe.api import admin_routes
+        
+        started = threading.Event()
+        finished = []
+        def slow_update():
+            started.set()
+            time.sleep(0.1)
+            finished.append(True)
+        mock_scheduler = Mock()
+        mock_scheduler.update_schedules.side_effect = slow_update
+        
+        with patch.object(admin_routes, 'scheduler', mock_scheduler), \
+             patch.object(admin_routes, '_SCHEDULER_DEBOUNCE_SECONDS', 0.0):
+            admin_routes._debounced_scheduler_update()
+            assert started.wait(1)
+            admin_routes.cancel_scheduler_update()
+            assert finished == [True]
+            
+            with patch.object(admin_routes, '_SCHEDULER_DEBOUNCE_SECONDS', 60):
+                admin_routes._debounced_scheduler_update()
+                admin_routes.cancel_scheduler_update()
+            assert admin_routes._scheduler_update_timer is None
+            assert mock_scheduler.update_schedules.call_count == 1
+    
     def test_get_schedules(self, client, app, db):
         """Test getting all schedules"""
         with app.app_context():
@@ -202,6 +301,18 @@ class TestExclusionEndpoints:
             assert exclusion is not None
             assert exclusion.is_active is False
     
+    def test_readd_removed_exclusion(self, client, db, app):
+        """Test that a removed exclusion can be added again"""
+        from models import Exclusion
+        
+        with app.app_context():
+            assert client.post('/api/exclusions/path', json={'item': '/again'}).status_code == 200
+            assert client.delete('/api/exclusions/path', json={'item': '/again'}).status_code == 200
+            
+            response = client.post('/api/exclusions/path', json={'item': '/again'})
+            assert response.status_code == 200
+            assert Exclusion.query.filter_by(value='/again').one().is_active is True
+    
     def test_remove_nonexistent_exclusion(self, client, db):
         """Test removing non-existent exclusion"""
         response = client.delete('/api/exclusions/path',
@@ -216,6 +327,56 @@ class TestExclusionEndpoints:
         assert response.status_code == 400
         assert 'Invalid exclusion type' in response.get_json()['error']
 
+    def test_update_exclusions_replaces_list(self, client, db, app):
+        """Test replacing all exclusions, including previously stored values"""
+        from models import Exclusion
+
+        with app.app_context():
+            response = client.put('/api/exclusions',
+                json={'paths': ['/a', '/b'], 'extensions': ['.tmp']})
+            assert response.status_code == 200
+
+            response = client.put('/api/exclusions',
+                json={'paths': ['/b', '/c'], 'extensions': []})
+            assert response.status_code == 200
+
+            active = Exclusion.query.filter_by(is_active=True).all()
+            assert sorted((e.exclusion_type, e.value) for e in active) == [('path', '/b'), ('path', '/c')]
+            assert Exclusion.query.count() == 4
+
+    def test_update_exclusions_repeated_values(self, client, db, app):
+        """Test a list that repeats a path or extension stores each value once"""
+        from models import Exclusion
+
+        with app.app_context():
+            response = client.put('/api/exclusions',
+                json={'paths': ['/a', '/a', '/b'], 'extensions': ['.tmp', '.tmp']})
+            assert response.status_code == 200
+            assert Exclusion.query.count() == 3
+            assert client.get('/api/exclusions').get_json()['paths'] == ['/a', '/b']
+
+    def test_get_exclusions_cache_invalidated_on_write(self, client, db, app):
+        """Test that the cached exclusions listing is dropped after a write"""
+        from models import Exclusion
+
+        with app.app_context():
+            assert client.get('/api/exclusions').get_json()['paths'] == []
+
+            # Direct DB writes are served from cache until the TTL expires
+            db.session.add(Exclusion(exclusion_type='path', value='/direct', is_active=True))
+            db.session.commit()
+            assert client.get('/api/exclusions').get_json()['paths'] == []
+
+            client.post('/api/exclusions/path', json={'item': '/via/api'})
+            assert sorted(client.get('/api/exclusions').get_json()['paths']) == ['/direct', '/via/api']
+
+    def test_update_exclusions_malformed_body(self, client, db):
+        """Test replacing exclusions with a malformed JSON body"""
+        response = client.put('/api/exclusions',
+            data='{not json', content_type='application/json')
+        assert response.status_code == 400
+        assert 'No JSON data provided' in response.get_json()['error']
+
 
 class TestIgnoredPatternsEndpoints:
     """Test ignored patterns endpoints"""
@@ -257,6 +418,22 @@ class TestIgnoredPatternsEndpoints:
             assert response.status_code == 400
             assert 'already exists' in response.get_json()['error']
     
+    def test_add_dangerous_pattern(self, client, db):
+        """Test that inline flags, named groups and comments are rejected"""
+        for pattern in ['(?i)moov atom', '(?P<name>error)', 'error(?#comment)']:
+            response = client.post('/api/ignored-patterns',
+                json={'pattern': pattern})
+            assert response.status_code == 400
+            assert 'dangerous regex' in response.get_json()['error']
+    
+    def test_add_invalid_regex_pattern(self, client, db):
+        """Test that patterns which do not compile are rejected"""
+        response = client.post('/api/ignored-patterns',
+            json={'pattern': 'moov atom (not found'})
+        assert response.status_code == 400
+        assert 'Invalid regular expression' in response.get_json()['error']
+        assert IgnoredErrorPattern.query.count() == 0
+    
     def test_delete_ignored_pattern(self, client, app, db):
         """Test deleting an ignored pattern"""
         with app.app_context():
@@ -283,4 +460,42 @@ class TestIgnoredPatternsEndpoints:
         """Test deleting non-existent pattern"""
         response = client.delete('/api/ignored-patterns/99999')
         assert response.status_code == 404
-        assert 'not found' in response.get_json()['error']
\ No newline at end of file
+        assert 'not found' in response.get_json()['error']
+    
+    def test_readd_deleted_pattern(self, client, app, db):
+        """Test that a soft-deleted pattern can be added again"""
+        with app.app_context():
+            response = client.post('/api/ignored-patterns',
+                json={'pattern': 'moov atom not found'})
+            assert response.status_code == 201
+            pattern_id = response.get_json()['id']
+            
+            assert client.delete(f'/api/ignored-patterns/{pattern_id}').status_code == 200
+            
+            response = client.post('/api/ignored-patterns',
+                json={'pattern': 'moov atom not found', 'description': 'again'})
+            assert response.status_code == 201
+            assert response.get_json()['id'] == pattern_id
+            
+            pattern = IgnoredErrorPattern.query.get(pattern_id)
+            assert pattern.is_active is True
+            assert pattern.description == 'again'
+
+class TestRateLimits:
+    """Test rate limits marked on blueprint views are enforced by the app's limiter"""
+    
+    def test_mark_as_good_rate_limited(self):
+        """Test the eleventh mark-as-good request in a minute gets 429"""
+        from flask import Flask
+        from flask_limiter import Limiter
+        from pixelprobe.api.admin_routes import admin_bp
+        
+        limited_app = Flask(__name__)
+        Limiter(app=limited_app, key_func=lambda: 'test-client', storage_uri='memory://')
+        limited_app.register_blueprint(admin_bp)
+        limited_client = limited_app.test_client()
+        
+        for _ in range(10):
+            response = limited_client.post('/api/mark-as-good', json={'file_ids': []})
+            assert response.status_code == 200
+        assert limited_client.post('/api/mark-as-good', json={'file_ids': []}).status_code == 429
@@ -7,6 +7,8 @@ import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+from models import ScanConfiguration
+
 class TestScanEndpoints:
     """Test scan-related API endpoints"""
     
@@ -170,7 +172,15 @@ class TestAdminEndpoints:
         # Verify file was marked as good
         assert mock_corrupted_result.marked_as_good == True
         assert mock_corrupted_result.is_corrupted == False
-    
+
+    def test_mark_as_good_empty(self, client):
+        """Test POST /api/mark-as-good with no file IDs"""
+        response = client.post('/api/mark-as-good', json={'file_ids': []})
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['marked_files'] == 0
+
     def test_get_configurations(self, client, mock_scan_configuration):
         """Test GET /api/configurations endpoint"""
         # Note: There's a mismatch between the API expecting path/created_at 
@@ -198,6 +208,24 @@ class TestAdminEndpoints:
             # Expected due to model/API mismatch
             pass
 
+    def test_add_configuration_reactivates_existing(self, client, db):
+        """Test POST /api/configurations upserts on path"""
+        response = client.post('/api/configurations', json={'path': '/upsert/test/path'})
+        assert response.status_code == 200
+        assert json.loads(response.data)['message'] == 'Configuration added successfully'
+
+        config = ScanConfiguration.query.filter_by(path='/upsert/test/path').one()
+        config.is_active = False
+        db.session.commit()
+
+        response = client.post('/api/configurations', json={'path': '/upsert/test/path'})
+        assert response.status_code == 200
+        assert json.loads(response.data)['message'] == 'Configuration reactivated'
+
+        db.session.refresh(config)
+        assert config.is_active is True
+        assert ScanConfiguration.query.filter_by(path='/upsert/test/path').count() == 1
+
 
 class TestExportEndpoints:
     """Test export API endpoints"""
@@ -208,6 +236,8 @@ class TestExportEndpoints:
         assert response.status_code == 200
         assert response.content_type == 'text/csv; charset=utf-8'
         
+        assert response.headers['X-Accel-Buffering'] == 'no'
+        
         # Check CSV content
         csv_data = response.data.decode('utf-8')
         assert 'File Path' in csv_data
@@ -222,6 +252,240 @@ class TestExportEndpoints:
         csv_data = response.data.decode('utf-8')
         assert mock_corrupted_result.file_path in csv_data
 
+    def test_export_large_selection(self, client, db):
+        """Test exporting a selection larger than LARGE_ID_LIST"""
+        from models import ScanResult
+        from pixelprobe.utils.helpers import LARGE_ID_LIST
+
+        db.session.execute(ScanResult.__table__.insert(), [
+            {'file_path': f'/selection/{i}.mp4'} for i in range(LARGE_ID_LIST + 10)
+        ])
+        db.session.commit()
+        ids = [row.id for row in ScanResult.query.filter(ScanResult.file_path.like('/selection/%'))]
+
+        response = client.post('/api/export-csv', json={'format': 'json', 'file_ids': ids[1:]})
+        assert response.status_code == 200
+        exported = {item['id'] for item in json.loads(response.data)}
+        assert exported == set(ids[1:])
+
+        # Ids sent as strings are coerced rather than compared as text
+        response = client.post('/api/export-csv', json={'format': 'json', 'file_ids': [str(i) for i in ids[1:]]})
+        assert response.status_code == 200
+        assert {item['id'] for item in json.loads(response.data)} == set(ids[1:])
+
+        response = client.post('/api/export-csv', json={'file_ids': ids[1:] + ['abc']})
+        assert response.status_code == 400
+
+        # The export service coerces the same way for its own callers
+        from pixelprobe.services.export_service import ExportService
+        exported = ExportService().export_to_json(file_ids=[str(i) for i in ids[1:]])
+        assert {item['id'] for item in exported['results']} == set(ids[1:])
+
+    def test_export_resumes_from_cursor(self, client, db):
+        """Test exports are ordered by ID and resume after a cursor"""
+        from models import ScanResult
+
+        db.session.add_all([ScanResult(file_path=f'/cursor/{i}.mp4') for i in range(5)])
+        db.session.commit()
+        ids = sorted(row.id for row in ScanResult.query.filter(ScanResult.file_path.like('/cursor/%')))
+
+        response = client.post('/api/export-csv', json={'format': 'json', 'cursor': ids[1]})
+        assert response.status_code == 200
+        assert [item['id'] for item in json.loads(response.data)] == ids[2:]
+
+        response = client.get(f'/api/export-csv?cursor={ids[3]}')
+        rows = response.data.decode('utf-8').splitlines()[1:]
+        assert [int(row.split(',')[0]) for row in rows] == ids[4:]
+
+        response = client.post('/api/export-csv', json={'cursor': 'abc'})
+        assert response.status_code == 400
+
+    def test_export_filters_treat_null_warnings_as_none(self, client, db):
+        """Test export filters match rows whose has_warnings is NULL"""
+        from models import ScanResult
+
+        db.session.add_all([
+            ScanResult(file_path='/export/null_corrupt.mp4', is_corrupted=True,
+                       has_warnings=None, marked_as_good=False),
+            ScanResult(file_path='/export/null_healthy.mp4', is_corrupted=False,
+                       has_warnings=None, marked_as_good=False),
+            ScanResult(file_path='/export/warned.mp4', is_corrupted=False,
+                       has_warnings=True, marked_as_good=False),
+        ])
+        db.session.commit()
+
+        def exported(filter_type):
+            response = client.post('/api/export-csv', json={'format': 'json', 'filter': filter_type})
+            assert response.status_code == 200
+            return {item['file_path'] for item in json.loads(response.data)}
+
+        assert '/export/null_corrupt.mp4' in exported('corrupted')
+        assert '/export/warned.mp4' not in exported('corrupted')
+        assert '/export/null_healthy.mp4' in exported('healthy')
+        assert '/export/warned.mp4' not in exported('healthy')
+        assert exported('warning') >= {'/export/warned.mp4'}
+        assert '/export/null_healthy.mp4' not in exported('warning')
+
+    def test_export_pdf_limits_rendered_rows(self, client, db, mock_scan_result, mock_corrupted_result):
+        """Test PDF export renders at most PDF_MAX_ROWS rows"""
+        with patch('pixelprobe.api.export_routes.PDF_MAX_ROWS', 1):
+            response = client.post('/api/export-csv', json={'format': 'pdf', 'filter': 'all'})
+        assert response.status_code == 200
+        assert response.content_type == 'application/pdf'
+        assert response.data.startswith(b'%PDF')
+
+    def test_view_file_xaccel_redirect(self, client, db, tmp_path):
+        """Test view and download delegate to the proxy when X-Accel is enabled"""
+        from models import ScanResult
+
+        media_file = tmp_path / 'clips' / 'my clip.mp4'
+        media_file.parent.mkdir()
+        media_file.write_bytes(b'\x00' * 16)
+        result = ScanResult(file_path=str(media_file), file_type='video/mp4')
+        db.session.add(result)
+        db.session.commit()
+
+        with patch('pixelprobe.api.export_routes.USE_XACCEL', True), \
+             patch('pixelprobe.api.export_routes.XACCEL_MEDIA_ROOT', str(tmp_path)):
+            response = client.get(f'/api/view/{result.id}')
+
+        assert response.status_code == 200
+        assert response.headers['X-Accel-Redirect'] == '/_protected/clips/my%20clip.mp4'
+        assert response.data == b''
+
+        with patch('pixelprobe.api.export_routes.USE_XACCEL', True), \
+             patch('pixelprobe.api.export_routes.XACCEL_MEDIA_ROOT', str(tmp_path)):
+            response = client.get(f'/api/download/{result.id}')
+
+        assert response.headers['X-Accel-Redirect'] == '/_protected/clips/my%20clip.mp4'
+        assert response.headers['Content-Disposition'] == "attachment; filename*=UTF-8''my%20clip.mp4"
+        assert response.data == b''
+
+
+    def test_view_file_range_request(self, client, db, tmp_path):
+        """Test GET /api/view/<id> serves partial content for video ranges"""
+        from models import ScanResult
+
+        media_file = tmp_path / 'clip.mp4'
+        media_file.write_bytes(bytes(range(256)) * 16)
+        result = ScanResult(file_path=str(media_file), file_type='video/mp4')
+        db.session.add(result)
+        db.session.commit()
+
+        response = client.get(f'/api/view/{result.id}', headers={'Range': 'bytes=10-19'})
+        assert response.status_code == 206
+        assert response.headers['Content-Range'] == 'bytes 10-19/4096'
+        assert response.data == media_file.read_bytes()[10:20]
+
+        # Open-ended ranges are capped at MAX_RANGE_CHUNK
+        with patch('pixelprobe.api.export_routes.MAX_RANGE_CHUNK', 100):
+            response = client.get(f'/api/view/{result.id}', headers={'Range': 'bytes=0-'})
+        assert response.status_code == 206
+        assert response.headers['Content-Range'] == 'bytes 0-100/4096'
+
+    def test_view_file_range_seeks_past_server_wrapper(self, client, db, tmp_path):
+        """Test ranged views do not iterate through a non-seekable server file wrapper"""
+        from models import ScanResult
+
+        class NonSeekableWrapper:
+            def __init__(self, filelike, blksize=8192):
+                raise AssertionError('server file wrapper used for a range request')
+
+        media_file = tmp_path / 'seek.mp4'
+        media_file.write_bytes(bytes(range(256)) * 64)
+        result = ScanResult(file_path=str(media_file), file_type='video/mp4')
+        db.session.add(result)
+        db.session.commit()
+
+        response = client.get(f'/api/view/{result.id}', headers={'Range': 'bytes=15000-15009'},
+                              environ_overrides={'wsgi.file_wrapper': NonSeekableWrapper})
+        assert response.status_code == 206
+        assert response.data == media_file.read_bytes()[15000:15010]
+
+    def test_view_and_download_missing_file(self, client, db, tmp_path):
+        """Test view and download return 404 when the file is gone"""
+        from models import ScanResult
+
+        result = ScanResult(file_path=str(tmp_path / 'gone.mp4'), file_type='video/mp4')
+        db.session.add(result)
+        db.session.commit()
+
+        for endpoint in ('view', 'download'):
+            response = client.get(f'/api/{endpoint}/{result.id}')
+            assert response.status_code == 404
+            assert json.loads(response.data)['error'] == 'File not found'
+
+    def test_view_file_conditional(self, client, db, tmp_path):
+        """Test GET /api/view/<id> sends validators and answers revalidation with 304"""
+        from models import ScanResult
+
+        media_file = tmp_path / 'cached.mp4'
+        media_file.write_bytes(b'\x02' * 512)
+        result = ScanResult(file_path=str(media_file), file_type='video/mp4')
+        db.session.add(result)
+        db.session.commit()
+
+        response = client.get(f'/api/view/{result.id}')
+        assert response.status_code == 200
+        assert 'public' in response.headers['Cache-Control']
+        etag = response.headers['ETag']
+        last_modified = response.headers['Last-Modified']
+
+        response = client.get(f'/api/view/{result.id}', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        response = client.get(f'/api/view/{result.id}', headers={'If-Modified-Since': last_modified})
+        assert response.status_code == 304
+
+        # A stale If-Range validator returns the whole file rather than the range
+        response = client.get(f'/api/view/{result.id}',
+                              headers={'Range': 'bytes=0-9', 'If-Range': '"stale"'})
+        assert response.status_code == 200
+        assert len(response.data) == 512
+
+    def test_view_file_range_forms(self, client, db, tmp_path):
+        """Test suffix, malformed and unsatisfiable ranges on GET /api/view/<id>"""
+        from models import ScanResult
+
+        media_file = tmp_path / 'forms.mp4'
+        media_file.write_bytes(bytes(range(256)) * 4)
+        result = ScanResult(file_path=str(media_file), file_type='video/mp4')
+        db.session.add(result)
+        db.session.commit()
+
+        response = client.get(f'/api/view/{result.id}', headers={'Range': 'bytes=-16'})
+        assert response.status_code == 206
+        assert response.headers['Content-Range'] == 'bytes 1008-1023/1024'
+        assert response.data == media_file.read_bytes()[-16:]
+
+        # Unparseable and multi-range headers are ignored and the whole file is served
+        for range_header in ('bytes=abc', 'bytes=0-9,20-29'):
+            response = client.get(f'/api/view/{result.id}', headers={'Range': range_header})
+            assert response.status_code == 200
+            assert len(response.data) == 1024
+
+        response = client.get(f'/api/view/{result.id}', headers={'Range': 'bytes=5000-6000'})
+        assert response.status_code == 416
+
+    def test_download_file_conditional(self, client, db, tmp_path):
+        """Test GET /api/download/<id> answers revalidation with 304"""
+        from models import ScanResult
+
+        media_file = tmp_path / 'download.mp4'
+        media_file.write_bytes(b'\x01' * 64)
+        result = ScanResult(file_path=str(media_file), file_type='video/mp4')
+        db.session.add(result)
+        db.session.commit()
+
+        response = client.get(f'/api/download/{result.id}')
+        assert response.status_code == 200
+        assert response.data == media_file.read_bytes()
+        assert 'max-age=' in response.headers['Cache-Control']
+        etag = response.headers['ETag']
+
+        response = client.get(f'/api/download/{result.id}', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
 
 class TestMaintenanceEndpoints:
     """Test maintenance API endpoints"""
@@ -236,6 +500,19 @@ class TestMaintenanceEndpoints:
         assert 'phase' in data
         assert 'progress_percentage' in data
     
+    def test_cleanup_status_stream(self, client, db):
+        """Test GET /api/cleanup-status/stream sends status only when it changes"""
+        with patch('pixelprobe.api.maintenance_routes.STATUS_STREAM_INTERVAL', 0.01), \
+             patch('pixelprobe.api.maintenance_routes.STATUS_STREAM_MAX_SECONDS', 0.1):
+            response = client.get('/api/cleanup-status/stream')
+            body = response.get_data(as_text=True)
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        events = [line[len('data: '):] for line in body.splitlines() if line.startswith('data: ')]
+        assert len(events) == 1
+        assert json.loads(events[0])['phase'] == 'idle'
+    
     def test_file_changes_status(self, client, db):
         """Test GET /api/file-changes-status endpoint"""
         response = client.get('/api/file-changes-status')
@@ -125,22 +125,74 @@ class TestMaintenanceOperationEndpoints:
     
     def test_cleanup_already_running(self, client, app, db, monkeypatch):
         """Test starting cleanup when already running"""
-        # Mock thread check with a thread that stays alive
-        import threading
-        import time
-        
-        def long_running():
-            time.sleep(1)  # Keep thread alive for 1 second
-        
-        mock_thread = threading.Thread(target=long_running)
-        mock_thread.start()
-        monkeypatch.setattr('pixelprobe.api.maintenance_routes.current_cleanup_thread', mock_thread)
+        # An active record claims the job, whichever worker process started it
+        with app.app_context():
+            db.session.add(CleanupState(is_active=True, phase='checking_files', phase_number=2))
+            db.session.commit()
         
         response = client.post('/api/cleanup-orphaned')
         assert response.status_code == 409
         assert 'already in progress' in response.get_json()['error']
         
-        mock_thread.join()
+        with app.app_context():
+            assert CleanupState.query.count() == 1
+    
+    def test_file_changes_claim_is_exclusive(self, client, app, db, monkeypatch):
+        """Test a second file changes check is refused while the first is active"""
+        monkeypatch.setattr('pixelprobe.api.maintenance_routes.check_file_changes_async', lambda *args: None)
+        
+        response = client.post('/api/file-changes')
+        assert response.status_code == 200
+        check_id = response.get_json()['check_id']
+        
+        response = client.post('/api/file-changes')
+        assert response.status_code == 409
+        
+        with app.app_context():
+            record = FileChangesState.query.one()
+            assert record.check_id == check_id
+            assert record.is_active is True
+            assert record.phase == 'starting'
+            assert client.get('/api/file-changes-status').get_json()['phase'] == 'starting'
+    
+    def test_only_one_active_record(self, app, db):
+        """Test the database rejects a second active record, as a racing claim from another worker would insert"""
+        from sqlalchemy.exc import IntegrityError
+        
+        with app.app_context():
+            db.session.add(CleanupState(is_active=True, phase='checking_files'))
+            db.session.add(CleanupState(is_active=False, phase='complete'))
+            db.session.commit()
+            
+            db.session.add(CleanupState(is_active=True, phase='starting'))
+            with pytest.raises(IntegrityError):
+                db.session.commit()
+            db.session.rollback()
+            
+            with pytest.raises(RuntimeError, match='already in progress'):
+                app.maintenance_service.start_cleanup()
+            assert CleanupState.query.filter_by(is_active=True).count() == 1
+            assert app.maintenance_service.cleanup_state['is_running'] is False
+    
+    def test_cleanup_job_failure_recorded(self, app, db, monkeypatch):
+        """Test a failing cleanup job marks its record as errored"""
+        from pixelprobe.api import maintenance_routes
+        
+        def failing_service(database_uri):
+            raise RuntimeError('boom')
+        monkeypatch.setattr(maintenance_routes, '_get_maintenance_service', failing_service)
+        
+        with app.app_context():
+            cleanup = CleanupState(is_active=True, phase='starting', phase_number=1)
+            db.session.add(cleanup)
+            db.session.commit()
+            
+            maintenance_routes.cleanup_orphaned_async(app, cleanup.id)
+            
+            db.session.refresh(cleanup)
+            assert cleanup.phase == 'error'
+            assert cleanup.is_active is False
+            assert cleanup.progress_message == 'Error: boom'
     
     def test_vacuum_database(self, client, app, db):
         """Test vacuum database endpoint"""
@@ -148,5 +200,147 @@ class TestMaintenanceOperationEndpoints:
         assert response.status_code == 200
         data = response.get_json()
         assert 'message' in data
+        assert data['vacuum_mode'] == 'full'
         assert 'size_before_bytes' in data
-        assert 'size_after_bytes' in data
\ No newline at end of file
+        assert 'size_after_bytes' in data
+
+class TestMaintenanceStatusEndpoints:
+    """Test maintenance status endpoints"""
+    
+    def test_cleanup_status_cached_until_commit(self, client, app, db):
+        """Test cleanup status is served from cache until a status record is committed"""
+        from sqlalchemy import text
+        
+        with app.app_context():
+            cleanup = CleanupState(is_active=True, phase='scanning_database', phase_number=1)
+            db.session.add(cleanup)
+            db.session.commit()
+            
+            assert client.get('/api/cleanup-status').get_json()['phase'] == 'scanning_database'
+            
+            # Writes that bypass the ORM are only picked up once the snapshot expires
+            db.session.execute(text("UPDATE cleanup_state SET phase = 'checking_files'"))
+            db.session.commit()
+            assert client.get('/api/cleanup-status').get_json()['phase'] == 'scanning_database'
+            
+            cleanup = db.session.get(CleanupState, cleanup.id)
+            cleanup.phase = 'complete'
+            db.session.commit()
+            data = client.get('/api/cleanup-status').get_json()
+            assert data['phase'] == 'complete'
+            assert data['progress_percentage'] == 100
+    
+    def test_finished_status_not_cached(self, client, app, db):
+        """Test a job claimed outside this process shows up on the next poll after a finished one"""
+        from sqlalchemy import text
+        
+        with app.app_context():
+            db.session.add(CleanupState(is_active=False, phase='complete', phase_number=3))
+            db.session.commit()
+            assert client.get('/api/cleanup-status').get_json()['phase'] == 'complete'
+            
+            # Another worker claims a new job; no ORM events fire in this process
+            db.session.execute(text(
+                "INSERT INTO cleanup_state (cleanup_id, is_active, phase, phase_number, phase_current, "
+                "phase_total, files_processed, total_files, orphaned_found, start_time) "
+                "VALUES ('other-worker', 1, 'starting', 1, 0, 0, 0, 0, 0, CURRENT_TIMESTAMP)"
+            ))
+            db.session.commit()
+            data = client.get('/api/cleanup-status').get_json()
+            assert data['is_running'] is True
+            assert data['phase'] == 'starting'
+    
+    def test_file_changes_status_not_modified(self, client, app, db):
+        """Test file changes status answers 304 while the record is unchanged"""
+        with app.app_context():
+            check = FileChangesState(check_id='etag-check', is_active=True, phase='checking_hashes')
+            db.session.add(check)
+            db.session.commit()
+            
+            response = client.get('/api/file-changes-status')
+            assert response.status_code == 200
+            assert response.headers['Cache-Control'] == 'no-cache'
+            etag = response.headers['ETag']
+            
+            response = client.get('/api/file-changes-status', headers={'If-None-Match': etag})
+            assert response.status_code == 304
+            assert response.data == b''
+            
+            check = db.session.get(FileChangesState, check.id)
+            check.files_processed = 10
+            db.session.commit()
+            response = client.get('/api/file-changes-status', headers={'If-None-Match': etag})
+            assert response.status_code == 200
+            assert response.get_json()['files_processed'] == 10
+            assert response.headers['ETag'] != etag
+    
+    def test_status_duration_uses_job_clock(self, client, app, db):
+        """Test duration comes from the monotonic job clock and falls back to start_time"""
+        from datetime import datetime, timedelta, timezone
+        from pixelprobe.api import maintenance_routes
+        
+        with app.app_context():
+            started = datetime.now(timezone.utc) - timedelta(seconds=60)
+            check = FileChangesState(check_id='clock-check', is_active=True, phase='checking_hashes',
+                                     start_time=started)
+            db.session.add(check)
+            db.session.commit()
+            
+            # No clock entry for this record, e.g. after a restart
+            data = client.get('/api/file-changes-status').get_json()
+            assert data['duration'] >= 60
+            assert data['start_time'] == pytest.approx(started.timestamp())
+            
+            maintenance_routes._job_clock[FileChangesState] = (check.id, time.monotonic() - 5, 1234.0)
+            data = client.get('/api/file-changes-status').get_json()
+            assert 5 <= data['duration'] < 60
+            assert data['start_time'] == 1234.0
+    
+    def test_combined_maintenance_status(self, client, app, db):
+        """Test the combined endpoint reports both operations from one snapshot"""
+        with app.app_context():
+            response = client.get('/api/maintenance-status')
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data['cleanup']['phase'] == 'idle'
+            assert data['file_changes']['phase'] == 'idle'
+            
+            db.session.add(CleanupState(is_active=True, phase='checking_files', phase_number=2,
+                                        orphaned_found=3))
+            db.session.add(FileChangesState(check_id='combined', is_active=False, phase='complete',
+                                            changes_found=4))
+            db.session.commit()
+            
+            response = client.get('/api/maintenance-status')
+            data = response.get_json()
+            assert data['cleanup']['orphaned_found'] == 3
+            assert data['file_changes']['changes_found'] == 4
+            assert data['file_changes']['progress_percentage'] == 100
+            assert client.get('/api/cleanup-status').get_json() == data['cleanup']
+            
+            response = client.get('/api/maintenance-status',
+                                  headers={'If-None-Match': response.headers['ETag']})
+            assert response.status_code == 304
+    
+    def test_cancel_cleanup_refreshes_status(self, client, app, db):
+        """Test cancelling only flags the newest active record and shows up in status"""
+        with app.app_context():
+            db.session.add(CleanupState(is_active=True, phase='checking_files', phase_number=2))
+            db.session.add(CleanupState(is_active=False, phase='complete', phase_number=3))
+            db.session.commit()
+            
+            assert client.get('/api/cleanup-status').get_json()['phase'] == 'complete'
+            response = client.post('/api/cancel-cleanup')
+            assert response.status_code == 400
+            
+            # Only one record can be active, so the stale one has to end before the next starts
+            CleanupState.query.filter_by(is_active=True).update({'is_active': False, 'phase': 'failed'})
+            latest = CleanupState(is_active=True, phase='checking_files', phase_number=2)
+            db.session.add(latest)
+            db.session.commit()
+            assert client.get('/api/cleanup-status').get_json()['progress_message'] == ''
+            
+            response = client.post('/api/cancel-cleanup')
+            assert response.status_code == 200
+            assert client.get('/api/cleanup-status').get_json()['progress_message'] == 'Cancellation requested...'
+            assert CleanupState.query.filter_by(cancel_requested=True).count() == 1
@@ -75,6 +75,174 @@ class TestBulkReportOperations:
                     expected_filename = f"scan_report_{report['report_id']}.json"
                 assert expected_filename in zf.namelist()
     
+    def test_export_scan_report_json(self, client, db):
+        """Test exporting a single report as an indented JSON attachment"""
+        self._create_test_reports(db)
+        report = ScanReport.query.filter_by(report_id='test_report_0').first()
+        report.directories_scanned = json.dumps(['/media/movies', '/media/tv'])
+        db.session.commit()
+        
+        response = client.get('/api/scan-reports/test_report_0/export')
+        assert response.status_code == 200
+        assert response.content_type == 'application/json'
+        assert 'attachment; filename=scan_report_test_report_0_' in response.headers['Content-Disposition']
+        assert response.data.startswith(b'{\n  "')
+        
+        data = json.loads(response.data)
+        assert data['report_id'] == 'test_report_0'
+        assert data['directories_scanned'] == ['/media/movies', '/media/tv']
+        assert data['export_metadata']['export_format'] == 'json'
+    
+    def test_scan_reports_cursor_pagination(self, client, db):
+        """Test next_cursor walks every report once without counting"""
+        from datetime import timedelta
+        
+        base = datetime.now(timezone.utc)
+        for i in range(5):
+            db.session.add(ScanReport(report_id=f'cursor_report_{i}', scan_type='full_scan',
+                                      status='completed', start_time=base + timedelta(minutes=i // 2)))
+        db.session.commit()
+        
+        response = client.get('/api/scan-reports?per_page=2')
+        assert response.json['total'] == 5
+        seen = [report['report_id'] for report in response.json['reports']]
+        cursor = response.json['next_cursor']
+        while cursor:
+            response = client.get('/api/scan-reports', query_string={'per_page': 2, 'cursor': cursor})
+            assert response.status_code == 200
+            assert 'total' not in response.json
+            seen.extend(report['report_id'] for report in response.json['reports'])
+            cursor = response.json['next_cursor']
+        
+        # Newest first; reports sharing a start_time come back in reverse id order
+        assert seen == [f'cursor_report_{i}' for i in (4, 3, 2, 1, 0)]
+        
+        response = client.get('/api/scan-reports?cursor=not-a-cursor')
+        assert response.status_code == 400
+    
+    def test_export_scan_report_pdf(self, client, db):
+        """Test single report PDFs render their scanned files table"""
+        from datetime import timedelta
+        
+        self._create_test_reports(db)
+        report = ScanReport.query.filter_by(report_id='test_report_0').first()
+        report.start_time = datetime.now(timezone.utc) - timedelta(hours=1)
+        db.session.commit()
+        
+        response = client.get('/api/scan-reports/test_report_0/pdf')
+        assert response.status_code == 200
+        assert response.content_type == 'application/pdf'
+        assert response.data.startswith(b'%PDF')
+        
+        response = client.get('/api/generate-pdf-report/full_scan/test_report_0')
+        assert response.status_code == 200
+        assert response.data.startswith(b'%PDF')
+    
+    def test_scan_report_duration_formatted(self, client, db):
+        """Test durations are formatted from whole seconds"""
+        self._create_test_reports(db)
+        for report_id, duration in (('test_report_0', 3725.6), ('test_report_1', 59.9)):
+            ScanReport.query.filter_by(report_id=report_id).first().duration_seconds = duration
+        db.session.commit()
+        
+        assert client.get('/api/scan-reports/test_report_0').json['duration_formatted'] == '1h 2m 5s'
+        formatted = {report['report_id']: report['duration_formatted']
+                     for report in client.get('/api/scan-reports').json['reports']}
+        assert formatted == {'test_report_0': '1h 2m 5s', 'test_report_1': '59s', 'test_report_2': 'N/A'}
+    
+    def test_scan_report_summary_by_type(self, client, db):
+        """Test each scan type gets its own summary block"""
+        self._create_test_reports(db)
+        db.session.add(ScanReport(report_id='cleanup_report', scan_type='cleanup', status='completed',
+                                  start_time=datetime.now(timezone.utc),
+                                  orphaned_records_found=4, orphaned_records_deleted=3))
+        db.session.commit()
+        
+        assert client.get('/api/scan-reports/test_report_0').json['summary']['success_rate'] == 60.0
+        assert client.get('/api/scan-reports/cleanup_report').json['summary'] == {
+            'orphaned_found': 4, 'orphaned_deleted': 3, 'cleanup_rate': 75.0
+        }
+    
+    def test_finished_scan_report_conditional_get(self, client, db):
+        """Test finished reports answer 304 to matching ETag and Last-Modified validators"""
+        self._create_test_reports(db)
+        db.session.add(ScanReport(report_id='running_report', scan_type='full_scan', status='running',
+                                  start_time=datetime.now(timezone.utc)))
+        db.session.commit()
+        
+        for url in ('/api/scan-reports/test_report_0', '/api/scan-reports/test_report_0/export'):
+            response = client.get(url)
+            etag = response.headers['ETag']
+            last_modified = response.headers['Last-Modified']
+            assert etag.startswith('"test_report_0:')
+            
+            cached = client.get(url, headers={'If-None-Match': etag})
+            assert cached.status_code == 304
+            assert cached.data == b''
+            assert client.get(url, headers={'If-Modified-Since': last_modified}).status_code == 304
+            assert client.get(url, headers={'If-None-Match': '"stale"'}).status_code == 200
+        
+        running = client.get('/api/scan-reports/running_report')
+        assert 'ETag' not in running.headers
+        assert client.get('/api/scan-reports/running_report', headers={'If-None-Match': '*'}).status_code == 200
+    
+    def test_export_scan_report_html_fallback(self, client, db, monkeypatch):
+        """Test the printable HTML report lists the scanned files when reportlab is unavailable"""
+        from datetime import timedelta
+        from pixelprobe.api import reports_routes
+        
+        def missing_reportlab():
+            raise ImportError('No module named reportlab')
+        monkeypatch.setattr(reports_routes, '_pdf_styles', missing_reportlab)
+        
+        self._create_test_reports(db)
+        report = ScanReport.query.filter_by(report_id='test_report_0').first()
+        report.start_time = datetime.now(timezone.utc) - timedelta(hours=1)
+        db.session.commit()
+        
+        db.session.add(ScanResult(file_path='/test/file_<script>&.mp4', file_size=1024, file_type='video/mp4',
+                                  scan_date=report.start_time + timedelta(minutes=1)))
+        db.session.commit()
+        
+        response = client.get('/api/scan-reports/test_report_0/pdf')
+        assert response.status_code == 200
+        html = response.data.decode()
+        assert 'Scanned Files (6 files)' in html
+        assert html.count('/test/file') == 6
+        assert '<script>' not in html
+        assert '/test/file_&lt;script&gt;&amp;.mp4' in html
+    
+    def test_generated_pdf_row_details(self):
+        """Test report rows pick the stream summary line out of multi-line scan output"""
+        from types import SimpleNamespace
+        from pixelprobe.api.reports_routes import _result_details, _result_status
+        
+        result = SimpleNamespace(
+            corruption_details='Broken frames', warning_details=None,
+            scan_output="Input #0, mov\n  Duration: 00:01:00.00, bitrate: 800 kb/s\nVideo stream: h264\n",
+            is_corrupted=True, has_warnings=False, marked_as_good=False
+        )
+        assert _result_details(result) == 'Broken frames Duration: 00:01:00.00, bitrate: 800 kb/s'
+        assert _result_status(result) == 'Corrupted'
+        
+        result.has_warnings = True
+        assert _result_status(result) == 'Warning'
+        result.marked_as_good = True
+        assert _result_status(result) == 'Healthy'
+    
+    def test_report_pdf_cell_wrapping(self):
+        """Test long file paths are split into lines that fit their column"""
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        from pixelprobe.api.reports_routes import _wrap_cell
+        
+        path = '/media/library/' + 'x' * 200 + '/movie <director\'s cut> & extras.mkv'
+        lines = _wrap_cell(path, 100).split('\n')
+        assert len(lines) > 1
+        assert ''.join(lines) == path
+        assert all(stringWidth(line, 'Helvetica', 8) <= 100 for line in lines)
+        assert _wrap_cell('short', 100) == 'short'
+        assert _wrap_cell('', 100) == ''
+    
     def test_download_multiple_reports_as_pdf(self, client, db):
         """Test downloading multiple reports as combined PDF"""
         # Create test data
@@ -286,7 +286,44 @@ class TestMediaChecker:
         # Test that excluded paths are filtered
         assert not checker._is_supported_file('/excluded/file.mp4')
         assert checker._is_supported_file('/included/file.mp4')
-    
+
+    def test_load_exclusions_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that exclusions.json is only re-parsed when its mtime changes"""
+        import json
+        import media_checker
+
+        exclusions_path = tmp_path / 'exclusions.json'
+        exclusions_path.write_text(json.dumps({'paths': ['/excluded'], 'extensions': ['.tmp']}))
+        monkeypatch.setattr(media_checker, 'EXCLUSIONS_FILE', str(exclusions_path))
+        monkeypatch.setattr(media_checker, '_excl_cache', {'mtime': None, 'data': None})
+
+        assert media_checker.load_exclusions() == (['/excluded'], ['.tmp'])
+
+        # Cached copy is served without touching the file again
+        with patch('builtins.open', side_effect=AssertionError('exclusions.json re-read')):
+            paths, extensions = media_checker.load_exclusions()
+        assert paths == ['/excluded']
+
+        # Mutating the returned lists must not leak into the cache
+        paths.append('/mutated')
+        assert media_checker.load_exclusions()[0] == ['/excluded']
+
+        # A newer mtime invalidates the cache
+        exclusions_path.write_text(json.dumps({'paths': ['/other'], 'extensions': []}))
+        stat = os.stat(exclusions_path)
+        os.utime(exclusions_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert media_checker.load_exclusions() == (['/other'], [])
+
+        # A truncated write keeps serving the last good exclusions
+        exclusions_path.write_text('{"paths": ["/par')
+        stat = os.stat(exclusions_path)
+        os.utime(exclusions_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        assert media_checker.load_exclusions() == (['/other'], [])
+
+        # Missing file means no exclusions
+        exclusions_path.unlink()
+        assert media_checker.load_exclusions() == ([], [])
+
     def test_concurrent_scanning_thread_safety(self, test_data_dir):
         """Test that concurrent scanning is thread-safe"""
         checker = PixelProbe()
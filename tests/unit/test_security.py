@@ -0,0 +1,56 @@
+"""
+Unit tests for the queued audit log writer
+"""
+
+import pytest
+
+from pixelprobe.utils import security
+from pixelprobe.utils.security import AuditLogger, flush_audit_log, shutdown_audit_log
+
+class TestAuditLogWriter:
+    """Test audit entries are written off the request path, in order"""
+
+    @pytest.fixture
+    def written(self, monkeypatch):
+        """Capture the entries the writer thread emits"""
+        entries = []
+        monkeypatch.setattr(security, '_write_audit_entries', entries.extend)
+        yield entries
+        shutdown_audit_log()
+
+    def test_flush_writes_entries_in_order(self, written):
+        """Test flush returns once every queued entry is written"""
+        for i in range(1200):
+            AuditLogger.log_action('test_action', {'n': i}, ip_address='127.0.0.1')
+
+        flush_audit_log()
+        assert [entry['details']['n'] for entry in written] == list(range(1200))
+        assert security._audit_queue.unfinished_tasks == 0
+
+    def test_shutdown_writes_pending_entries(self, written, monkeypatch):
+        """Test stopping the writer at exit loses no entry, including a batch already taken"""
+        import threading
+        import time
+
+        # Hold the writer inside its first batch while more entries queue up behind it
+        release = threading.Event()
+        def slow_write(entries):
+            release.wait(5)
+            written.extend(entries)
+        monkeypatch.setattr(security, '_write_audit_entries', slow_write)
+
+        AuditLogger.log_action('test_action', {'n': 0}, ip_address='127.0.0.1')
+        while security._audit_queue.qsize():
+            time.sleep(0.001)
+        for i in range(1, 50):
+            AuditLogger.log_action('test_action', {'n': i}, ip_address='127.0.0.1')
+
+        threading.Timer(0.05, release.set).start()
+        shutdown_audit_log()
+        assert [entry['details']['n'] for entry in written] == list(range(50))
+        assert security._audit_thread is None
+
+        # Logging after a shutdown starts a new writer
+        AuditLogger.log_action('test_action', {'n': 50}, ip_address='127.0.0.1')
+        flush_audit_log()
+        assert written[-1]['details']['n'] == 50